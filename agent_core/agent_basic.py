@@ -3,6 +3,7 @@ from typing import Optional
 from agent_core.models.base_model import BaseModel
 from agent_core.models.model_registry import ModelRegistry
 import os
+from agent_core.config import load_dotenv_once
 from agent_core.utils.logger import get_logger
 
 
@@ -18,6 +19,7 @@ class AgentBasic(ABC):
         self._model: Optional[BaseModel] = None
         self._model_name: Optional[str] = None
         self.logger = get_logger(self.__class__.__name__, log_level)
+        load_dotenv_once()
         self.model_name = model_name if model_name else os.getenv("DEFAULT_MODEL")
 
     @property
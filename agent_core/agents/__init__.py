@@ -1,3 +1,18 @@
-from .agent import Agent
+import importlib
 
-__all__ = ['Agent']
\ No newline at end of file
+# PEP 562: submodules (and the model stack behind them) are imported on first attribute access
+_LAZY = {"Agent": ".agent"}
+
+__all__ = ['Agent']
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,14 +1,35 @@
 # agents/agent.py
 
-from typing import Optional, List
+import asyncio
+import contextvars
+import copy
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, Iterator, Optional, List
 
-from langchain_core.tools import BaseTool
 from agent_core.agent_basic import AgentBasic
 from agent_core.entities.steps import Steps, Step
+from agent_core.entities.task_outcome import TaskOutcome
 from agent_core.planners.base_planner import BasePlanner
 from agent_core.utils.context_manager import ContextManager
+from agent_core.utils.context_window import ContextRole
 from agent_core.evaluators.evaluators import get_evaluator
-from agent_core.evaluators import BaseEvaluator
+from agent_core.evaluators import BaseEvaluator, EvaluationPolicy
+from agent_core.utils.budget import RunBudget, activate_budget
+from agent_core.utils.events import (
+    EventStream,
+    EventType,
+    ExecutionEvent,
+    RunCancelled,
+    activate_stream,
+    emit_event,
+)
+from agent_core.utils.logger import capped
+from agent_core.utils.tracer import get_tracer
+
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
 
 
 class Agent(AgentBasic):
@@ -68,7 +89,7 @@ Response:
         self._execution_history: Steps = Steps()
 
         self.planner = None
-        self.tools: Optional[List[BaseTool]] = None
+        self.tools: Optional[List["BaseTool"]] = None
 
         # Default knowledge / background
         self.knowledge = ""  # Used to guide how we make plans
@@ -82,10 +103,15 @@ Response:
         self.summary_prompt = self.DEFAULT_SUMMARY_PROMPT
         self.response_prompt=self.DEFAULT_FINAL_RESPONSE_PROMPT
 
+        # Optional run-level limits (deadline, tokens, LLM calls) applied to every execute()
+        self.budget: Optional[RunBudget] = None
+
         # NEW: evaluator management
         self.evaluators_enabled = False
         self.evaluators = {}
         self._load_default_evaluators()
+        # Optional policy sampling evaluations of historically reliable categories
+        self.evaluation_policy: Optional[EvaluationPolicy] = None
 
         self.logger.info("Agent instance created.")
 
@@ -93,45 +119,151 @@ Response:
         """
         1) If no planner, do direct single-step with the model (use background).
         2) If planner, plan(...) -> then call execute_plan(...).
+        Runs on the caller's thread; see stream() for the events emitted along the way.
         """
-        self.logger.info(f"Agent is executing task: {task}")
-
-        # Case 1: No planner => direct single-step
-        if not self.planner:
-            return self.execute_without_planner(task)
+        # Nobody consumes the events, so they are dropped; running inline keeps thread-bound
+        # tools and clients on the caller's thread, and an interrupt stops the run itself
+        with activate_stream(EventStream(lambda event: None)):
+            return self._run(task)
 
-        # Case 2: Using a planner => first create steps/graph
-        current_categories = list(self.evaluators.keys())
-        plan = self.planner.plan(
-            task=task,
-            tools=self.tools,
-            knowledge=self.knowledge,
-            background=self.background,
-            categories=current_categories,
+    def stream(self, task: str) -> Iterator[ExecutionEvent]:
+        """
+        Execute the task in a background thread and yield ExecutionEvents as they happen,
+        ending with RUN_FINISHED (status "completed", "cancelled" or "error").
+        Closing the generator early cancels the run at its next event boundary.
+        """
+        events = queue.Queue()
+        event_stream = EventStream(events.put)
+        self._start_run(task, event_stream)
+        try:
+            while True:
+                event = events.get()
+                yield event
+                if event.type == EventType.RUN_FINISHED:
+                    break
+        finally:
+            event_stream.cancel()
+
+    async def astream(self, task: str) -> AsyncIterator[ExecutionEvent]:
+        """Async iterator version of stream()."""
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+        event_stream = EventStream(
+            lambda event: loop.call_soon_threadsafe(events.put_nowait, event)
         )
+        self._start_run(task, event_stream)
+        try:
+            while True:
+                event = await events.get()
+                yield event
+                if event.type == EventType.RUN_FINISHED:
+                    break
+        finally:
+            event_stream.cancel()
+
+    def _start_run(self, task: str, event_stream: EventStream):
+        def run():
+            with activate_stream(event_stream):
+                # RUN_FINISHED is always emitted, or the consumer would wait for it forever
+                finished = {"status": "error", "error": RuntimeError("The run ended unexpectedly.")}
+                try:
+                    finished = {"status": "completed", "result": self._run(task)}
+                except RunCancelled:
+                    self.logger.warning("Run cancelled by the event stream consumer.")
+                    finished = {"status": "cancelled"}
+                except BaseException as e:
+                    # Includes SystemExit or KeyboardInterrupt raised by a tool; execute() re-raises it
+                    finished = {"status": "error", "error": e}
+                finally:
+                    event_stream.finish(**finished)
+
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(run,), name="agent-run", daemon=True).start()
+
+    def _run(self, task: str):
+        self.logger.info("Agent is executing task: %s", capped(task))
+
+        with get_tracer().span(
+            "agent.execute",
+            model=self.model_name,
+            planner=self.planner.__class__.__name__ if self.planner else "",
+        ), activate_budget(self.budget):
+            # Case 1: No planner => direct single-step
+            if not self.planner:
+                return self.execute_without_planner(task)
+
+            # Case 2: Using a planner => first create steps/graph
+            current_categories = list(self.evaluators.keys())
+            plan = self.planner.plan(
+                task=task,
+                tools=self.tools,
+                knowledge=self.knowledge,
+                background=self.background,
+                categories=current_categories,
+            )
+            emit_event(EventType.PLAN_CREATED, task=task, plan=plan.to_dict())
+
+            # Now just call planner's execute_plan(...) in a unified way
+            self.planner.execute_plan(
+                task=task,
+                plan=plan,
+                execution_history=self._execution_history,
+                context_manager=self.context,
+                background=self.background,
+                evaluators_enabled=self.evaluators_enabled,
+                evaluators=self.evaluators,
+                evaluation_policy=self.evaluation_policy,
+            )
 
-        # Now just call planner's execute_plan(...) in a unified way
-        self.planner.execute_plan(
-            task=task,
-            plan=plan,
-            execution_history=self._execution_history,
-            context_manager=self.context,
-            background=self.background,
-            evaluators_enabled=self.evaluators_enabled,
-            evaluators=self.evaluators,
-        )
-    
-        return self.get_final_response(task)
+            return self.get_final_response(task)
+
+    def execute_many(self, tasks: Iterable[str], concurrency: int = 4) -> Iterator[TaskOutcome]:
+        """
+        Execute many tasks on a thread pool, yielding a TaskOutcome as each task completes.
+        Every task runs on an isolated copy of this agent (own execution history, context and
+        planner state), while model clients, tools, evaluators and planner caches are shared.
+        Errors of a task are captured in its outcome instead of raised.
+        """
+        tasks = list(tasks)
+        pool = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="agent-worker")
+        try:
+            futures = [
+                pool.submit(self._execute_isolated, index, task)
+                for index, task in enumerate(tasks)
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _execute_isolated(self, index: int, task: str) -> TaskOutcome:
+        worker = self._spawn()
+        try:
+            # Run on this pool thread; execute() would start another thread to stream events
+            result = worker._run(task)
+        except Exception as e:
+            self.logger.error(f"Task {index} failed: {e}")
+            return TaskOutcome(index, task, error=e, execution_history=worker.execution_history)
+        return TaskOutcome(index, task, result=result, execution_history=worker.execution_history)
+
+    def _spawn(self) -> "Agent":
+        """A copy of this agent with fresh per-run state."""
+        worker = copy.copy(self)
+        worker._execution_history = Steps()
+        worker.context = self.context.spawn()
+        worker.evaluators = dict(self.evaluators)
+        worker.planner = self.planner.spawn() if self.planner else None
+        return worker
 
     def execute_without_planner(self, task: str):
-        context_section = self.context.context_to_str()
+        context_section = self.context.render_for(ContextRole.EXECUTE)
         final_prompt = self.execute_prompt.format(
             context_section=context_section,
             background=self.background,
             task=task,
         )
         response = self._model.process(final_prompt)
-        self.logger.info(f"Response: {response}")
+        self.logger.info("Response: %s", capped(response))
         self._execution_history.add_step(
             Step(
                 name="Direct Task Execution",
@@ -145,7 +277,8 @@ Response:
         history_text = self._execution_history.execution_history_to_str()
         final_response_prompt=self.response_prompt.format(task=task,history_text=history_text)
         self.logger.info("Generating final response.")
-        final_response = self._model.process(final_response_prompt)
+        with get_tracer().span("agent.final_response", model=self.model_name):
+            final_response = self._model.process(final_response_prompt)
         return str(final_response)
 
     def get_execution_result_summary(self) -> str:
@@ -1,3 +1,30 @@
-from .environment import Environment
+import functools
 
-__all__ = ['Environment']
\ No newline at end of file
+
+@functools.lru_cache(maxsize=None)
+def load_dotenv_once():
+    """Load the .env file into the environment, once, on first use rather than at import."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=None)
+def get_environment():
+    """The validated Environment, created on first use; raises if the configuration is invalid."""
+    from .environment import Environment
+
+    load_dotenv_once()
+    return Environment()
+
+
+def __getattr__(name):
+    # PEP 562: pydantic-settings is only imported when Environment is used
+    if name == "Environment":
+        from .environment import Environment
+
+        return Environment
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['Environment', 'get_environment', 'load_dotenv_once']
@@ -1,11 +1,8 @@
 from typing import Annotated
 
-from dotenv import load_dotenv
 from pydantic import HttpUrl, AfterValidator, Field
 from pydantic_settings import BaseSettings
 
-load_dotenv()
-
 
 def http_url(value: str) -> str:
     HttpUrl(value)
@@ -1,19 +1,18 @@
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 
 
+@dataclass(slots=True, repr=False)
 class Step:
 
-    def __init__(self, name: str, description: str,
-                 result: Optional[str] = None,
-                 use_tool: Optional[bool] = None,
-                 tool_name: Optional[str] = None,
-                 category: Optional[str] = "default"):
-        self.name = name
-        self.description = description
-        self.result = result
-        self.use_tool = use_tool
-        self.tool_name = tool_name
-        self.category = category
+    name: str
+    description: str
+    result: Optional[str] = None
+    use_tool: Optional[bool] = None
+    tool_name: Optional[str] = None
+    category: Optional[str] = "default"
+    # Names of earlier steps whose results this step needs; None means the previous step
+    depends_on: Optional[List[str]] = None
 
     def __repr__(self):
         return (
@@ -29,31 +28,42 @@ class Step:
             "use_tool": self.use_tool,
             "tool_name": self.tool_name,
             "category": self.category,
+            "depends_on": self.depends_on,
         }
 
 
+def step_to_str(idx: int, step: Step) -> str:
+    return (
+        f"Step {idx}: {step.name}\n"
+        f"Description: {step.description}\n"
+        f"Result: {step.result}\n"
+    )
+
+
 class Steps:
 
     steps: List[Step]
 
     def __init__(self):
         self.steps = []
+        # Rendered lines as (step, result, line), reused while the step and its result are unchanged
+        self._lines: List[Tuple[Step, Optional[str], str]] = []
 
     def __str__(self):
         return self.execution_history_to_str()
 
     # Build a textual representation of the execution history
     def execution_history_to_str(self):
-        history_lines = []
-        for idx, step in enumerate(self.steps, 1):
-            line = (
-                f"Step {idx}: {step.name}\n"
-                f"Description: {step.description}\n"
-                f"Result: {step.result}\n"
-            )
-            history_lines.append(line)
-        history_text = "\n".join(history_lines)
-        return history_text
+        lines = self._lines
+        for idx, step in enumerate(self.steps):
+            if idx < len(lines):
+                cached_step, cached_result, _ = lines[idx]
+                if cached_step is step and cached_result is step.result:
+                    continue
+                del lines[idx:]
+            lines.append((step, step.result, step_to_str(idx + 1, step)))
+        del lines[len(self.steps):]
+        return "\n".join(line for _, _, line in lines)
 
     def execution_history_to_responses(self):
         response_lines = []
@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from agent_core.entities.steps import Steps
+
+
+@dataclass
+class TaskOutcome:
+    """
+    Result of one task of Agent.execute_many(). Errors are captured here instead of raised.
+    """
+
+    index: int
+    task: str
+    result: Optional[str] = None
+    error: Optional[BaseException] = None
+    execution_history: Steps = field(default_factory=Steps)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
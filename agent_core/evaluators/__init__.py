@@ -1,5 +1,32 @@
-from .generic_evaluator import GenericEvaluator
-from .coding_evaluator import CodingEvaluator
-from .base_evaluator import BaseEvaluator
+import importlib
 
-__all__ = ["BaseEvaluator", "GenericEvaluator", "CodingEvaluator"]
+# PEP 562: submodules (and the model stack behind them) are imported on first attribute access
+_LAZY = {
+    "BaseEvaluator": ".base_evaluator",
+    "GenericEvaluator": ".generic_evaluator",
+    "CodingEvaluator": ".coding_evaluator",
+    "EvaluationPolicy": ".evaluation_policy",
+    "EvaluationCache": ".evaluation_cache",
+    "EnsembleEvaluator": ".ensemble_evaluator",
+}
+
+__all__ = [
+    "BaseEvaluator",
+    "GenericEvaluator",
+    "CodingEvaluator",
+    "EvaluationPolicy",
+    "EvaluationCache",
+    "EnsembleEvaluator",
+]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
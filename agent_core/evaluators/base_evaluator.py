@@ -1,11 +1,52 @@
 # evaluators/base_evaluator.py
 
+import functools
 from abc import abstractmethod
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from agent_core.agent_basic import AgentBasic
 from agent_core.evaluators.entities.evaluator_result import EvaluatorResult
+from agent_core.evaluators.pre_evaluators import PreEvaluatorChain
 from agent_core.utils.context_manager import ContextManager
+from agent_core.utils.context_window import ContextRole
+from agent_core.utils.logger import capped
+from agent_core.utils.tracer import get_tracer
+
+
+def _instrument_evaluate(evaluate):
+    """
+    Wrap an evaluator's evaluate() so every evaluation is traced, screened by the local
+    pre-evaluators and, when the evaluator has a cache, answered from it, whichever evaluator
+    implements it.
+    """
+
+    @functools.wraps(evaluate)
+    def wrapper(self, root_task, request, response, background, context_manager, *args, **kwargs):
+        with get_tracer().span(
+            "evaluator.evaluate", evaluator=self.__class__.__name__, model=self.model_name
+        ) as span:
+            key = None
+            if not args and not kwargs:
+                result, key = self._local_result(
+                    root_task, request, response, background, context_manager
+                )
+                if result is not None:
+                    span.set_attributes(
+                        decision=result.decision, score=result.score,
+                        pre_evaluation=result.details.get("pre_evaluation", ""),
+                        cache_hit="pre_evaluation" not in result.details,
+                    )
+                    return result
+            result = evaluate(
+                self, root_task, request, response, background, context_manager, *args, **kwargs
+            )
+            if key is not None:
+                self.cache.put(key, result)
+            span.set_attributes(decision=result.decision, score=result.score)
+            return result
+
+    wrapper.__instrumented__ = True
+    return wrapper
 
 
 class BaseEvaluator(AgentBasic):
@@ -13,6 +54,9 @@ class BaseEvaluator(AgentBasic):
     A base class for all evaluator. Every evaluator must implement `evaluator()`.
     """
 
+    # Full score of the rubric (8 criteria scored 1-5); planners normalize scores by it
+    max_score = 40
+
     def __init__(self, model_name: Optional[str] = None, log_level: Optional[str] = None,
                  evaluation_threshold: Optional[float] = 0.8, max_attempt: Optional[int] = 3):
         """
@@ -24,6 +68,67 @@ class BaseEvaluator(AgentBasic):
         self.evaluation_threshold = evaluation_threshold
         self.prompt = self.default_prompt()
         self.max_attempt = max_attempt
+        # Optional EvaluationCache answering repeated identical evaluations
+        self.cache = None
+        # Local checks failing guaranteed failures without an LLM call (None disables them)
+        self.pre_evaluators = PreEvaluatorChain()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        evaluate = cls.__dict__.get("evaluate")
+        if (
+            evaluate is not None
+            and not getattr(evaluate, "__isabstractmethod__", False)
+            and not getattr(evaluate, "__instrumented__", False)
+        ):
+            cls.evaluate = _instrument_evaluate(evaluate)
+
+    def pre_evaluate(self, request: str, response: str) -> Optional[EvaluatorResult]:
+        """
+        The failing result of the local pre-evaluator checks, or None when they pass. They cost
+        no LLM call, so planners also run them when the evaluation itself is skipped.
+        """
+        if self.pre_evaluators is None:
+            return None
+        result = self.pre_evaluators.run(request, response)
+        if result is not None:
+            self.logger.info(
+                "Pre-evaluation '%s' failed: %s",
+                result.details["pre_evaluation"], capped(result.details["reason"]),
+            )
+        return result
+
+    def _local_result(self, root_task, request, response, background, context_manager):
+        """
+        Answer an evaluation without the model when possible. Returns (result, cache_key):
+        a pre-evaluation failure or cached result (None otherwise), and the key under which a
+        fresh result should be cached (None without a cache or when answered locally).
+        """
+        result = self.pre_evaluate(request, response)
+        if result is not None:
+            return result, None
+        if self.cache is None:
+            return None, None
+        context = context_manager.render_for(ContextRole.EVALUATE) if context_manager else ""
+        key = self.cache.key(self, root_task, request, response, background, context)
+        result = self.cache.get(key)
+        return (result, None) if result is not None else (None, key)
+
+    def evaluate_batch(
+        self,
+        root_task: str,
+        items: List[Tuple[str, str]],
+        background: str,
+        context_manager: Optional[ContextManager],
+    ) -> List[EvaluatorResult]:
+        """
+        Evaluate several (request, response) items of the same task, returning one result per item
+        in order. Evaluators with a batch prompt override this; by default items are evaluated one by one.
+        """
+        return [
+            self.evaluate(root_task, request, response, background, context_manager)
+            for request, response in items
+        ]
 
     @abstractmethod
     def default_prompt(self):
@@ -35,4 +140,3 @@ class BaseEvaluator(AgentBasic):
         Perform evaluator on the given request and response.
         """
         pass
-
@@ -0,0 +1,282 @@
+# evaluators/code_analysis.py
+#
+# Local static analysis of the code in a response. Only uses the standard library so that it
+# can also run as a script in an isolated interpreter (see analyse_code(sandbox=True)).
+
+import ast
+import json
+import re
+import subprocess
+import sys
+import textwrap
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional
+
+_CODE_BLOCK = re.compile(r"```[ \t]*([\w+#.-]*)[^\n]*\n(.*?)```", re.DOTALL)
+PYTHON_LANGUAGES = {"python", "python3", "py"}
+
+# Nodes adding a decision point to a function (McCabe complexity)
+_BRANCHES = (
+    ast.If, ast.IfExp, ast.For, ast.AsyncFor, ast.While, ast.ExceptHandler,
+    ast.Assert, ast.comprehension, ast.match_case,
+)
+_SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+@dataclass(slots=True)
+class CodeBlock:
+    language: str
+    code: str
+
+
+@dataclass(slots=True)
+class Finding:
+    """One problem found in a code block. 'severity' is "error" (the code cannot run) or "warning"."""
+
+    kind: str
+    message: str
+    line: Optional[int] = None
+    block: int = 0
+    severity: str = "warning"
+
+    def __str__(self):
+        where = f"block {self.block + 1}" + (f", line {self.line}" if self.line else "")
+        return f"[{self.kind}] {where}: {self.message}"
+
+
+@dataclass
+class CodeAnalysis:
+    blocks: int = 0
+    languages: List[str] = field(default_factory=list)
+    findings: List[Finding] = field(default_factory=list)
+    timed_out: bool = False
+
+    @property
+    def errors(self) -> List[Finding]:
+        return [f for f in self.findings if f.severity == "error"]
+
+    @property
+    def warnings(self) -> List[Finding]:
+        return [f for f in self.findings if f.severity != "error"]
+
+    @property
+    def has_errors(self) -> bool:
+        return any(f.severity == "error" for f in self.findings)
+
+    def summary(self) -> str:
+        """Findings as text for the reviewer prompt."""
+        if not self.blocks:
+            return "No code blocks were found in the response."
+        analysed = ", ".join(self.languages) or "unknown"
+        if not self.findings:
+            return f"{self.blocks} code block(s) ({analysed}); no syntax, lint or complexity issues found."
+        lines = [f"{self.blocks} code block(s) ({analysed}):"]
+        lines.extend(f"- {finding}" for finding in self.findings)
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            "blocks": self.blocks,
+            "languages": list(self.languages),
+            "findings": [asdict(f) for f in self.findings],
+            "timed_out": self.timed_out,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CodeAnalysis":
+        return cls(
+            data.get("blocks", 0),
+            list(data.get("languages", [])),
+            [Finding(**f) for f in data.get("findings", [])],
+            data.get("timed_out", False),
+        )
+
+
+def extract_code_blocks(text: str) -> List[CodeBlock]:
+    """
+    Fenced code blocks of a response. Without fences, the whole response is taken as one
+    Python block when it parses and contains a definition or import.
+    """
+    text = str(text)
+    blocks = [
+        CodeBlock(match.group(1).lower(), match.group(2))
+        for match in _CODE_BLOCK.finditer(text)
+    ]
+    if blocks or not re.search(r"^\s*(def|class|import|from|async def)\s", text, re.MULTILINE):
+        return blocks
+    try:
+        ast.parse(text)
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        return []
+    return [CodeBlock("python", text)]
+
+
+class _Linter(ast.NodeVisitor):
+    def __init__(self, block: int):
+        self.block = block
+        self.findings: List[Finding] = []
+        self.imports = {}
+        self.used = set()
+
+    def _warn(self, node, message):
+        self.findings.append(Finding("lint", message, getattr(node, "lineno", None), self.block))
+
+    def visit_Import(self, node):
+        for alias in node.names:
+            name = alias.asname or alias.name.split(".")[0]
+            self.imports.setdefault(name, node.lineno)
+
+    def visit_ImportFrom(self, node):
+        if node.module == "__future__":
+            return
+        for alias in node.names:
+            if alias.name == "*":
+                self._warn(node, f"Wildcard import from '{node.module}'.")
+            else:
+                self.imports.setdefault(alias.asname or alias.name, node.lineno)
+
+    def visit_Name(self, node):
+        self.used.add(node.id)
+
+    def visit_Constant(self, node):
+        # Names exported through __all__ or referenced in string annotations
+        if isinstance(node.value, str) and node.value.isidentifier():
+            self.used.add(node.value)
+
+    def visit_ExceptHandler(self, node):
+        if node.type is None:
+            self._warn(node, "Bare 'except:' also catches KeyboardInterrupt and SystemExit.")
+        self.generic_visit(node)
+
+    def _check_defaults(self, node):
+        for default in node.args.defaults + [d for d in node.args.kw_defaults if d is not None]:
+            if isinstance(default, (ast.List, ast.Dict, ast.Set)):
+                self._warn(default, f"Mutable default argument in '{node.name}'.")
+        self.generic_visit(node)
+
+    visit_FunctionDef = _check_defaults
+    visit_AsyncFunctionDef = _check_defaults
+
+    def visit_Compare(self, node):
+        for op, right in zip(node.ops, node.comparators):
+            if isinstance(op, (ast.Eq, ast.NotEq)) and isinstance(right, ast.Constant) and right.value is None:
+                self._warn(node, "Comparison to None with '=='/'!='; use 'is'/'is not'.")
+        self.generic_visit(node)
+
+    def unused_imports(self) -> List[Finding]:
+        return [
+            Finding("lint", f"'{name}' is imported but unused.", line, self.block)
+            for name, line in self.imports.items()
+            if name not in self.used
+        ]
+
+
+def _complexity(function) -> int:
+    """Cyclomatic complexity of a function, excluding nested functions and classes."""
+    complexity = 1
+    stack = list(ast.iter_child_nodes(function))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _SCOPES):
+            continue
+        if isinstance(node, _BRANCHES):
+            complexity += 1
+        elif isinstance(node, ast.BoolOp):
+            complexity += len(node.values) - 1
+        stack.extend(ast.iter_child_nodes(node))
+    return complexity
+
+
+def analyse_python(code: str, block: int = 0, max_complexity: int = 10) -> List[Finding]:
+    """
+    Findings of a Python block. Only code which does not parse (after dedenting, so indented
+    fragments such as methods are accepted) is an error.
+    """
+    code = textwrap.dedent(code)
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return [Finding("syntax", f"SyntaxError: {e.msg}", e.lineno, block, "error")]
+    except (ValueError, RecursionError, MemoryError) as e:
+        return [Finding("syntax", f"The code cannot be parsed: {e or type(e).__name__}", None, block, "error")]
+
+    findings = []
+    try:
+        # compile() also reports context errors, e.g. 'return' or 'await' outside a function,
+        # which are expected in fragments
+        compile(tree, f"<block {block + 1}>", "exec")
+    except SyntaxError as e:
+        findings.append(Finding("compile", f"{e.msg} (fine if this is a fragment)", e.lineno, block))
+    except (ValueError, RecursionError, MemoryError):
+        pass
+
+    linter = _Linter(block)
+    linter.visit(tree)
+    findings += linter.findings + linter.unused_imports()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            complexity = _complexity(node)
+            if complexity > max_complexity:
+                findings.append(Finding(
+                    "complexity",
+                    f"'{node.name}' has cyclomatic complexity {complexity} (limit {max_complexity}).",
+                    node.lineno,
+                    block,
+                ))
+    return sorted(findings, key=lambda f: f.line or 0)
+
+
+def _analyse(text: str, max_complexity: int) -> CodeAnalysis:
+    blocks = extract_code_blocks(text)
+    analysis = CodeAnalysis(blocks=len(blocks))
+    for index, block in enumerate(blocks):
+        if block.language not in PYTHON_LANGUAGES and block.language:
+            analysis.languages.append(block.language)
+            continue
+        findings = analyse_python(block.code, index, max_complexity)
+        if not block.language and any(f.severity == "error" for f in findings):
+            # An unlabelled block which is not Python (e.g. shell output) is not an error
+            analysis.languages.append("text")
+            continue
+        analysis.languages.append("python")
+        analysis.findings.extend(findings)
+    return analysis
+
+
+def analyse_code(
+    text: str,
+    max_complexity: int = 10,
+    sandbox: bool = False,
+    timeout: float = 5.0,
+) -> CodeAnalysis:
+    """
+    Analyse the code blocks of a response. With 'sandbox', the analysis runs in an isolated
+    interpreter (python -I) killed after 'timeout' seconds, protecting the agent from inputs
+    that exhaust the parser. The code itself is never executed.
+    """
+    if not sandbox:
+        return _analyse(text, max_complexity)
+    payload = json.dumps({"text": str(text), "max_complexity": max_complexity})
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-I", __file__],
+            input=payload,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip().splitlines()[-1:] or completed.returncode)
+        return CodeAnalysis.from_dict(json.loads(completed.stdout))
+    except subprocess.TimeoutExpired:
+        return CodeAnalysis(
+            findings=[Finding("timeout", f"Static analysis did not finish within {timeout}s.")],
+            timed_out=True,
+        )
+    except (OSError, ValueError, RuntimeError) as e:
+        return CodeAnalysis(findings=[Finding("sandbox", f"Static analysis failed: {e}")])
+
+
+if __name__ == "__main__":
+    request = json.load(sys.stdin)
+    json.dump(_analyse(request["text"], request["max_complexity"]).to_dict(), sys.stdout)
@@ -3,7 +3,10 @@
 import json
 from typing import Optional, List
 from .base_evaluator import BaseEvaluator
+from .code_analysis import CodeAnalysis, analyse_code
 from .entities.evaluator_result import EvaluatorResult
+from ..utils.context_window import ContextRole
+from ..utils.logger import capped
 
 
 def generate_improvement_suggestions(scores: List[tuple]) -> str:
@@ -67,6 +70,9 @@ At the end, return a JSON object with the following fields, ensuring it is a val
 
 Ensure the output is only the JSON string, with no additional characters, headers, or formatting.
 
+**Static analysis:**
+{static_analysis}
+
 **Context**
 {context}
 
@@ -89,13 +95,56 @@ Ensure the output is only the JSON string, with no additional characters, header
         evaluation_threshold: Optional[float] = 0.8,
     ):
         super().__init__(model_name, log_level, evaluation_threshold)
+        # Local static analysis before the model review; code which does not compile is rejected without it
+        self.static_analysis = True
+        self.max_complexity = 10
+        # Run the analysis in an isolated interpreter, killed after 'analysis_timeout' seconds
+        self.sandbox_analysis = False
+        self.analysis_timeout = 5.0
+
+    def analyse(self, response) -> CodeAnalysis:
+        return analyse_code(
+            response,
+            max_complexity=self.max_complexity,
+            sandbox=self.sandbox_analysis,
+            timeout=self.analysis_timeout,
+        )
+
+    @staticmethod
+    def _static_analysis_section(analysis: Optional[CodeAnalysis]) -> str:
+        if analysis is None:
+            return "Not run."
+        return (
+            "The code was already parsed, linted and checked for complexity locally; do not re-check its syntax. "
+            "Take these findings into account for Correctness, Code Style and Maintainability:\n"
+            f"{analysis.summary()}"
+        )
 
     def evaluate(self, root_task, request, response, background, context_manager) -> EvaluatorResult:
         """
         Evaluate the provided request and generated code response.
         """
+        analysis = self.analyse(response) if self.static_analysis else None
+        if analysis is not None and analysis.has_errors:
+            errors = "\n".join(f"- {error}" for error in analysis.errors)
+            self.logger.info("Rejected code without model review, static analysis found:\n%s", capped(errors))
+            return EvaluatorResult(
+                "Reject Code",
+                0,
+                {
+                    "pre_evaluation": "static_analysis",
+                    "reason": errors,
+                    "score_breakdown": [],
+                    "raw_evaluation": "",
+                    "static_analysis": analysis.to_dict(),
+                    "improvement_suggestions": f"Fix the errors found by static analysis:\n{errors}",
+                },
+            )
+
+        context = context_manager.render_for(ContextRole.EVALUATE) if context_manager else ""
         prompt_text = self.prompt.format(root_task=root_task,
-            request=request, response=response, background=background, context=context_manager.context_to_str()
+            request=request, response=response, background=background, context=context,
+            static_analysis=self._static_analysis_section(analysis),
         )
 
         try:
@@ -120,10 +169,15 @@ Ensure the output is only the JSON string, with no additional characters, header
             "score_breakdown": scores,
             "raw_evaluation": evaluation_response,
             "total_applicable_score": total_score,
+            "static_analysis": analysis.to_dict() if analysis is not None else None,
         }
 
         if decision == "Reject Code":
             improvement_suggestions = generate_improvement_suggestions(scores)
+            if analysis is not None and analysis.findings:
+                improvement_suggestions += "\nStatic analysis findings:\n" + "\n".join(
+                    f"- {finding}" for finding in analysis.findings
+                )
             details["improvement_suggestions"] = improvement_suggestions
         else:
             details["improvement_suggestions"] = ""
@@ -0,0 +1,147 @@
+# evaluators/ensemble_evaluator.py
+
+import contextvars
+import statistics
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, Optional, Sequence, Type
+
+from .base_evaluator import BaseEvaluator
+from .entities.evaluator_result import EvaluatorResult
+
+
+class EnsembleEvaluator(BaseEvaluator):
+    """
+    Runs K judges (evaluators with the same rubric, on the same or different models) in parallel
+    and combines their normalized scores.
+
+    The first 'quorum' judges run in parallel; further judges are only called while the outcome
+    is still open. Evaluation stops early, skipping the remaining judges, once it is settled:
+    - even if every remaining judge gave 0 (or the full score), the mean would stay above
+      (or below) the threshold, or
+    - 'quorum' judges finished and all of them are at least 'margin' on the same side of it.
+
+    The score is the mean of the finished judges on the max_score scale; details hold each
+    judge's normalized score, the mean and the variance.
+    """
+
+    ACCEPT = "Accept Output"
+    RERUN = "Rerun Subtask"
+
+    def __init__(
+        self,
+        judges: Sequence[BaseEvaluator],
+        model_name: Optional[str] = None,
+        log_level: Optional[str] = None,
+        evaluation_threshold: Optional[float] = None,
+        quorum: Optional[int] = None,
+        margin: float = 0.05,
+    ):
+        if not judges:
+            raise ValueError("EnsembleEvaluator needs at least one judge.")
+        self.judges = list(judges)
+        if evaluation_threshold is None:
+            evaluation_threshold = self.judges[0].evaluation_threshold
+        super().__init__(model_name or self.judges[0].model_name, log_level, evaluation_threshold)
+        quorum = quorum if quorum is not None else len(self.judges) // 2 + 1
+        self.quorum = min(max(quorum, 1), len(self.judges))
+        self.margin = margin
+        # At most 'quorum' judges run at once, so judges left once the outcome settles are never called
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.quorum, thread_name_prefix="ensemble-judge"
+        )
+
+    @classmethod
+    def from_models(
+        cls,
+        evaluator_class: Type[BaseEvaluator],
+        model_names: Sequence[str],
+        k: Optional[int] = None,
+        **kwargs,
+    ) -> "EnsembleEvaluator":
+        """K judges of one evaluator class, cycling through the given models."""
+        k = k or len(model_names)
+        judges = [evaluator_class(model_names[i % len(model_names)]) for i in range(k)]
+        return cls(judges, **kwargs)
+
+    def default_prompt(self):
+        return self.judges[0].prompt
+
+    def _settled(self, fractions: List[float]) -> Optional[str]:
+        """The reason the outcome cannot change any more, or None."""
+        k = len(self.judges)
+        remaining = k - len(fractions)
+        total = sum(fractions)
+        if total / k > self.evaluation_threshold:
+            return "accepted whatever the remaining judges score"
+        if (total + remaining) / k <= self.evaluation_threshold:
+            return "rejected whatever the remaining judges score"
+        if remaining and len(fractions) >= self.quorum:
+            if all(f >= self.evaluation_threshold + self.margin for f in fractions):
+                return "quorum above threshold"
+            if all(f <= self.evaluation_threshold - self.margin for f in fractions):
+                return "quorum below threshold"
+        return None
+
+    def evaluate(self, root_task, request, response, background, context_manager) -> EvaluatorResult:
+        waiting = list(enumerate(self.judges))
+        running = {}
+
+        def start_next():
+            index, judge = waiting.pop(0)
+            future = self._executor.submit(
+                contextvars.copy_context().run,
+                judge.evaluate,
+                root_task, request, response, background, context_manager,
+            )
+            running[future] = index
+
+        # The quorum judges run first; the others only start while the outcome is still open
+        while waiting and len(running) < self.quorum:
+            start_next()
+
+        judgements = []
+        stop_reason = None
+        while running and stop_reason is None:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                judge = self.judges[index]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.logger.warning(f"Judge {index} ({judge.model_name}) failed: {e}")
+                    continue
+                fraction = min(max(float(result.score) / judge.max_score, 0.0), 1.0)
+                judgements.append(
+                    {"judge": index, "model": judge.model_name, "score": fraction,
+                     "decision": result.decision}
+                )
+            stop_reason = self._settled([j["score"] for j in judgements])
+            while stop_reason is None and waiting and len(running) < self.quorum:
+                start_next()
+
+        skipped = len(waiting)
+        if stop_reason:
+            self.logger.info(
+                f"Ensemble stopped after {len(judgements)} of {len(self.judges)} judges, "
+                f"{skipped} never called: {stop_reason}."
+            )
+
+        fractions = [j["score"] for j in judgements]
+        mean = statistics.fmean(fractions) if fractions else 0.0
+        variance = statistics.pvariance(fractions) if len(fractions) > 1 else 0.0
+        decision = self.ACCEPT if fractions and mean > self.evaluation_threshold else self.RERUN
+        details = {
+            "judges": judgements,
+            "mean": mean,
+            "variance": variance,
+            "completed": len(judgements),
+            # Judges which were called (including any still running when the outcome settled)
+            "ran": len(self.judges) - skipped,
+            "skipped": skipped,
+            "stop_reason": stop_reason or "",
+        }
+        return EvaluatorResult(decision, mean * self.max_score, details)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
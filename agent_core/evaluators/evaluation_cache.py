@@ -0,0 +1,104 @@
+# evaluators/evaluation_cache.py
+
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from agent_core.evaluators.entities.evaluator_result import EvaluatorResult
+
+
+def _digest(text) -> str:
+    return hashlib.sha256(str(text).encode("utf-8")).hexdigest()
+
+
+class EvaluationCache:
+    """
+    Caches EvaluatorResults of identical evaluations, set as 'cache' on one or more evaluators.
+
+    The key covers the evaluator class, a hash of its prompt template, threshold and model,
+    and the root task, request, response, background and the context the evaluator sees.
+    Results are kept in a size-bounded LRU; when 'path' is given they are also stored in a
+    SQLite database (details serialized as JSON) and survive restarts.
+    """
+
+    def __init__(self, max_size: int = 1024, path: Optional[str] = None):
+        self.max_size = max_size
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations (key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def key(evaluator, root_task, request, response, background, context: str) -> str:
+        parts = [
+            f"{evaluator.__class__.__module__}.{evaluator.__class__.__qualname__}",
+            _digest(evaluator.prompt),
+            str(evaluator.evaluation_threshold),
+            str(evaluator.model_name),
+            root_task,
+            request,
+            response,
+            background,
+            _digest(context),
+        ]
+        return _digest("\x1e".join(str(part) for part in parts))
+
+    def get(self, key: str) -> Optional[EvaluatorResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT result FROM evaluations WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = tuple(json.loads(row[0]))
+                    self._remember(key, entry)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        decision, score, details = entry
+        return EvaluatorResult(decision, score, copy.deepcopy(details))
+
+    def put(self, key: str, result: EvaluatorResult):
+        entry = (result.decision, result.score, copy.deepcopy(result.details))
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO evaluations (key, result) VALUES (?, ?)",
+                    (key, json.dumps(entry, default=str)),
+                )
+                self._db.commit()
+
+    def _remember(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM evaluations")
+                self._db.commit()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
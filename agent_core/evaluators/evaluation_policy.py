@@ -0,0 +1,131 @@
+# evaluators/evaluation_policy.py
+
+import json
+import math
+import os
+import random
+import threading
+from collections import defaultdict
+from typing import Dict, Optional
+
+
+def wilson_lower_bound(passed: int, total: int, z: float = 1.96) -> float:
+    """Lower bound of the Wilson score interval of the pass rate."""
+    if total == 0:
+        return 0.0
+    p = passed / total
+    denominator = 1 + z * z / total
+    centre = p + z * z / (2 * total)
+    margin = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total))
+    return (centre - margin) / denominator
+
+
+class EvaluationPolicy:
+    """
+    Decides whether a step/node needs an LLM evaluation, based on historical pass rates
+    per category and per category + tool.
+
+    - Pinned categories are always (or never) evaluated.
+    - Novel keys (fewer than 'min_samples' outcomes) and keys whose pass rate lower bound is below
+      'reliability' are always evaluated.
+    - Reliable keys are evaluated with probability 'sample_rate', which keeps their statistics fresh.
+
+    When 'path' is given, statistics and pins are persisted as JSON.
+    """
+
+    ALWAYS = "always"
+    NEVER = "never"
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        min_samples: int = 20,
+        reliability: float = 0.95,
+        sample_rate: float = 0.1,
+        autosave_every: int = 10,
+        seed: Optional[int] = None,
+    ):
+        self.path = path
+        self.min_samples = min_samples
+        self.reliability = reliability
+        self.sample_rate = sample_rate
+        self.autosave_every = autosave_every
+        self._random = random.Random(seed)
+        self._stats: Dict[str, list] = {}
+        self._pins: Dict[str, str] = {}
+        self._decisions = defaultdict(lambda: {"evaluated": 0, "skipped": 0})
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._stats = {key: list(value) for key, value in data.get("stats", {}).items()}
+            self._pins = dict(data.get("pins", {}))
+
+    @staticmethod
+    def _key(category: str, tool_name: Optional[str] = None) -> str:
+        return f"{category}:{tool_name}" if tool_name else category
+
+    def pin(self, category: str, mode: str):
+        """Always or never evaluate the category, regardless of its statistics."""
+        if mode not in (self.ALWAYS, self.NEVER):
+            raise ValueError(f"Pin mode must be '{self.ALWAYS}' or '{self.NEVER}'.")
+        with self._lock:
+            self._pins[category] = mode
+        self.save()
+
+    def unpin(self, category: str):
+        with self._lock:
+            self._pins.pop(category, None)
+        self.save()
+
+    def pass_rate(self, category: str, tool_name: Optional[str] = None) -> Optional[float]:
+        passed, total = self._stats.get(self._key(category, tool_name), (0, 0))
+        return passed / total if total else None
+
+    def should_evaluate(self, category: str, tool_name: Optional[str] = None) -> bool:
+        with self._lock:
+            pin = self._pins.get(category)
+            if pin is not None:
+                evaluate = pin == self.ALWAYS
+            else:
+                passed, total = self._stats.get(self._key(category, tool_name), (0, 0))
+                if total < self.min_samples or wilson_lower_bound(passed, total) < self.reliability:
+                    evaluate = True
+                else:
+                    evaluate = self._random.random() < self.sample_rate
+            self._decisions[category]["evaluated" if evaluate else "skipped"] += 1
+        return evaluate
+
+    def record(self, category: str, tool_name: Optional[str], passed: bool):
+        """Record the outcome of an evaluation for the category and for the category + tool."""
+        keys = {self._key(category), self._key(category, tool_name)}
+        with self._lock:
+            for key in keys:
+                stats = self._stats.setdefault(key, [0, 0])
+                stats[0] += int(passed)
+                stats[1] += 1
+            self._unsaved += 1
+            autosave = self._unsaved >= self.autosave_every
+        if autosave:
+            self.save()
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            by_category = {category: dict(counts) for category, counts in self._decisions.items()}
+        return {
+            "evaluated": sum(c["evaluated"] for c in by_category.values()),
+            "skipped": sum(c["skipped"] for c in by_category.values()),
+            "by_category": by_category,
+        }
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            data = {"stats": self._stats, "pins": self._pins}
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+            self._unsaved = 0
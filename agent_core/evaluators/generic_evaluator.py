@@ -1,9 +1,14 @@
 # evaluator/generic_evaluator.py
 
 import re
-from typing import Optional
+from typing import List, Optional, Tuple
 from .base_evaluator import BaseEvaluator
 from .entities.evaluator_result import EvaluatorResult
+from .score_parser import ParsedScores, parse_scores
+from ..utils.context_window import ContextRole
+
+# "### Item 2", "**Item 2**", "Item 2:" ... at the start of a line
+_ITEM_HEADER = re.compile(r"^[ \t#*]*Item[ \t]+(\d+)\b.*$", re.MULTILINE)
 
 
 class GenericEvaluator(BaseEvaluator):
@@ -53,6 +58,38 @@ At the end:
 {response}
 
 **Evaluation of current step:**
+"""
+
+    DEFAULT_BATCH_PROMPT = """
+You are an expert evaluator of AI-generated outputs. Evaluate each of the {count} step outputs below independently, based on the following criteria:
+
+1. **Accuracy** (Score 1-5): The output fulfills the requirements of the subtask accurately.
+2. **Completeness** (Score 1-5): The output addresses all aspects of the subtask.
+3. **Relevance** (Score 1-5): The content is directly relevant to the subtask without extraneous information.
+4. **Coherence and Clarity** (Score 1-5): The output is logically structured, clear, and easy to understand.
+5. **Consistency** (Score 1-5): The output is consistent with previous subtasks and doesn't contradict itself.
+6. **Following Instructions** (Score 1-5): The output adheres to any specific instructions or formats specified.
+7. **Error Analysis** (Score 1-5): The output is free from factual, grammatical, and logical errors.
+8. **Ethical Compliance** (Score 1-5): The content complies with ethical guidelines and policies.
+
+For every item, start a section with its header line "### Item <number>", then give one line per criterion in exactly this format, followed by a brief justification:
+1. **Accuracy (Score 1-5):** <score>
+
+End each section with the **Total Score** and, if a rerun is needed, suggestions on how to improve the output.
+---
+
+**Background**
+{background}
+
+**Context**
+{context}
+
+**Description of ultimate task goal:**
+{root_task}
+
+{items}
+
+**Evaluation of each item:**
 """
 
     def __init__(
@@ -62,6 +99,15 @@ At the end:
         evaluation_threshold: Optional[float] = 0.9,
     ):
         super().__init__(model_name, log_level, evaluation_threshold)
+        self._batch_prompt = self.DEFAULT_BATCH_PROMPT
+
+    @property
+    def batch_prompt(self) -> str:
+        return self._batch_prompt
+
+    @batch_prompt.setter
+    def batch_prompt(self, value: str):
+        self._batch_prompt = value
 
     def evaluate(
         self, root_task, request, response, background, context_manager
@@ -74,14 +120,87 @@ At the end:
             request=request,
             response=response,
             background=background,
-            context=context_manager.context_to_str(),
+            context=context_manager.render_for(ContextRole.EVALUATE) if context_manager else "",
         )
         evaluation_response = self._model.process(prompt_text)
-        decision, total_score, scores = self.parse_scored_evaluation_response(
-            evaluation_response
-        )
-        details = {"score_breakdown": scores, "raw_evaluation": evaluation_response}
-        return EvaluatorResult(decision, total_score, details)
+        parsed = self._parse_scores(evaluation_response)
+        details = {
+            "score_breakdown": parsed.scores,
+            # "none" when no scores were found, rather than a genuine score of 0
+            "score_source": parsed.source,
+            "raw_evaluation": evaluation_response,
+        }
+        return EvaluatorResult(self.decide(parsed.scores, parsed.total), parsed.total, details)
+
+    def evaluate_batch(
+        self, root_task, items: List[Tuple[str, str]], background, context_manager
+    ) -> List[EvaluatorResult]:
+        """
+        Score several step outputs with one prompt. Items answered locally (pre-evaluators, cache)
+        are not sent; items whose scores cannot be parsed from the batch answer are evaluated alone.
+        """
+        results: List[Optional[EvaluatorResult]] = [None] * len(items)
+        pending = []
+        for index, (request, response) in enumerate(items):
+            result, key = self._local_result(root_task, request, response, background, context_manager)
+            if result is not None:
+                results[index] = result
+            else:
+                pending.append((index, key))
+
+        if len(pending) > 1:
+            item_text = "\n".join(
+                f"**Item {n}**\nDescription of step:\n{items[index][0]}\n"
+                f"Output of step:\n{items[index][1]}\n"
+                for n, (index, _) in enumerate(pending, 1)
+            )
+            prompt_text = self._batch_prompt.format(
+                root_task=root_task,
+                background=background,
+                context=context_manager.render_for(ContextRole.EVALUATE) if context_manager else "",
+                items=item_text,
+                count=len(pending),
+            )
+            evaluation_response = self._model.process(prompt_text)
+            segments = self._split_items(evaluation_response)
+            criteria = self.max_score // 5
+            for n, (index, key) in enumerate(pending, 1):
+                parsed = parse_scores(segments.get(n, ""))
+                if len(parsed.scores) != criteria:
+                    continue
+                decision = self.decide(parsed.scores, parsed.total)
+                results[index] = EvaluatorResult(
+                    decision,
+                    parsed.total,
+                    {
+                        "score_breakdown": parsed.scores,
+                        "score_source": parsed.source,
+                        "raw_evaluation": segments[n],
+                        "batch_size": len(pending),
+                    },
+                )
+                if key is not None:
+                    self.cache.put(key, results[index])
+
+        fallback = [index for index, result in enumerate(results) if result is None]
+        if fallback and len(pending) > 1:
+            self.logger.warning(
+                f"Could not parse {len(fallback)} of {len(pending)} batch evaluations, evaluating them one by one."
+            )
+        for index in fallback:
+            request, response = items[index]
+            results[index] = self.evaluate(root_task, request, response, background, context_manager)
+        return results
+
+    @staticmethod
+    def _split_items(evaluation_response: str) -> dict:
+        """Map item numbers to their section of a batch evaluation."""
+        headers = list(_ITEM_HEADER.finditer(str(evaluation_response)))
+        segments = {}
+        for position, header in enumerate(headers):
+            end = headers[position + 1].start() if position + 1 < len(headers) else None
+            segments.setdefault(int(header.group(1)), evaluation_response[header.end():end])
+        return segments
 
     def default_prompt(self):
         return self.DEFAULT_PROMPT
@@ -91,62 +210,20 @@ At the end:
         Attempts to parse numeric scores from the text and compute a total_score.
         We also check if any single score < 3 triggers a rerun decision.
         """
-        scores = []
-        total_score = 0
-
-        lines = evaluation_response.strip().split("\n")
-        for line in lines:
-            # Several regex attempts to capture "Score: <digit>"
-            match_1 = re.match(
-                r"\d+\.\s\*\*([A-Za-z\s]+)\*\*\s\(Score\s1-5\):\s*Score:\s*(\d)", line
-            )
-            match_2 = re.match(r"\d+\.\s\*\*([A-Za-z\s]+) \(Score (\d+)\)", line)
-            match_3 = re.match(
-                r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\(Score:? (\d+)\)\*\*", line
-            )
-            match_4 = re.match(r"\d+\.\s+\*\*([A-Za-z\s]+)\*\* \(Score (\d+)\):", line)
-            match_5 = re.match(r"\*\*([A-Za-z\s]+)\s*\(Score\s1-5\):\s*(\d+)\*\*", line)
-            match_6 = re.match(
-                r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\(Score\s1-5\):\*\*\s*(\d+)", line
-            )
-            match_7 = re.match(
-                r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\(Score\s1-5\):\s*(\d+)\*\*", line
-            )
-            match_8 = re.match(
-                r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\(Score\s1-5\)\*\*:\s*(\d+)", line
-            )
-            match_9 = re.match(r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\((\d+)/5\):\*\*", line)
-            match_10 = re.match(r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\((\d+)\):\*\*", line)
-            match_11 = re.match(
-                r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\(Score:\s*(\d+)\):\*\*", line
-            )
-            match = (
-                match_1
-                or match_2
-                or match_3
-                or match_4
-                or match_5
-                or match_6
-                or match_7
-                or match_8
-                or match_9
-                or match_10
-                or match_11
-            )
+        parsed = self._parse_scores(evaluation_response)
+        return self.decide(parsed.scores, parsed.total), parsed.total, parsed.scores
 
-            if match:
-                criterion = match.group(1).strip()
-                score = int(match.group(2))
-                scores.append((criterion, score))
-                total_score += score
+    def _parse_scores(self, evaluation_response) -> ParsedScores:
+        parsed = parse_scores(evaluation_response)
+        if not parsed.found:
+            self.logger.warning("No scores found in the evaluation response, rerunning the subtask.")
+        return parsed
 
+    def decide(self, scores, total_score) -> str:
         # Check if any criterion scored below 3
         any_low_scores = any(score < 3 for _, score in scores)
 
         # Final decision logic
-        if float(total_score) / 40.0 > self.evaluation_threshold and not any_low_scores:
-            decision = "Accept Output"
-        else:
-            decision = "Rerun Subtask"
-
-        return decision, total_score, scores
+        if float(total_score) / self.max_score > self.evaluation_threshold and not any_low_scores:
+            return "Accept Output"
+        return "Rerun Subtask"
@@ -0,0 +1,138 @@
+# evaluators/pre_evaluators.py
+
+import json
+from typing import Iterable, List, Optional
+
+from .entities.evaluator_result import EvaluatorResult
+
+# Fixed outputs of GraphPlanner._execute_node for steps which cannot have succeeded
+TOOL_ARGUMENTS_ERROR = "Incorrect tool arguments and unexpected result when invoke the tool."
+RESPONSE_STRUCTURE_ERROR = "Incorrect and unexpected structure in response."
+TOOL_NOT_ATTACHED_ERROR = "Tool usage was requested, but no tool is attached to this node."
+ERROR_SENTINELS = (TOOL_ARGUMENTS_ERROR, RESPONSE_STRUCTURE_ERROR, TOOL_NOT_ATTACHED_ERROR)
+
+# Marks the tool output in a tool step's response
+TOOL_RESPONSE_MARKER = "task tool response :"
+
+_EMPTY_VALUES = {"", "none", "null", "[]", "{}", '""', "''"}
+
+
+class PreEvaluator:
+    """
+    A local, deterministic check run before the LLM evaluator.
+    check() returns the reason the response is a guaranteed failure, or None.
+    """
+
+    name = "pre_evaluator"
+    suggestion = ""
+
+    def check(self, request: str, response: str) -> Optional[str]:
+        raise NotImplementedError
+
+
+class SentinelCheck(PreEvaluator):
+    name = "error_sentinel"
+    suggestion = "Fix the reported error (e.g. the tool arguments or the response structure) and retry the step."
+
+    def __init__(self, sentinels: Iterable[str] = ERROR_SENTINELS):
+        self.sentinels = tuple(sentinels)
+
+    def check(self, request, response):
+        for sentinel in self.sentinels:
+            if response.startswith(sentinel):
+                return response
+        return None
+
+
+class EmptyOutputCheck(PreEvaluator):
+    """
+    Fails blank responses, and tool steps whose tool output is an empty value ("none", "[]"...).
+    Other responses equal to such a value are left to the LLM evaluator, as "none" or "[]" can
+    be the correct answer of a step without a tool.
+    """
+
+    name = "empty_output"
+    suggestion = "Produce a non-empty result; for tool steps, check the tool arguments select existing data."
+
+    def check(self, request, response):
+        if not response.strip():
+            return "The step produced an empty response."
+        if TOOL_RESPONSE_MARKER in response:
+            tool_output = response.split(TOOL_RESPONSE_MARKER, 1)[1]
+            if tool_output.strip().lower() in _EMPTY_VALUES:
+                return "The tool returned an empty result."
+        return None
+
+
+class JsonCheck(PreEvaluator):
+    """
+    The response must be JSON (with 'required_keys' when given). Only add it for steps whose
+    output must be JSON, e.g. JsonCheck(required_keys=["status"]).
+    """
+
+    name = "schema"
+    suggestion = "Respond with valid JSON matching the requested structure."
+
+    def __init__(self, required_keys: Iterable[str] = ()):
+        self.required_keys = list(required_keys)
+
+    def check(self, request, response):
+        text = response.strip().replace("```json", "").replace("```", "").strip()
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            return f"The response is not valid JSON: {e}"
+        missing = [
+            key for key in self.required_keys if not isinstance(data, dict) or key not in data
+        ]
+        if missing:
+            return f"The response is missing required keys: {', '.join(missing)}"
+        return None
+
+
+class LengthCheck(PreEvaluator):
+    name = "length"
+
+    def __init__(self, min_chars: int = 1, max_chars: Optional[int] = None):
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+
+    @property
+    def suggestion(self):
+        return f"Keep the response between {self.min_chars} and {self.max_chars or 'any'} characters."
+
+    def check(self, request, response):
+        if len(response) < self.min_chars:
+            return f"The response is shorter than {self.min_chars} characters."
+        if self.max_chars is not None and len(response) > self.max_chars:
+            return f"The response is longer than {self.max_chars} characters ({len(response)})."
+        return None
+
+
+class PreEvaluatorChain:
+    """
+    Runs the checks in order and fails fast on the first failure, with a zero-score
+    EvaluatorResult explaining it; the LLM evaluator is then not called.
+    """
+
+    DECISION = "Rerun Subtask"
+
+    def __init__(self, checks: Optional[List[PreEvaluator]] = None):
+        self.checks = list(checks) if checks is not None else [SentinelCheck(), EmptyOutputCheck()]
+
+    def run(self, request, response) -> Optional[EvaluatorResult]:
+        response = "" if response is None else str(response)
+        for check in self.checks:
+            reason = check.check(str(request), response)
+            if reason is not None:
+                return EvaluatorResult(
+                    self.DECISION,
+                    0,
+                    {
+                        "pre_evaluation": check.name,
+                        "reason": reason,
+                        "score_breakdown": [],
+                        "improvement_suggestions": check.suggestion,
+                    },
+                )
+        return None
@@ -0,0 +1,99 @@
+# evaluators/score_parser.py
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+# Criterion lines produced by evaluator models, e.g.
+#   1. **Accuracy (Score 1-5):** 4
+#   1. **Accuracy** (Score 5): ...
+#   **Accuracy (Score 1-5): 4**
+# One alternative per known format; the first alternative matching at the start of a line wins.
+_SP = r"[ \t]"
+_NAME = r"[A-Za-z \t]+"
+_FORMATS = [
+    rf"\d+\.{_SP}\*\*(?P<c>{_NAME})\*\*{_SP}\(Score{_SP}1-5\):{_SP}*Score:{_SP}*(?P<s>\d)",
+    rf"\d+\.{_SP}\*\*(?P<c>{_NAME}) \(Score (?P<s>\d+)\)",
+    rf"\d+\.{_SP}+\*\*(?P<c>{_NAME}){_SP}*\(Score:? (?P<s>\d+)\)\*\*",
+    rf"\d+\.{_SP}+\*\*(?P<c>{_NAME})\*\* \(Score (?P<s>\d+)\):",
+    rf"\*\*(?P<c>{_NAME}){_SP}*\(Score{_SP}1-5\):{_SP}*(?P<s>\d+)\*\*",
+    rf"\d+\.{_SP}+\*\*(?P<c>{_NAME}){_SP}*\(Score{_SP}1-5\):\*\*{_SP}*(?P<s>\d+)",
+    rf"\d+\.{_SP}+\*\*(?P<c>{_NAME}){_SP}*\(Score{_SP}1-5\):{_SP}*(?P<s>\d+)\*\*",
+    rf"\d+\.{_SP}+\*\*(?P<c>{_NAME}){_SP}*\(Score{_SP}1-5\)\*\*:{_SP}*(?P<s>\d+)",
+    rf"\d+\.{_SP}+\*\*(?P<c>{_NAME}){_SP}*\((?P<s>\d+)/5\):\*\*",
+    rf"\d+\.{_SP}+\*\*(?P<c>{_NAME}){_SP}*\((?P<s>\d+)\):\*\*",
+    rf"\d+\.{_SP}+\*\*(?P<c>{_NAME}){_SP}*\(Score:{_SP}*(?P<s>\d+)\):\*\*",
+]
+
+
+def _combine(formats: List[str]) -> re.Pattern:
+    alternatives = [
+        f"(?:{pattern.replace('(?P<c>', f'(?P<c{i}>').replace('(?P<s>', f'(?P<s{i}>')})"
+        for i, pattern in enumerate(formats)
+    ]
+    return re.compile(rf"^{_SP}*(?:{'|'.join(alternatives)})", re.MULTILINE)
+
+
+SCORE_LINE = _combine(_FORMATS)
+_JSON_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+@dataclass(slots=True)
+class ParsedScores:
+    """
+    Criterion scores found in an evaluation. 'source' is "json", "text" or "none" when no
+    scores were found (the evaluation format was not recognised).
+    """
+
+    scores: List[Tuple[str, int]] = field(default_factory=list)
+    source: str = "none"
+
+    @property
+    def found(self) -> bool:
+        return bool(self.scores)
+
+    @property
+    def total(self) -> int:
+        return sum(score for _, score in self.scores)
+
+
+def _parse_json(text: str) -> Optional[List[Tuple[str, int]]]:
+    """Scores of a structured evaluation: {"scores": {"Accuracy": 4}} or {"scores": [{"criterion", "score"}]}."""
+    try:
+        data = json.loads(_JSON_FENCE.sub("", text))
+    except ValueError:
+        return None
+    raw = data.get("scores") if isinstance(data, dict) else None
+    if isinstance(raw, dict):
+        items = raw.items()
+    elif isinstance(raw, list):
+        items = [
+            (item.get("criterion"), item.get("score"))
+            for item in raw
+            if isinstance(item, dict)
+        ]
+    else:
+        return None
+    scores = []
+    for criterion, score in items:
+        if criterion is None or isinstance(score, bool):
+            continue
+        if isinstance(score, (int, float)) or (isinstance(score, str) and score.strip().isdigit()):
+            scores.append((str(criterion).strip(), int(score)))
+    return scores
+
+
+def parse_scores(evaluation: str) -> ParsedScores:
+    text = str(evaluation).strip()
+    if text.startswith("{") or text.startswith("```"):
+        scores = _parse_json(text)
+        if scores:
+            return ParsedScores(scores, "json")
+    if "**" not in text:
+        return ParsedScores()
+    scores = []
+    for match in SCORE_LINE.finditer(text):
+        index = match.lastgroup[1:]
+        scores.append((match.group(f"c{index}").strip(), int(match.group(f"s{index}"))))
+    return ParsedScores(scores, "text") if scores else ParsedScores()
@@ -1,16 +1,54 @@
 # models/base_model.py
 
+import functools
 from abc import ABC, abstractmethod
 
-from agent_core.config import Environment
+from agent_core.utils.budget import get_active_budget
+from agent_core.utils.events import EventType, emit_event
+from agent_core.utils.tokens import estimate_tokens
+from agent_core.utils.tracer import get_tracer
 
-Environment()
+
+def _instrument_process(process):
+    """
+    Wrap a model's process() so every model call is traced and counted against the active run budget,
+    whichever model implements it.
+    """
+
+    @functools.wraps(process)
+    def wrapper(self, request, *args, **kwargs):
+        with get_tracer().span("model.process", model=self.name) as span:
+            response = process(self, request, *args, **kwargs)
+            prompt_tokens = estimate_tokens(request)
+            completion_tokens = estimate_tokens(response)
+            span.set_attributes(
+                prompt_tokens=prompt_tokens, completion_tokens=completion_tokens
+            )
+            budget = get_active_budget()
+            if budget is not None:
+                budget.record_llm_call(prompt_tokens, completion_tokens)
+        # Models return whole responses, so a call produces a single delta
+        emit_event(EventType.TOKEN_DELTA, model=self.name, delta=response)
+        return response
+
+    wrapper.__instrumented__ = True
+    return wrapper
 
 
 class BaseModel(ABC):
     def __init__(self):
         self.name = self.name()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        process = cls.__dict__.get("process")
+        if (
+            process is not None
+            and not getattr(process, "__isabstractmethod__", False)
+            and not getattr(process, "__instrumented__", False)
+        ):
+            cls.process = _instrument_process(process)
+
     @abstractmethod
     def process(self, command: str) -> str:
         pass
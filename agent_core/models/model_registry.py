@@ -3,7 +3,9 @@
 import pkgutil
 import importlib
 import os
+import threading
 from .base_model import BaseModel
+from agent_core.config import get_environment
 from agent_core.utils.logger import get_logger
 
 
@@ -26,11 +28,20 @@ def load_models_dynamically(logger):
                 and attribute is not BaseModel
             ):
                 instance = attribute()
-                ModelRegistry.register_model(instance)
+                # Models registered before the lazy load take precedence
+                if instance.name not in ModelRegistry._models:
+                    ModelRegistry.register_model(instance)
 
 
 class ModelRegistry:
+    """
+    The models by name. The bundled models (and their LangChain clients) are loaded on the
+    first lookup of a model which is not registered yet, not at import.
+    """
+
     _models = {}
+    _loaded = False
+    _lock = threading.Lock()
     logger = get_logger("model-registry")
 
     @classmethod
@@ -40,6 +51,8 @@ class ModelRegistry:
 
     @classmethod
     def get_model(cls, name: str) -> BaseModel:
+        if name not in cls._models:
+            cls.ensure_loaded()
         if name not in cls._models:
             cls.logger.error(f"Model '{name}' not found in registry.")
             raise ValueError(f"Model '{name}' is not supported.")
@@ -53,7 +66,14 @@ class ModelRegistry:
         except Exception as e:
             logger.error(f"Error loading models: {e}")
             raise
+        cls._loaded = True
 
-
-# Initialize and load models
-ModelRegistry.load_models()
+    @classmethod
+    def ensure_loaded(cls):
+        """Validate the configuration and load the bundled models, once."""
+        if cls._loaded:
+            return
+        with cls._lock:
+            if not cls._loaded:
+                get_environment()
+                cls.load_models()
@@ -1,4 +1,21 @@
-from .generic_planner import GenericPlanner
-from agent_core.planners.graph_planner import GraphPlanner
+import importlib
+
+# PEP 562: submodules (and the model stack behind them) are imported on first attribute access
+_LAZY = {
+    "GenericPlanner": ".generic_planner",
+    "GraphPlanner": ".graph_planner",
+}
 
 __all__ = ["GenericPlanner", "GraphPlanner"]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
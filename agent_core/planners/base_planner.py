@@ -1,20 +1,18 @@
 # planners/base_planner.py
 
+import copy
 from abc import abstractmethod
-from typing import List, Optional
-from langchain_core.tools import BaseTool
+from typing import TYPE_CHECKING, List, Optional
 from agent_core.agent_basic import AgentBasic
 from agent_core.entities.steps import Steps
+from agent_core.utils.tool_catalog import ToolCatalog
 
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
 
-def tool_knowledge_format(tools: Optional[List[BaseTool]]) -> str:
-    tools_knowledge_list = []
-    if tools is not None:
-        tools_knowledge_list = [
-            str(tool.args_schema.model_json_schema()) for tool in tools
-        ]
-    tools_knowledge = "\n".join(tools_knowledge_list)
-    return tools_knowledge
+
+def tool_knowledge_format(tools: Optional[List["BaseTool"]]) -> str:
+    return ToolCatalog.of(tools).tools_knowledge
 
 
 def background_format(background: str) -> str:
@@ -45,6 +43,7 @@ If the <Tools></Tools> section contains tools, set "use_tool" to true when a too
     "use_tool": A boolean indicating whether a tool should be used
     Optionally, "tool_name": The name of the tool if "use_tool" is true
     "step_category": Categorize the step based on its function ({categories_str})
+    Optionally, "depends_on": The "step_name"s of earlier steps whose results this step needs ([] if it needs none), so independent steps can run in parallel
 3) The possible categories for each step are: {categories_str}.
     If you cannot fit into any existing category, define a new category in "step_category".
 4) Output **ONLY** valid JSON. No extra text, no Markdown.   
@@ -82,12 +81,23 @@ Steps:
         """
         super().__init__(self.__class__.__name__, model_name, log_level)
         self.prompt = self.DEFAULT_PROMPT
+        # Optional PlanCache shared across runs, reuses plans of structurally identical tasks
+        self.plan_cache = None
+        # Optional PlanLibrary of successful plans, used as few-shot examples for similar tasks
+        self.plan_library = None
+
+    def spawn(self) -> "BasePlanner":
+        """
+        A copy of this planner for an isolated run. The model client, prompts, plan cache and
+        plan library are shared; per-run state must be reset by subclasses holding any.
+        """
+        return copy.copy(self)
 
     @abstractmethod
     def plan(
         self,
         task: str,
-        tools: Optional[List[BaseTool]],
+        tools: Optional[List["BaseTool"]],
         knowledge: str = "",
         background: str = "",
         categories: Optional[List[str]] = None,
@@ -1,11 +1,40 @@
 # planners/generic_planner.py
 
+import contextvars
 import json
-from typing import List, Optional, Dict
-from langchain_core.tools import BaseTool
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, List, Optional, Dict
 from .base_planner import BasePlanner, tool_knowledge_format, background_format
-from ..entities.steps import Steps, Step
-from ..evaluators import BaseEvaluator
+from ..entities.steps import Steps, Step, step_to_str
+from ..evaluators import BaseEvaluator, EvaluationPolicy
+from ..utils.context_manager import ContextManager, EntryKind
+from ..utils.context_window import ContextRole
+from ..utils.events import EventType, emit_event
+from ..utils.logger import capped
+from ..utils.tracer import current_span, get_tracer, traced
+
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
+
+
+EARLIER_STEPS_KEY = "Earlier Steps"
+
+
+def resolve_dependencies(steps: List[Step]) -> Dict[int, List[int]]:
+    """
+    Map each 1-based step index to the indexes of the steps it depends on.
+    'depends_on' names refer to the nearest earlier step of that name; a step without
+    'depends_on' depends on the previous step.
+    """
+    dependencies = {}
+    latest: Dict[str, int] = {}
+    for idx, step in enumerate(steps, 1):
+        if step.depends_on is None:
+            dependencies[idx] = [idx - 1] if idx > 1 else []
+        else:
+            dependencies[idx] = [latest[name] for name in step.depends_on if name in latest]
+        latest[step.name] = idx
+    return dependencies
 
 
 class GenericPlanner(BasePlanner):
@@ -49,11 +78,19 @@ class GenericPlanner(BasePlanner):
         'prompt' can override the default prompt used for planning.
         """
         super().__init__(model_name, log_level)
+        # Steps kept verbatim in the context; older ones are folded into "Earlier Steps"
+        self.history_window = 3
+        self.history_digest_chars = 200
+        # Steps of a 'depends_on' plan running at the same time
+        self.max_parallel_steps = 4
+        # Grade all steps with one batch evaluation per evaluator after executing them
+        self.batch_evaluation = False
 
+    @traced("planner.plan", planner="GenericPlanner")
     def plan(
         self,
         task: str,
-        tools: Optional[List[BaseTool]],
+        tools: Optional[List["BaseTool"]],
         knowledge: str = "",
         background: str = "",
         categories: Optional[List[str]] = None,
@@ -63,18 +100,36 @@ class GenericPlanner(BasePlanner):
         'knowledge' is appended to the prompt to guide the planning process.
         If 'categories' is provided, we pass it to the LLM so it can properly categorize each step.
         """
-        self.logger.info(f"Creating plan for task: {task}")
+        self.logger.info("Creating plan for task: %s", capped(task))
 
         tools_knowledge = tool_knowledge_format(tools)
         categories_str = ", ".join(categories) if categories else "(Not defined)"
 
+        cache_scope = None
+        if self.plan_cache is not None:
+            cache_scope = self.plan_cache.scope_key(
+                self.model_name, self.prompt, tools_knowledge, knowledge, background, categories_str
+            )
+            cached_plan = self.plan_cache.get(task, cache_scope)
+            if cached_plan is not None:
+                self.logger.info(f"Plan cache hit, reusing {len(cached_plan.steps)} steps.")
+                current_span().set_attributes(steps=len(cached_plan.steps), cache_hit=True)
+                return cached_plan
+
+        example_json1, example_json2 = self.EXAMPLE_JSON1, self.EXAMPLE_JSON2
+        if self.plan_library is not None:
+            past_examples = self.plan_library.format_examples(task)
+            if past_examples:
+                self.logger.info("Using similar past plans as planning examples.")
+                example_json1, example_json2 = past_examples, ""
+
         final_prompt = self.prompt.format(
             knowledge=knowledge,
             background=background_format(background),
             task=task,
             tools_knowledge=tools_knowledge,
-            example_json1=self.EXAMPLE_JSON1,
-            example_json2=self.EXAMPLE_JSON2,
+            example_json1=example_json1,
+            example_json2=example_json2,
             categories_str=categories_str,
         )
 
@@ -86,7 +141,7 @@ class GenericPlanner(BasePlanner):
             self.logger.error(error_msg)
             raise ValueError(error_msg)
 
-        self.logger.debug(f"Raw LLM response: {repr(response_text)}")
+        self.logger.debug("Raw LLM response: %r", capped(response_text))
 
         # Minor cleanup of possible code fences
         cleaned = response_text.replace("```json", "").replace("```", "").strip()
@@ -97,13 +152,17 @@ class GenericPlanner(BasePlanner):
             steps_data = data.get("steps", [])
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse JSON: {e}")
-            self.logger.error(f"Raw LLM response was: {cleaned}")
+            self.logger.error("Raw LLM response was: %s", capped(cleaned))
             raise ValueError("Invalid JSON format in planner response.")
 
         plan = self.analyse_result(steps_data, categories)
         self.logger.info(f"Got {len(plan.steps)} steps from the LLM.")
+        if self.plan_cache is not None and plan.steps:
+            self.plan_cache.put(task, cache_scope, plan)
+        current_span().set_attribute("steps", len(plan.steps))
         return plan
 
+    @traced("planner.execute_plan", planner="GenericPlanner")
     def execute_plan(
         self,
         plan: Steps,
@@ -113,18 +172,221 @@ class GenericPlanner(BasePlanner):
         evaluators: Dict[str, BaseEvaluator],
         context_manager=None,
         background: str = "",
+        evaluation_policy: Optional[EvaluationPolicy] = None,
     ):
         """
         Execute a list of steps (previously planned).
         This replaces the step-by-step logic that was inside agent.py for GenericPlanner.
+        Plans declaring 'depends_on' run independent steps concurrently (see execute_plan_parallel).
         """
         self.logger.info(f"Executing plan with {len(plan.steps)} steps.")
 
+        batch = evaluators_enabled and self.batch_evaluation
+        step_evaluation = evaluators_enabled and not batch
+        first = len(execution_history.steps)
+
+        if any(step.depends_on is not None for step in plan.steps):
+            all_steps_passed = self.execute_plan_parallel(
+                plan, task, execution_history, step_evaluation, evaluators,
+                context_manager, background, evaluation_policy,
+            )
+        else:
+            all_steps_passed = True
+            for idx, step in enumerate(plan.steps, 1):
+                context_section = (
+                    context_manager.render_for(ContextRole.EXECUTE) if context_manager else ""
+                )
+                response, passed = self._execute_step(
+                    idx, step, task, context_section, background,
+                    step_evaluation, evaluators, context_manager, evaluation_policy,
+                )
+                all_steps_passed = all_steps_passed and passed
+
+                # Record the step execution
+                executed = Step(name=step.name, description=step.description, result=str(response))
+                execution_history.add_step(executed)
+                if context_manager is not None:
+                    self._add_step_context(context_manager, idx, executed)
+
+        if batch:
+            batch_passed = self._evaluate_steps_batch(
+                plan, execution_history.steps[first:], task, background,
+                evaluators, context_manager, evaluation_policy,
+            )
+            all_steps_passed = all_steps_passed and batch_passed
+
+        # Only plans whose steps were evaluated and passed are kept as examples for similar tasks
+        if evaluators_enabled and all_steps_passed and self.plan_library is not None:
+            self.plan_library.add(task, plan)
+        return "Task execution completed using GenericPlanner."
+
+    def _evaluate_steps_batch(
+        self,
+        plan: Steps,
+        executed: List[Step],
+        task: str,
+        background: str,
+        evaluators: Dict[str, BaseEvaluator],
+        context_manager,
+        evaluation_policy: Optional[EvaluationPolicy],
+    ) -> bool:
+        """
+        Grade the completed steps with one evaluate_batch() call per evaluator. Failed steps are
+        executed again with the usual per-step evaluation and retries.
+        """
+        groups: Dict[int, List[int]] = {}
+        failed = []
         for idx, step in enumerate(plan.steps, 1):
+            tool_name = step.tool_name if step.use_tool else None
+            evaluator = evaluators.get(step.category if step.category in evaluators else "default")
+            if evaluation_policy is not None \
+                    and not evaluation_policy.should_evaluate(step.category, tool_name):
+                # The local checks still run, only the LLM evaluation is skipped
+                if evaluator.pre_evaluate(step.description, executed[idx - 1].result) is not None:
+                    failed.append(idx)
+                else:
+                    self.logger.info(f"Evaluation of Step {idx} skipped by evaluation policy.")
+                continue
+            groups.setdefault(id(evaluator), []).append(idx)
+
+        for indexes in groups.values():
+            first_step = plan.steps[indexes[0] - 1]
+            evaluator = evaluators.get(
+                first_step.category if first_step.category in evaluators else "default"
+            )
+            results = evaluator.evaluate_batch(
+                task,
+                [(plan.steps[idx - 1].description, executed[idx - 1].result) for idx in indexes],
+                background,
+                context_manager,
+            )
+            for idx, evaluator_result in zip(indexes, results):
+                step = plan.steps[idx - 1]
+                passed = evaluator_result.score / evaluator.max_score > evaluator.evaluation_threshold
+                self.logger.info(
+                    f"Batch evaluation of Step {idx}: {evaluator_result.decision}, Score: {evaluator_result.score}"
+                )
+                emit_event(
+                    EventType.EVALUATION_SCORED, step=idx, attempt=1,
+                    decision=evaluator_result.decision, score=evaluator_result.score,
+                )
+                if evaluation_policy is not None:
+                    evaluation_policy.record(
+                        step.category, step.tool_name if step.use_tool else None, passed
+                    )
+                if not passed:
+                    failed.append(idx)
+
+        all_passed = True
+        for idx in sorted(failed):
+            step = plan.steps[idx - 1]
+            self.logger.info(f"Step {idx} failed batch evaluation, executing it again.")
             context_section = (
-                context_manager.context_to_str() if context_manager else ""
+                context_manager.render_for(ContextRole.EXECUTE) if context_manager else ""
+            )
+            response, passed = self._execute_step(
+                idx, step, task, context_section, background,
+                True, evaluators, context_manager, evaluation_policy,
             )
-            final_prompt = f"""
+            all_passed = all_passed and passed
+            executed[idx - 1].result = str(response)
+            key = ContextManager.result_key(str(idx))
+            if context_manager is not None and context_manager.get_entry(key) is not None:
+                context_manager.add_node_result(str(idx), step_to_str(idx, executed[idx - 1]))
+        return all_passed
+
+    def execute_plan_parallel(
+        self,
+        plan: Steps,
+        task: str,
+        execution_history: Steps,
+        evaluators_enabled: bool,
+        evaluators: Dict[str, BaseEvaluator],
+        context_manager=None,
+        background: str = "",
+        evaluation_policy: Optional[EvaluationPolicy] = None,
+    ) -> bool:
+        """
+        Execute the steps as a DAG: each step starts once the steps it depends on are done,
+        with up to 'max_parallel_steps' steps at a time. The context of a step, for its execution
+        and its evaluation, holds only the results of its dependencies. Steps without
+        'depends_on' depend on the previous step. Results are recorded in the execution history
+        in plan order, and folded into "Earlier Steps" as in execute_plan once they leave the
+        rolling window and no step still waits for them.
+        """
+        dependencies = resolve_dependencies(plan.steps)
+        dependents = {idx: [] for idx in dependencies}
+        for idx, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].append(idx)
+        waiting = {idx: len(deps) for idx, deps in dependencies.items()}
+        results: Dict[int, Step] = {}
+        recorded = 0
+        folded = 0
+        all_steps_passed = True
+
+        pool = ThreadPoolExecutor(
+            max_workers=max(1, self.max_parallel_steps), thread_name_prefix="planner-step"
+        )
+
+        def submit(idx):
+            step = plan.steps[idx - 1]
+            step_context, context_section = None, ""
+            if context_manager is not None:
+                keys = [ContextManager.result_key(str(dep)) for dep in dependencies[idx]]
+                step_context = context_manager.spawn(keys)
+                context_section = context_manager.render(keys)
+            # Run in a copy of the current context, so tracing, budgets and events follow the step
+            return pool.submit(
+                contextvars.copy_context().run,
+                self._execute_step,
+                idx, step, task, context_section, background,
+                evaluators_enabled, evaluators, step_context, evaluation_policy,
+            )
+
+        try:
+            running = {submit(idx): idx for idx, count in waiting.items() if count == 0}
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    idx = running.pop(future)
+                    response, passed = future.result()
+                    all_steps_passed = all_steps_passed and passed
+                    step = plan.steps[idx - 1]
+                    results[idx] = Step(
+                        name=step.name, description=step.description, result=str(response)
+                    )
+                    if context_manager is not None:
+                        context_manager.add_node_result(str(idx), step_to_str(idx, results[idx]))
+                    for dependent in dependents[idx]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            running[submit(dependent)] = dependent
+                while recorded + 1 in results:
+                    recorded += 1
+                    execution_history.add_step(results[recorded])
+                while context_manager is not None and folded + 1 <= recorded - self.history_window \
+                        and all(dependent in results for dependent in dependents[folded + 1]):
+                    folded += 1
+                    self._fold_step_context(context_manager, folded)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        return all_steps_passed
+
+    def _execute_step(
+        self,
+        idx: int,
+        step: Step,
+        task: str,
+        context_section: str,
+        background: str,
+        evaluators_enabled: bool,
+        evaluators: Dict[str, BaseEvaluator],
+        context_manager,
+        evaluation_policy: Optional[EvaluationPolicy],
+    ):
+        """Run one step with its optional evaluation and retries. Returns (response, passed)."""
+        final_prompt = f"""
 {context_section}
 {background_format(background)}
 <Task>
@@ -135,53 +397,135 @@ class GenericPlanner(BasePlanner):
 </Task>
             """
 
-            self.logger.info(f"Executing Step {idx}: {step.description}")
+        self.logger.info("Executing Step %s: %s", idx, capped(step.description))
+        emit_event(
+            EventType.NODE_STARTED, step=idx, name=step.name,
+            description=step.description, attempt=1,
+        )
+        with get_tracer().span(
+            "planner.step", step=idx, step_name=step.name, category=step.category, attempt=1
+        ):
             response = self._model.process(final_prompt)
-            self.logger.info(f"Response for Step {idx}: {response}")
+        self.logger.info("Response for Step %s: %s", idx, capped(response))
 
-            # Optional Evaluation
-            if evaluators_enabled:
-                attempt = 1
-                chosen_cat = step.category if step.category in evaluators else "default"
-                evaluator = evaluators.get(chosen_cat)
+        # Optional Evaluation; the local pre-evaluator checks are free, so they always run
+        tool_name = step.tool_name if step.use_tool else None
+        evaluator = pre_result = None
+        if evaluators_enabled:
+            evaluator = evaluators.get(step.category if step.category in evaluators else "default")
+            pre_result = evaluator.pre_evaluate(step.description, response)
+        if evaluators_enabled and pre_result is None and evaluation_policy is not None \
+                and not evaluation_policy.should_evaluate(step.category, tool_name):
+            self.logger.info(f"Evaluation of Step {idx} skipped by evaluation policy.")
+        elif evaluators_enabled:
+            attempt = 1
+            evaluator_result = pre_result or evaluator.evaluate(
+                task, step.description, response, background, context_manager
+            )
+            self.logger.info(
+                "Evaluator Decision: %s, Score: %s", evaluator_result.decision, evaluator_result.score
+            )
+            emit_event(
+                EventType.EVALUATION_SCORED, step=idx, attempt=attempt,
+                decision=evaluator_result.decision, score=evaluator_result.score,
+            )
+            if evaluation_policy is not None:
+                evaluation_policy.record(
+                    step.category, tool_name,
+                    evaluator_result.score / evaluator.max_score > evaluator.evaluation_threshold,
+                )
+            while evaluator_result.score / evaluator.max_score <= evaluator.evaluation_threshold\
+                    and evaluator.max_attempt - 1 > attempt:
+                self.logger.info(
+                    "Executing Step %s Failed Attempt %s: %s", idx, attempt, capped(step.description)
+                )
+                emit_event(
+                    EventType.NODE_STARTED, step=idx, name=step.name,
+                    description=step.description, attempt=attempt + 1,
+                )
+                replan_prompt = f"""
+                    {context_section}
+                    {background_format(background)}
+                    <Task>
+                    <Root Task>
+                    {task}
+                    </Root Task>
+                    {step.description}
+                    </Task>
+                    <Evaluator/>
+                    {evaluator_result.details}
+                    <Evaluator>
+                    """
+                with get_tracer().span(
+                    "planner.step", step=idx, step_name=step.name,
+                    category=step.category, attempt=attempt + 1,
+                ):
+                    response = self._model.process(replan_prompt)
                 evaluator_result = evaluator.evaluate(
                     task, step.description, response, background, context_manager
                 )
                 self.logger.info(
-                    f"Evaluator Decision: {evaluator_result.decision}, Score: {evaluator_result.score}"
+                    "Response for Rerun Step %s Failed Attempt %s: %s", idx, attempt, capped(response)
                 )
-                while evaluator_result.score / 40 <= evaluator.evaluation_threshold\
-                        and evaluator.max_attempt - 1 > attempt:
-                    self.logger.info(f"Executing Step {idx} Failed Attempt {attempt}: {step.description}")
-                    replan_prompt = f"""
-                        {context_section}
-                        {background_format(background)}
-                        <Task>
-                        <Root Task>
-                        {task}
-                        </Root Task>
-                        {step.description}
-                        </Task>
-                        <Evaluator/>
-                        {evaluator_result.details}
-                        <Evaluator>
-                        """
-                    response = self._model.process(replan_prompt)
-                    evaluator_result = evaluator.evaluate(
-                        task, step.description, response, background, context_manager
-                    )
-                    self.logger.info(f"Response for Rerun Step {idx} Failed Attempt {attempt}: {response}")
-                    attempt = attempt + 1
+                attempt = attempt + 1
+                emit_event(
+                    EventType.EVALUATION_SCORED, step=idx, attempt=attempt,
+                    decision=evaluator_result.decision, score=evaluator_result.score,
+                )
+            if evaluator_result.score / evaluator.max_score <= evaluator.evaluation_threshold:
+                return response, False
+        return response, True
 
-            # Record the step execution
-            execution_history.add_step(
-                Step(name=step.name, description=step.description, result=str(response))
-            )
-            context_manager.add_context(
-                "Execution History",
-                execution_history.execution_history_to_str(),
-            )
-        return "Task execution completed using GenericPlanner."
+    def _add_step_context(self, context_manager, idx: int, step: Step):
+        """
+        Add the step as its own context entry, and fold the step leaving the rolling window
+        into a short digest under "Earlier Steps".
+        """
+        context_manager.add_node_result(str(idx), step_to_str(idx, step))
+        if idx - self.history_window >= 1:
+            self._fold_step_context(context_manager, idx - self.history_window)
+
+    def _fold_step_context(self, context_manager, folded: int):
+        """Replace the context entry of the step with a digest appended to "Earlier Steps"."""
+        folded_key = ContextManager.result_key(str(folded))
+        folded_entry = context_manager.get_entry(folded_key)
+        if folded_entry is None:
+            return
+        result = str(context_manager.original(folded_key)).split("Result: ", 1)[-1].strip()
+        if len(result) > self.history_digest_chars:
+            result = result[: self.history_digest_chars] + "..."
+        digest = f"Step {folded}: {result}"
+        earlier = context_manager.get_entry(EARLIER_STEPS_KEY)
+        context_manager.add_context(
+            EARLIER_STEPS_KEY,
+            f"{earlier.value}\n{digest}" if earlier is not None else digest,
+            kind=EntryKind.HISTORY,
+        )
+        context_manager.remove_context(folded_key)
+
+    def _validate_depends_on(self, step_data, plan: Steps) -> Optional[List[str]]:
+        """
+        Keep the 'depends_on' references to names of earlier steps. Other references (unknown or
+        later steps, which could form cycles) are dropped with a warning.
+        """
+        depends_on = step_data.get("depends_on")
+        if depends_on is None:
+            return None
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        if not isinstance(depends_on, list):
+            self.logger.warning(f"Ignoring invalid depends_on {depends_on!r} of {step_data}")
+            return None
+        earlier = {step.name for step in plan.steps}
+        valid = []
+        for name in depends_on:
+            if name in earlier and name not in valid:
+                valid.append(name)
+            else:
+                self.logger.warning(
+                    f"Step '{step_data.get('step_name')}' depends on unknown or later step {name!r}, ignoring it."
+                )
+        return valid
 
     def analyse_result(self, steps_data, categories):
         valid_categories = set(categories) if categories else set()
@@ -204,6 +548,7 @@ class GenericPlanner(BasePlanner):
                     use_tool=use_tool,
                     tool_name=tool_name,
                     category=final_cat,
+                    depends_on=self._validate_depends_on(sd, plan),
                 )
                 plan.add_step(step)
             else:
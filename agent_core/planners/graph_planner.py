@@ -1,42 +1,80 @@
 # planners/graph_planner.py
 
 import json
-import re
-
-from agent_core.evaluators import BaseEvaluator
-from agent_core.planners.base_planner import (
-    BasePlanner,
-    tool_knowledge_format,
+import logging
+
+from agent_core.evaluators import BaseEvaluator, EvaluationPolicy
+from agent_core.evaluators.pre_evaluators import (
+    RESPONSE_STRUCTURE_ERROR,
+    TOOL_ARGUMENTS_ERROR,
+    TOOL_NOT_ATTACHED_ERROR,
+    TOOL_RESPONSE_MARKER,
 )
+from agent_core.planners.base_planner import BasePlanner
 from agent_core.planners.generic_planner import GenericPlanner, Step
+from agent_core.planners.replan_guard import Escalation, ReplanGuard
 from agent_core.models.model_registry import ModelRegistry
 from agent_core.utils.context_manager import ContextManager
+from agent_core.utils.context_window import ContextRole
 from agent_core.entities.steps import Steps
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
-from langchain_core.tools import BaseTool
+from typing import TYPE_CHECKING, Any, List, Dict, Optional, Union
 
 from agent_core.utils.llm_chat import LLMChat
-from agent_core.utils.logger import get_logger
+from agent_core.utils.logger import capped, get_logger
+from agent_core.utils.budget import DegradationLevel, get_active_budget
+from agent_core.utils.events import EventType, emit_event
+from agent_core.utils.output_store import OutputRef, OutputStore
+from agent_core.utils.tool_catalog import ToolCatalog
+from agent_core.utils.tracer import get_tracer, traced
 
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
 
-@dataclass
+
+@dataclass(slots=True)
 class ExecutionResult:
-    output: str
+    # Interned text, or an OutputRef once a cold attempt has been spilled to disk
+    output: Union[str, OutputRef]
     evaluation_score: float
     timestamp: datetime
 
+    @property
+    def text(self) -> str:
+        return str(self.output)
 
-@dataclass
+
+@dataclass(slots=True)
+class ReplanRecord:
+    timestamp: datetime
+    node_id: str
+    failure_reason: str
+    llm_response: Any
+
+    def to_dict(self) -> Dict:
+        return {
+            "timestamp": self.timestamp,
+            "node_id": self.node_id,
+            "failure_reason": self.failure_reason,
+            "llm_response": self.llm_response,
+        }
+
+
+@dataclass(slots=True)
 class ReplanHistory:
-    history: List[Dict] = field(default_factory=list)
+    history: List[ReplanRecord] = field(default_factory=list)
 
-    def add_record(self, record: Dict):
+    def add_record(self, record: Union[ReplanRecord, Dict]):
+        if isinstance(record, dict):
+            record = ReplanRecord(**record)
         self.history.append(record)
 
+    def to_list(self) -> List[Dict]:
+        return [record.to_dict() for record in self.history]
 
-@dataclass
+
+@dataclass(slots=True)
 class Node:
     """
     Represents a single node in the PlanGraph.
@@ -48,7 +86,7 @@ class Node:
 
     task_use_tool: bool = False
     task_tool_name: str = ""
-    task_tool: BaseTool = None
+    task_tool: "BaseTool" = None
 
     execution_results: List[ExecutionResult] = field(default_factory=list)
     evaluation_threshold: float = 0.9
@@ -57,6 +95,7 @@ class Node:
     failed_reasons: List[str] = field(default_factory=list)
 
     task_category: str = "default"
+    result: Optional[str] = None
 
     def set_next_node(self, node: "Node"):
         if node.id not in self.next_nodes:
@@ -75,6 +114,8 @@ class PlanGraph:
     nodes: Dict[str, Node] = field(default_factory=dict)
     start_node_id: Optional[str] = None
     replan_history: ReplanHistory = field(default_factory=ReplanHistory)
+    replan_guard: ReplanGuard = field(default_factory=ReplanGuard)
+    output_store: OutputStore = field(default_factory=OutputStore)
     current_node_id: Optional[str] = None
 
     def add_node(self, node: Node):
@@ -89,10 +130,12 @@ class PlanGraph:
         return summary
 
 
-def _should_replan(node: Node) -> bool:
+def _should_replan(node: Node, max_attempts: Optional[int] = None) -> bool:
     """
     Checks if the node's last result is below threshold and attempts are exceeded.
+    'max_attempts' overrides node.max_attempts, e.g. when the run budget cuts attempts.
     """
+    max_attempts = node.max_attempts if max_attempts is None else max_attempts
     if not node.execution_results:
         return False
     last_entry = node.execution_results[-1]
@@ -103,8 +146,8 @@ def _should_replan(node: Node) -> bool:
 
     if last_score >= node.evaluation_threshold:
         return False
-    elif node.current_attempts >= node.max_attempts:
-        failure_reason = f"Node {node.id} failed to reach threshold after {node.max_attempts} attempts."
+    elif node.current_attempts >= max_attempts:
+        failure_reason = f"Node {node.id} failed to reach threshold after {max_attempts} attempts."
         node.failed_reasons.append(failure_reason)
         return True
     return False
@@ -194,6 +237,9 @@ You are an intelligent assistant helping to adjust a task execution plan represe
 **Replanning History:**
 {replan_history}
 
+**Constraints:**
+{replan_constraints}
+
 **Instructions:**
 - Analyze the Current Plan, Execution History, Failure Reason and Replanning History to decide on one of two actions:
     1. **breakdown**: Break down the task of failed node {current_node_id} into smaller subtasks.
@@ -229,6 +275,29 @@ You are an intelligent assistant helping to adjust a task execution plan represe
 }}
 
 **Note:** Ensure your response is valid JSON, without any additional text or comments.
+"""
+
+    DEFAULT_TOOL_REPAIR_PROMPT = """
+The arguments generated for tool `{tool_name}` failed validation against the tool schema.
+
+<Tool Schema>
+{tool_schema}
+</Tool Schema>
+
+<Invalid Arguments>
+{tool_arguments}
+</Invalid Arguments>
+
+<Validation Errors>
+{validation_errors}
+</Validation Errors>
+
+<Current Task>
+{task_description}
+</Current Task>
+
+Fix the invalid arguments and keep the valid ones unchanged.
+Return ONLY a pure JSON object with the corrected tool arguments. No explanatory note, no markdown.
 """
 
     def __init__(self, model_name: str = None, log_level: Optional[str] = None):
@@ -238,6 +307,14 @@ You are an intelligent assistant helping to adjust a task execution plan represe
 
         self._replan_prompt = self.DEFAULT_REPLAN_PROMPT
         self._execute_prompt = self.DEFAULT_EXECUTE_PROMPT
+        self._tool_repair_prompt = self.DEFAULT_TOOL_REPAIR_PROMPT
+
+        # Tools of the current plan; schemas are rendered once per tool set
+        self.tool_catalog = ToolCatalog()
+        # Cheap repair round trips for invalid tool arguments, before falling back to evaluator/retry
+        self.tool_repair_attempts = 1
+        # A node completed more often than this in one run means the plan is looping
+        self.max_node_visits = 5
 
     @property
     def replan_prompt(self) -> str:
@@ -257,10 +334,26 @@ You are an intelligent assistant helping to adjust a task execution plan represe
     def execute_prompt(self, value: str):
         self._execute_prompt = value
 
+    @property
+    def tool_repair_prompt(self) -> str:
+        """Prompt for repairing tool arguments which failed schema validation"""
+        return self._tool_repair_prompt
+
+    @tool_repair_prompt.setter
+    def tool_repair_prompt(self, value: str):
+        self._tool_repair_prompt = value
+
+    def spawn(self) -> "GraphPlanner":
+        planner = super().spawn()
+        planner.plan_graph = None
+        planner.context_manager = ContextManager()
+        return planner
+
+    @traced("planner.plan", planner="GraphPlanner")
     def plan(
         self,
         task: str,
-        tools: Optional[List[BaseTool]],
+        tools: Optional[List["BaseTool"]],
         knowledge: str = "",
         background: str = "",
         categories: Optional[List[str]] = None,
@@ -270,11 +363,13 @@ You are an intelligent assistant helping to adjust a task execution plan represe
         2) Convert those Steps into a PlanGraph with Node objects.
         3) Return the same Steps (for reference), but we'll actually execute nodes later.
         """
-        self.logger.info(f"GraphPlanner: Creating plan for task: {task}")
+        self.logger.info("GraphPlanner: Creating plan for task: %s", capped(task))
 
         # Use GenericPlanner internally to get the steps
         generic_planner = GenericPlanner(model_name=self.model_name, log_level=None)
         generic_planner.prompt = self.prompt
+        generic_planner.plan_cache = self.plan_cache
+        generic_planner.plan_library = self.plan_library
         plan = generic_planner.plan(
             task=task,
             tools=tools,
@@ -284,19 +379,20 @@ You are an intelligent assistant helping to adjust a task execution plan represe
         )
 
         # Convert Steps -> Node objects in a new PlanGraph
-        plan_graph = PlanGraph()
+        plan_graph = PlanGraph(
+            replan_guard=ReplanGuard(max_node_visits=self.max_node_visits)
+        )
 
         plan_graph.prompt = self._replan_prompt  # If needed for replan calls
         plan_graph.background = background
         plan_graph.knowledge = knowledge
         plan_graph.categories = categories
         plan_graph.task = task
-        plan_graph.tools = tool_knowledge_format(tools)
+
+        self.tool_catalog = ToolCatalog.of(tools)
+        plan_graph.tools = self.tool_catalog.tools_knowledge
 
         previous_node = None
-        tool_map = {}
-        if tools is not None:
-            tool_map = {tool.name: tool for tool in tools}
 
         for idx, step in enumerate(plan.steps, start=1):
             node_id = chr(65 + idx - 1)  # e.g., A, B, C...
@@ -307,7 +403,7 @@ You are an intelligent assistant helping to adjust a task execution plan represe
                 task_description=step.description,
                 task_use_tool=step.use_tool,
                 task_tool_name=step.tool_name,
-                task_tool=tool_map.get(step.tool_name) if step.tool_name else None,
+                task_tool=self.tool_catalog.get(step.tool_name),
                 next_nodes=[next_node_id] if next_node_id else [],
                 max_attempts=3,
                 task_category=step.category,
@@ -321,6 +417,7 @@ You are an intelligent assistant helping to adjust a task execution plan represe
         self.plan_graph = plan_graph
         return plan
 
+    @traced("planner.execute_plan", planner="GraphPlanner")
     def execute_plan(
         self,
         plan: Steps,
@@ -330,6 +427,7 @@ You are an intelligent assistant helping to adjust a task execution plan represe
         evaluators: dict,
         context_manager: ContextManager = None,
         background: str = "",
+        evaluation_policy: Optional[EvaluationPolicy] = None,
     ):
         """
         Executes the PlanGraph node by node.
@@ -347,6 +445,9 @@ You are an intelligent assistant helping to adjust a task execution plan represe
 
         pg = self.plan_graph
         pg.current_node_id = pg.current_node_id or pg.start_node_id
+        completed = False
+        budget = get_active_budget()
+        budget_level = DegradationLevel.NORMAL
         while pg.current_node_id:
             if pg.current_node_id not in pg.nodes:
                 self.logger.error(
@@ -354,78 +455,111 @@ You are an intelligent assistant helping to adjust a task execution plan represe
                 )
                 break
 
+            if budget is not None:
+                if budget.level() != budget_level:
+                    budget_level = budget.level()
+                    self.logger.warning(
+                        f"Run budget degraded to {budget_level.name}: {budget.snapshot()}"
+                    )
+                if budget.exhausted:
+                    self.logger.warning(
+                        "Run budget exhausted, finishing with best-effort results."
+                    )
+                    break
+
             node = pg.nodes[pg.current_node_id]
-            response = self._execute_node(node, self.model_name, task, background)
-            execution_result, details = self._evaluate_node(
-                node,
-                task,
-                response,
-                evaluators_enabled,
-                evaluators,
-                background,
-                context_manager,
+            if self.context_manager:
+                self.context_manager.current_node_id = node.id
+            emit_event(
+                EventType.NODE_STARTED,
+                node_id=node.id,
+                description=node.task_description,
+                attempt=node.current_attempts + 1,
             )
+            with get_tracer().span(
+                "graph.node",
+                node_id=node.id,
+                attempt=node.current_attempts + 1,
+                category=node.task_category,
+            ) as node_span:
+                response = pg.output_store.intern(
+                    self._execute_node(node, self.model_name, task, background)
+                )
+                execution_result, details = self._evaluate_node(
+                    node,
+                    task,
+                    response,
+                    evaluators_enabled,
+                    evaluators,
+                    background,
+                    context_manager,
+                    evaluation_policy,
+                )
+                node_span.set_attribute("score", execution_result.evaluation_score)
             self.logger.info(
-                f"Node {node.id} execution score: {execution_result.evaluation_score}"
+                "Node %s execution score: %s", node.id, execution_result.evaluation_score
             )
 
             if execution_result.evaluation_score >= node.evaluation_threshold:
                 if self.context_manager:
-                    attempt = "|".join(str(i) for i in range(node.current_attempts + 1))
-                    self.context_manager.context = {
-                        k: v
-                        for k, v in self.context_manager.context.items()
-                        if not re.match(
-                            f"Previous Step {node.id}(.([0-9])*)* Failed Attempt ({attempt})?",
-                            k,
-                        )
-                    }
+                    self.context_manager.remove_failed_attempts(node.id)
 
                     # Add node info to context
-                    key = f"Previous Step {node.id}"
-                    if self.context_manager:
-                        self.context_manager.add_context(
-                            key,
-                            f"""
+                    self.context_manager.add_node_result(
+                        node.id,
+                        f"""
 Task description: {node.task_description}
 Task response: {response}
                         """,
-                        )
-                    # Keep the raw response in node's execution_results for reference
-                    node.execution_results.append(response)
+                    )
 
                 node.result = response
                 execution_history.add_step(
                     Step(
                         name=node.id,
                         description=node.task_description,
-                        result=str(response),
+                        result=response,
                     )
                 )
+                self._spill_attempts(node, keep_last=True)
+                if pg.replan_guard.record_visit(node.id):
+                    self.logger.error(
+                        f"Plan is looping ({pg.replan_guard.last_reason}), aborting with partial result."
+                    )
+                    break
                 if node.next_nodes:
                     pg.current_node_id = node.next_nodes[0]
                 else:
                     self.logger.info("Plan execution completed successfully.")
+                    completed = True
                     break
+            elif budget is not None and budget.exhausted:
+                self._record_best_effort(node, execution_history)
+                self.logger.warning(
+                    f"Run budget exhausted at Node {node.id}, finishing with best-effort results."
+                )
+                break
             else:
-                if _should_replan(node):
-
-                    attempt = "|".join(str(i) for i in range(node.current_attempts + 1))
-                    self.context_manager.context = {
-                        k: v
-                        for k, v in self.context_manager.context.items()
-                        if not re.match(
-                            f"Previous Step {node.id}(.([0-9])*)* Failed Attempt ({attempt})?",
-                            k,
-                        )
-                    }
+                max_attempts = (
+                    budget.max_attempts(node.max_attempts) if budget else node.max_attempts
+                )
+                if _should_replan(node, max_attempts):
+                    if self.context_manager:
+                        self.context_manager.remove_failed_attempts(node.id)
 
                     self.logger.warning(f"Replanning needed at Node {node.id}")
                     failure_info = self.prepare_failure_info(node, details)
-                    replan_response = self.call_llm_for_replan(pg, failure_info)
-                    adjustments = LLMChat(self.model_name).parse_llm_response(
-                        replan_response
-                    )
+                    self._spill_attempts(node, keep_last=False)
+                    with get_tracer().span("graph.replan", node_id=node.id) as replan_span:
+                        replan_response = self.call_llm_for_replan(pg, failure_info)
+                        adjustments = LLMChat(self.model_name).parse_llm_response(
+                            replan_response
+                        )
+                        if adjustments:
+                            replan_span.set_attributes(
+                                action=str(adjustments.get("action")),
+                                restart_node_id=str(adjustments.get("restart_node_id")),
+                            )
                     if adjustments:
                         pg.replan_history.add_record(
                             {
@@ -440,9 +574,34 @@ Task response: {response}
                             }
                         )
                         apply_adjustments_to_plan(self.plan_graph, node.id, adjustments)
-                        self.logger.info(
-                            f"New plan after adjusted: {self.plan_graph.nodes}"
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            # Rendered now: the record is formatted later, on the logging thread,
+                            # while the plan keeps changing
+                            self.logger.debug(
+                                "New plan after adjusted: %s", capped(str(self.plan_graph.nodes))
+                            )
+                        emit_event(
+                            EventType.REPLAN_APPLIED,
+                            node_id=node.id,
+                            action=adjustments.get("action"),
+                            restart_node_id=adjustments.get("restart_node_id"),
+                            plan=pg.summarize_plan(),
                         )
+                        escalation = pg.replan_guard.record_adjustment(
+                            pg, node.id, adjustments
+                        )
+                        if escalation >= Escalation.ABORT:
+                            self.logger.error(
+                                f"Replan loop at Node {node.id} ({pg.replan_guard.last_reason}), "
+                                "aborting with partial result."
+                            )
+                            self._record_best_effort(node, execution_history)
+                            break
+                        if escalation > Escalation.NONE:
+                            self.logger.warning(
+                                f"Replan loop at Node {node.id} ({pg.replan_guard.last_reason}), "
+                                f"escalated to {escalation.name}."
+                            )
                         restart_node_id = self.determine_restart_node(adjustments)
                         self.cleanup_context(
                             pg.current_node_id, adjustments.get("restart_node_id")
@@ -460,18 +619,24 @@ Task response: {response}
                     # Retry the same node
                     self.logger.warning(f"Retrying Node {node.id}")
                     # remove node info from context
-                    key = f"Previous Step {node.id}"
                     if self.context_manager:
-                        self.context_manager.remove_context(key)
-                        key = f"Previous Step {node.id} Failed Attempt {node.current_attempts}"
-                        self.context_manager.add_context(
-                            key,
+                        self.context_manager.remove_context(
+                            ContextManager.result_key(node.id)
+                        )
+                        self.context_manager.add_failed_attempt(
+                            node.id,
+                            node.current_attempts,
                             f"""
 Task response: {response}
                             """,
                         )
 
                     continue
+
+        # Plans which were evaluated and passed without any replan are kept as examples for similar tasks
+        if evaluators_enabled and completed and not pg.replan_history.history \
+                and self.plan_library is not None:
+            self.plan_library.add(task, plan)
         return "Task execution completed using GraphPlanner."
 
     def _execute_node(
@@ -480,7 +645,7 @@ Task response: {response}
         """
         Build prompt + call the LLM. If 'use_tool', invoke the tool.
         """
-        self.logger.info(f"Executing Node {node.id}: {node.task_description}")
+        self.logger.info("Executing Node %s: %s", node.id, capped(node.task_description))
         node.current_attempts += 1
 
         tool_description = ""
@@ -490,7 +655,7 @@ Task response: {response}
                     f"Node {node.id} indicates 'use_tool' but 'task_tool' is None. Skipping tool usage details."
                 )
             elif hasattr(node.task_tool, "args_schema"):
-                tool_description = str(node.task_tool.args_schema.model_json_schema())
+                tool_description = self.tool_catalog.schema(node.task_tool)
             else:
                 self.logger.warning(
                     f"Node {node.id} indicates 'use_tool' but the provided tool lacks 'args_schema'."
@@ -499,7 +664,7 @@ Task response: {response}
 
         # Node doesn't store a custom prompt, so we use self._execute_prompt
         final_prompt = self._execute_prompt.format(
-            context=self.context_manager.context_to_str(),
+            context=self.context_manager.render_for(ContextRole.EXECUTE, node.id),
             task=task,
             background=background,
             task_description=f"<Step {node.id}>\nTask Desc: {node.task_description}\n</Step {node.id}>",
@@ -515,30 +680,86 @@ Task response: {response}
             if "use_tool" in data:
                 if data["use_tool"]:
                     if node.task_tool is not None:
-                        try:
-                            tool_response = node.task_tool.invoke(
-                                data["tool_arguments"]
-                            )
-                            response = (
-                                f"task tool description: {node.task_tool.description}\n"
-                                f"task tool response : {tool_response}"
-                            )
-                        except Exception as e:
-                            response = "Incorrect tool arguments and unexpected result when invoke the tool."
+                        response = self._invoke_tool(
+                            node, model_name, data.get("tool_arguments")
+                        )
                     else:
-                        response = "Tool usage was requested, but no tool is attached to this node."
+                        response = TOOL_NOT_ATTACHED_ERROR
                 else:
                     response = data["response"]
             else:
-                response = "Incorrect and unexpected structure in response."
+                response = RESPONSE_STRUCTURE_ERROR
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse JSON: {e}")
-            self.logger.error(f"Raw LLM response was: {cleaned}")
+            self.logger.error("Raw LLM response was: %s", capped(cleaned))
             raise ValueError("Invalid JSON format in planner response.")
 
-        self.logger.info(f"Response:\n {response}")
+        self.logger.info("Response:\n %s", capped(response))
         return response
 
+    def _invoke_tool(self, node: Node, model_name: str, tool_arguments) -> str:
+        """
+        Validate the tool arguments locally before invocation.
+        Invalid arguments get a targeted repair round trip instead of a full evaluate-and-retry cycle.
+        """
+        tool = node.task_tool
+        valid, errors = self.tool_catalog.validate_arguments(tool, tool_arguments)
+        repair_round = 0
+        while not valid and repair_round < self.tool_repair_attempts:
+            repair_round += 1
+            self.logger.warning(
+                f"Node {node.id} tool arguments failed validation, repair round {repair_round}:\n{errors}"
+            )
+            with get_tracer().span(
+                "tool.repair", tool=tool.name, node_id=node.id, round=repair_round
+            ):
+                tool_arguments = self._repair_tool_arguments(
+                    node, model_name, tool_arguments, errors
+                )
+            if tool_arguments is None:
+                break
+            valid, errors = self.tool_catalog.validate_arguments(tool, tool_arguments)
+
+        if not valid:
+            emit_event(EventType.TOOL_RESULT, node_id=node.id, tool=tool.name, error=errors)
+            return f"{TOOL_ARGUMENTS_ERROR}\nValidation errors:\n{errors}"
+        emit_event(
+            EventType.TOOL_CALLED, node_id=node.id, tool=tool.name, arguments=tool_arguments
+        )
+        try:
+            with get_tracer().span("tool.invoke", tool=tool.name, node_id=node.id):
+                tool_response = tool.invoke(tool_arguments)
+        except Exception as e:
+            self.logger.error(f"Node {node.id} tool '{tool.name}' invocation failed: {e}")
+            emit_event(EventType.TOOL_RESULT, node_id=node.id, tool=tool.name, error=str(e))
+            return f"{TOOL_ARGUMENTS_ERROR}\nTool error: {e}"
+        emit_event(EventType.TOOL_RESULT, node_id=node.id, tool=tool.name, result=tool_response)
+        return (
+            f"task tool description: {tool.description}\n"
+            f"{TOOL_RESPONSE_MARKER} {tool_response}"
+        )
+
+    def _repair_tool_arguments(
+        self, node: Node, model_name: str, tool_arguments, validation_errors: str
+    ) -> Optional[Dict]:
+        final_prompt = self._tool_repair_prompt.format(
+            tool_name=node.task_tool.name,
+            tool_schema=self.tool_catalog.schema(node.task_tool),
+            tool_arguments=json.dumps(tool_arguments, default=str),
+            validation_errors=validation_errors,
+            task_description=node.task_description,
+        )
+        response = ModelRegistry.get_model(model_name).process(final_prompt)
+        cleaned = response.replace("```json", "").replace("```", "").strip()
+        try:
+            repaired = json.loads(cleaned)
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Failed to parse repaired tool arguments: {e}")
+            return None
+        if isinstance(repaired, dict) and isinstance(repaired.get("tool_arguments"), dict):
+            repaired = repaired["tool_arguments"]
+        return repaired
+
     def _evaluate_node(
         self,
         node: Node,
@@ -548,6 +769,7 @@ Task response: {response}
         evaluators: Dict[str, BaseEvaluator],
         background: str,
         context_manager: ContextManager,
+        evaluation_policy: Optional[EvaluationPolicy] = None,
     ):
         """
         evaluate the node output using agent's evaluator if enabled.
@@ -572,12 +794,48 @@ Task response: {response}
                 output=result, evaluation_score=1.0, timestamp=datetime.now()
             )
             node.execution_results.append(execution_result)
-            return execution_result
+            return execution_result, ""
 
-        evaluator_result = evaluator.evaluate(
-            root_task, node.task_description, result, background, context_manager
+        # The local checks are free, so only the LLM evaluation can be skipped below
+        evaluator_result = evaluator.pre_evaluate(node.task_description, result)
+        tool_name = node.task_tool_name if node.task_use_tool else None
+        if evaluator_result is None:
+            budget = get_active_budget()
+            if budget is not None and budget.should_skip_evaluation(node.task_category):
+                self.logger.info(
+                    f"Run budget is tight, evaluation skipped for low-risk Node {node.id} ({node.task_category})."
+                )
+                execution_result = ExecutionResult(
+                    output=result, evaluation_score=1.0, timestamp=datetime.now()
+                )
+                node.execution_results.append(execution_result)
+                return execution_result, ""
+
+            if evaluation_policy is not None and not evaluation_policy.should_evaluate(
+                node.task_category, tool_name
+            ):
+                self.logger.info(f"Evaluation of Node {node.id} skipped by evaluation policy.")
+                execution_result = ExecutionResult(
+                    output=result, evaluation_score=1.0, timestamp=datetime.now()
+                )
+                node.execution_results.append(execution_result)
+                return execution_result, ""
+
+            evaluator_result = evaluator.evaluate(
+                root_task, node.task_description, result, background, context_manager
+            )
+        numeric_score = float(evaluator_result.score) / evaluator.max_score
+        emit_event(
+            EventType.EVALUATION_SCORED,
+            node_id=node.id,
+            attempt=node.current_attempts,
+            decision=evaluator_result.decision,
+            score=numeric_score,
         )
-        numeric_score = float(evaluator_result.score) / 40.0
+        if evaluation_policy is not None:
+            evaluation_policy.record(
+                node.task_category, tool_name, numeric_score >= node.evaluation_threshold
+            )
         execution_result = ExecutionResult(
             output=result, evaluation_score=numeric_score, timestamp=datetime.now()
         )
@@ -603,14 +861,16 @@ Task response: {response}
                 }
                 for n in pg.nodes.values()
             ],
-            "replan_history": pg.replan_history.history,
+            "replan_history": pg.replan_history.to_list(),
             "evaluator": details,
         }
 
     def call_llm_for_replan(self, plan_graph: PlanGraph, failure_info: Dict) -> str:
         plan_summary = plan_graph.summarize_plan()
         context_str = (
-            self.context_manager.context_to_str() if self.context_manager else ""
+            self.context_manager.render_for(ContextRole.REPLAN, plan_graph.current_node_id)
+            if self.context_manager
+            else ""
         )
 
         final_prompt = plan_graph.prompt.format(
@@ -628,14 +888,56 @@ Task response: {response}
             execution_history=failure_info["execution_history"],
             failure_reason=failure_info["failure_reason"],
             replan_history=failure_info["replan_history"],
+            replan_constraints=self._replan_constraints(),
             current_node_id=plan_graph.current_node_id,
         )
 
         self.logger.info("Calling model for replan instructions...")
         response = self._model.process(final_prompt)
-        self.logger.info(f"Replan response: {response}")
+        self.logger.info("Replan response: %s", capped(response))
         return response
 
+    def _replan_constraints(self) -> str:
+        constraints = list(self.plan_graph.replan_guard.replan_constraints())
+        budget = get_active_budget()
+        if budget is not None and budget.prefer_breakdown:
+            constraints.append(
+                "- The run budget is nearly exhausted: choose **breakdown** of the failed node, "
+                "do not go back to a previous node."
+            )
+        return "\n".join(constraints) if constraints else "None"
+
+    def _record_best_effort(self, node: Node, execution_history: Steps):
+        """
+        Keep the best attempt of a node which could not reach its threshold within the run budget.
+        """
+        attempts = [
+            er for er in node.execution_results if isinstance(er, ExecutionResult)
+        ]
+        if not attempts:
+            return
+        best = max(attempts, key=lambda er: er.evaluation_score)
+        node.result = best.text
+        execution_history.add_step(
+            Step(
+                name=node.id,
+                description=node.task_description,
+                result=node.result,
+            )
+        )
+
+    def _spill_attempts(self, node: Node, keep_last: bool):
+        """
+        Move outputs of attempts which are no longer needed in memory (earlier attempts of a node
+        that passed, or all attempts of a node being replanned) to the run's spill directory.
+        """
+        attempts = node.execution_results[:-1] if keep_last else node.execution_results
+        for execution_result in attempts:
+            if isinstance(execution_result, ExecutionResult):
+                execution_result.output = self.plan_graph.output_store.spill(
+                    execution_result.output
+                )
+
     def determine_restart_node(self, adjustments: str) -> Optional[str]:
         # adjustments = json.loads(llm_response)
         action = adjustments.get("action")
@@ -679,12 +981,8 @@ Task response: {response}
             return None
 
     def cleanup_context(self, current_node_id, restart_node_id):
-        input_text = self.context_manager.context_to_str()
-        nodes_to_remove = self.context_manager.identify_context_key(
-            input_text, current_node_id, restart_node_id
-        )
-        for node in nodes_to_remove:
-            self.context_manager.remove_context(node)
+        if self.context_manager:
+            self.context_manager.remove_node_range(restart_node_id, current_node_id)
 
 
 def apply_adjustments_to_plan(
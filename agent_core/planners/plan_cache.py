@@ -0,0 +1,155 @@
+# planners/plan_cache.py
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from agent_core.entities.steps import Step, Steps
+
+# Entities extracted from a task, most specific first
+ENTITY_PATTERNS = [
+    ("uuid", r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"),
+    (
+        "timestamp",
+        r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?",
+    ),
+    ("date", r"\b\d{4}-\d{2}-\d{2}\b"),
+    ("epoch", r"\b\d{13}\b|\b\d{10}\b"),
+    ("hex", r"\b0x[0-9a-fA-F]+\b|\b(?=[0-9a-fA-F]*[a-fA-F])(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{12,}\b"),
+    ("id", r"\b\d{3,}\b"),
+]
+
+
+def _placeholder(name: str) -> str:
+    return f"<<{name}>>"
+
+
+class TaskNormalizer:
+    """
+    Turn a task into a template plus parameters, e.g.
+    "why did event id 10000 in IE fail" -> "why did event id <<id_0>> in <<component_0>> fail", ["10000", "IE"].
+    """
+
+    def __init__(self, component_names: Iterable[str] = ()):
+        patterns = list(ENTITY_PATTERNS)
+        names = sorted({n for n in component_names if n}, key=len, reverse=True)
+        if names:
+            patterns.insert(
+                0, ("component", r"(?<!\w)(?:" + "|".join(map(re.escape, names)) + r")(?!\w)")
+            )
+        self._pattern = re.compile(
+            "|".join(f"(?P<{kind}>{pattern})" for kind, pattern in patterns)
+        )
+
+    def normalize(self, task: str) -> Tuple[str, List[Tuple[str, str]]]:
+        """Return (template, [(placeholder name, value), ...]) in order of first appearance."""
+        params = {}
+        counters = {}
+
+        def replace(match):
+            value = match.group(0)
+            if value not in params:
+                kind = match.lastgroup
+                params[value] = f"{kind}_{counters.get(kind, 0)}"
+                counters[kind] = counters.get(kind, 0) + 1
+            return _placeholder(params[value])
+
+        template = self._pattern.sub(replace, task)
+        return template, [(name, value) for value, name in params.items()]
+
+
+def _substitute(text: Optional[str], replacements: List[Tuple[str, str]]) -> Optional[str]:
+    if not text:
+        return text
+    for old, new in replacements:
+        text = text.replace(old, new)
+    return text
+
+
+def _parameterize(text: Optional[str], params: List[Tuple[str, str]]) -> Optional[str]:
+    if not text:
+        return text
+    for name, value in sorted(params, key=lambda p: len(p[1]), reverse=True):
+        text = re.sub(rf"(?<!\w){re.escape(value)}(?!\w)", _placeholder(name), text)
+    return text
+
+
+class PlanCache:
+    """
+    LRU cache of planner output keyed on the normalized task.
+    Structurally identical tasks reuse the stored Steps with their parameters substituted.
+    The planning scope (prompt, tools, knowledge, background, categories, model) is part of the key,
+    so changing any of them misses the old entries, and they age out of the LRU.
+    """
+
+    def __init__(self, max_size: int = 256, component_names: Iterable[str] = ()):
+        self.max_size = max_size
+        self.normalizer = TaskNormalizer(component_names)
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, List[dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def scope_key(*parts) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode())
+            digest.update(b"\x1e")
+        return digest.hexdigest()
+
+    def _key(self, template: str, scope: str) -> str:
+        return hashlib.sha256(f"{scope}\x1e{template}".encode()).hexdigest()
+
+    def get(self, task: str, scope: str) -> Optional[Steps]:
+        template, params = self.normalizer.normalize(task)
+        key = self._key(template, scope)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        replacements = [(_placeholder(name), value) for name, value in params]
+        plan = Steps()
+        for step_data in entry:
+            step_data = dict(step_data)
+            step_data["name"] = _substitute(step_data["name"], replacements)
+            step_data["description"] = _substitute(step_data["description"], replacements)
+            if step_data.get("depends_on") is not None:
+                step_data["depends_on"] = [
+                    _substitute(name, replacements) for name in step_data["depends_on"]
+                ]
+            plan.add_step(Step(**step_data))
+        return plan
+
+    def put(self, task: str, scope: str, plan: Steps):
+        template, params = self.normalizer.normalize(task)
+        entry = []
+        for step in plan.steps:
+            step_data = step.to_dict()
+            step_data["name"] = _parameterize(step_data["name"], params)
+            step_data["description"] = _parameterize(step_data["description"], params)
+            if step_data["depends_on"] is not None:
+                step_data["depends_on"] = [
+                    _parameterize(name, params) for name in step_data["depends_on"]
+                ]
+            entry.append(step_data)
+        key = self._key(template, scope)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """Drop all entries, e.g. after the planner prompt or a tool implementation changed."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
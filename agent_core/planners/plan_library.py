@@ -0,0 +1,202 @@
+# planners/plan_library.py
+
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from agent_core.entities.steps import Steps
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def shingles(text: str, size: int = 2) -> Set[str]:
+    """Word n-grams of the lowercased text; single words for very short texts."""
+    words = re.findall(r"\w+", text.lower())
+    if len(words) < size:
+        return set(words)
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHash:
+    """
+    MinHash signatures, whose agreement rate estimates the Jaccard similarity of two shingle sets.
+    """
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        self.num_perm = num_perm
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, items: Set[str]) -> Tuple[int, ...]:
+        hashes = [
+            int.from_bytes(hashlib.blake2b(item.encode(), digest_size=4).digest(), "little")
+            for item in items
+        ]
+        if not hashes:
+            return tuple([_MAX_HASH] * self.num_perm)
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._permutations
+        )
+
+    @staticmethod
+    def similarity(sig1: Tuple[int, ...], sig2: Tuple[int, ...]) -> float:
+        return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+class LSHIndex:
+    """
+    Banded locality sensitive hashing over MinHash signatures: similar signatures share a bucket
+    in at least one band with high probability.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands.")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[Tuple[int, ...], Set[int]]] = [
+            defaultdict(set) for _ in range(bands)
+        ]
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def add(self, key: int, signature: Tuple[int, ...]):
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band][band_key].add(key)
+
+    def remove(self, key: int, signature: Tuple[int, ...]):
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band][band_key].discard(key)
+
+    def candidates(self, signature: Tuple[int, ...]) -> Set[int]:
+        found = set()
+        for band, band_key in self._band_keys(signature):
+            found |= self._buckets[band].get(band_key, set())
+        return found
+
+
+def _step_to_plan_json(step) -> Dict:
+    data = {
+        "step_name": step.name,
+        "step_description": step.description,
+        "use_tool": bool(step.use_tool),
+        "step_category": step.category,
+    }
+    if step.tool_name:
+        data["tool_name"] = step.tool_name
+    if step.depends_on is not None:
+        data["depends_on"] = step.depends_on
+    return data
+
+
+class PlanLibrary:
+    """
+    Successful plans with their tasks, indexed locally with MinHash/LSH.
+    The nearest past plans are used as planner examples for new tasks.
+    When 'path' is given, plans are persisted as JSON lines and loaded on creation.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        examples: int = 2,
+        min_similarity: float = 0.2,
+        num_perm: int = 64,
+        bands: int = 16,
+    ):
+        self.path = path
+        self.examples = examples
+        self.min_similarity = min_similarity
+        self._minhash = MinHash(num_perm)
+        self._index = LSHIndex(num_perm, bands)
+        self._records: List[Optional[Dict]] = []
+        self._signatures: List[Tuple[int, ...]] = []
+        self._by_task: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self._insert(record["task"], record["steps"])
+
+    def __len__(self):
+        return len(self._by_task)
+
+    def _insert(self, task: str, steps: List[Dict]):
+        signature = self._minhash.signature(shingles(task))
+        previous = self._by_task.get(task)
+        if previous is not None:
+            self._index.remove(previous, self._signatures[previous])
+            self._records[previous] = None
+        key = len(self._records)
+        self._records.append({"task": task, "steps": steps})
+        self._signatures.append(signature)
+        self._by_task[task] = key
+        self._index.add(key, signature)
+
+    def add(self, task: str, plan: Steps):
+        """
+        Store a plan which was evaluated and passed without replans. Storing the same plan again
+        is a no-op; a new plan for a stored task replaces it, rewriting the file.
+        """
+        steps = [_step_to_plan_json(step) for step in plan.steps]
+        if not steps:
+            return
+        with self._lock:
+            previous = self._by_task.get(task)
+            if previous is not None and self._records[previous]["steps"] == steps:
+                return
+            self._insert(task, steps)
+            if not self.path:
+                return
+            if previous is None:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"task": task, "steps": steps}) + "\n")
+            else:
+                self._rewrite()
+
+    def _rewrite(self):
+        """Write the current records to the file, dropping the replaced ones."""
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            for record in self._records:
+                if record is not None:
+                    f.write(json.dumps(record) + "\n")
+        os.replace(temporary, self.path)
+
+    def similar(self, task: str, k: Optional[int] = None) -> List[Tuple[float, Dict]]:
+        """Top-k stored records by estimated similarity to the task, as (similarity, record)."""
+        k = self.examples if k is None else k
+        signature = self._minhash.signature(shingles(task))
+        with self._lock:
+            scored = [
+                (MinHash.similarity(signature, self._signatures[key]), self._records[key])
+                for key in self._index.candidates(signature)
+                if self._records[key] is not None
+            ]
+        scored = [item for item in scored if item[0] >= self.min_similarity]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return scored[:k]
+
+    def format_examples(self, task: str, k: Optional[int] = None) -> str:
+        """Planner examples built from the nearest past plans, or "" when there are none."""
+        examples = []
+        for _, record in self.similar(task, k):
+            examples.append(
+                f"Task: {record['task']}\n"
+                f"{json.dumps({'steps': record['steps']}, indent=4)}"
+            )
+        return "\n\n".join(examples)
@@ -0,0 +1,139 @@
+# planners/replan_guard.py
+
+import hashlib
+from collections import Counter
+from enum import IntEnum
+from typing import Dict, List, Optional
+
+
+class Escalation(IntEnum):
+    """
+    Response to a detected replan loop, raised one level each time the loop shows up again.
+    """
+
+    NONE = 0
+    FORCE_BREAKDOWN = 1
+    PENALIZE_REPLAN = 2
+    ABORT = 3
+
+
+def plan_fingerprint(plan_graph, failed_node_id: str, restart_node_id: Optional[str]) -> str:
+    """
+    Hash of the plan structure and where execution stands after an adjustment.
+    Two adjustments with the same fingerprint put the run back into the same state.
+    """
+    digest = hashlib.sha1()
+    for node_id in sorted(plan_graph.nodes):
+        node = plan_graph.nodes[node_id]
+        digest.update(
+            f"{node.id}\x1f{node.task_description}\x1f{','.join(node.next_nodes)}\x1e".encode()
+        )
+    digest.update(f"failed={failed_node_id}\x1frestart={restart_node_id}".encode())
+    return digest.hexdigest()
+
+
+def find_cycle(plan_graph) -> Optional[List[str]]:
+    """
+    Return the node ids of a cycle reachable through next_nodes, or None if the graph is acyclic.
+    """
+    nodes = plan_graph.nodes
+    visiting, done = set(), set()
+    for root in nodes:
+        if root in done:
+            continue
+        path = [root]
+        iterators = [iter(nodes[root].next_nodes)]
+        visiting.add(root)
+        while iterators:
+            next_id = next(iterators[-1], None)
+            if next_id is None:
+                finished = path.pop()
+                iterators.pop()
+                visiting.discard(finished)
+                done.add(finished)
+                continue
+            if next_id not in nodes or next_id in done:
+                continue
+            if next_id in visiting:
+                return path[path.index(next_id):] + [next_id]
+            path.append(next_id)
+            iterators.append(iter(nodes[next_id].next_nodes))
+            visiting.add(next_id)
+    return None
+
+
+class ReplanGuard:
+    """
+    Detects replan storms (adjustments that reproduce an earlier state), cycles through next_nodes
+    and nodes executed over and over, and decides how GraphPlanner should escalate.
+    """
+
+    def __init__(self, max_node_visits: int = 5):
+        self.max_node_visits = max_node_visits
+        self.escalation = Escalation.NONE
+        self.reasons: List[str] = []
+        self._fingerprints: Counter = Counter()
+        self._node_visits: Counter = Counter()
+        self._repeated_adjustments: List[Dict] = []
+
+    def record_adjustment(self, plan_graph, failed_node_id: str, adjustments: Dict) -> Escalation:
+        """
+        Call after an adjustment is applied to the plan. Returns the current escalation level.
+        """
+        restart_node_id = adjustments.get("restart_node_id")
+        fingerprint = plan_fingerprint(plan_graph, failed_node_id, restart_node_id)
+        self._fingerprints[fingerprint] += 1
+
+        reason = None
+        if self._fingerprints[fingerprint] > 1:
+            reason = f"adjustment at Node {failed_node_id} reproduced an earlier plan state"
+        cycle = find_cycle(plan_graph)
+        if cycle:
+            reason = f"plan contains a cycle: {' -> '.join(cycle)}"
+        if (
+            self.escalation >= Escalation.FORCE_BREAKDOWN
+            and adjustments.get("action") != "breakdown"
+        ):
+            reason = f"'{adjustments.get('action')}' chosen at Node {failed_node_id} although breakdown was required"
+
+        if reason:
+            self.escalation = Escalation(min(self.escalation + 1, Escalation.ABORT))
+            self.reasons.append(reason)
+            self._repeated_adjustments.append(
+                {
+                    "node_id": failed_node_id,
+                    "action": adjustments.get("action"),
+                    "restart_node_id": restart_node_id,
+                }
+            )
+        return self.escalation
+
+    def record_visit(self, node_id: str) -> bool:
+        """
+        Count a completed execution of the node. Returns True once the node is visited too often.
+        """
+        self._node_visits[node_id] += 1
+        if self._node_visits[node_id] > self.max_node_visits:
+            self.escalation = Escalation.ABORT
+            self.reasons.append(
+                f"Node {node_id} executed {self._node_visits[node_id]} times"
+            )
+            return True
+        return False
+
+    @property
+    def last_reason(self) -> str:
+        return self.reasons[-1] if self.reasons else ""
+
+    def replan_constraints(self) -> List[str]:
+        constraints = []
+        if self.escalation >= Escalation.FORCE_BREAKDOWN:
+            constraints.append(
+                f"- A replan loop was detected ({self.last_reason}): you MUST choose **breakdown** of the failed node."
+            )
+        if self.escalation >= Escalation.PENALIZE_REPLAN:
+            constraints.append(
+                "- These adjustments already led back to the same failure, do NOT repeat them "
+                f"(another repeat aborts the run): {self._repeated_adjustments}"
+            )
+        return constraints
@@ -0,0 +1,135 @@
+# utils/budget.py
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Optional, Tuple
+
+
+class DegradationLevel(IntEnum):
+    """
+    How far a run has degraded to stay within its budget. Levels are cumulative and applied in order.
+    """
+
+    NORMAL = 0
+    CUT_ATTEMPTS = 1
+    SKIP_LOW_RISK_EVALUATION = 2
+    PREFER_BREAKDOWN = 3
+    BEST_EFFORT = 4
+
+
+@dataclass
+class RunBudget:
+    """
+    Run-level limits. Any limit left as None is not enforced.
+    'degradation_thresholds' is the consumed fraction of the tightest limit at which
+    CUT_ATTEMPTS, SKIP_LOW_RISK_EVALUATION, PREFER_BREAKDOWN and BEST_EFFORT start.
+    """
+
+    deadline_seconds: Optional[float] = None
+    max_tokens: Optional[int] = None
+    max_llm_calls: Optional[int] = None
+    degradation_thresholds: Tuple[float, float, float, float] = (0.5, 0.7, 0.85, 1.0)
+    low_risk_categories: Tuple[str, ...] = ("writing", "summarization")
+    degraded_max_attempts: int = 1
+
+
+class BudgetTracker:
+    """
+    Live usage of a RunBudget. Model calls made while the tracker is active are recorded automatically.
+    """
+
+    def __init__(self, budget: RunBudget):
+        self.budget = budget
+        self.started_at = time.monotonic()
+        self.tokens_used = 0
+        self.llm_calls = 0
+        self._lock = threading.Lock()
+
+    def record_llm_call(self, prompt_tokens: int, completion_tokens: int):
+        with self._lock:
+            self.llm_calls += 1
+            self.tokens_used += prompt_tokens + completion_tokens
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def pressure(self) -> float:
+        """Consumed fraction of the tightest limit (0.0 when no limit is set)."""
+        fractions = [0.0]
+        if self.budget.deadline_seconds:
+            fractions.append(self.elapsed_seconds / self.budget.deadline_seconds)
+        if self.budget.max_tokens:
+            fractions.append(self.tokens_used / self.budget.max_tokens)
+        if self.budget.max_llm_calls:
+            fractions.append(self.llm_calls / self.budget.max_llm_calls)
+        return max(fractions)
+
+    def level(self) -> DegradationLevel:
+        pressure = self.pressure()
+        level = DegradationLevel.NORMAL
+        for candidate, threshold in zip(
+            list(DegradationLevel)[1:], self.budget.degradation_thresholds
+        ):
+            if pressure >= threshold:
+                level = candidate
+        return level
+
+    @property
+    def exhausted(self) -> bool:
+        return self.level() >= DegradationLevel.BEST_EFFORT
+
+    def max_attempts(self, node_max_attempts: int) -> int:
+        if self.level() >= DegradationLevel.CUT_ATTEMPTS:
+            return min(node_max_attempts, self.budget.degraded_max_attempts)
+        return node_max_attempts
+
+    def should_skip_evaluation(self, category: str) -> bool:
+        return (
+            self.level() >= DegradationLevel.SKIP_LOW_RISK_EVALUATION
+            and category in self.budget.low_risk_categories
+        )
+
+    @property
+    def prefer_breakdown(self) -> bool:
+        return self.level() >= DegradationLevel.PREFER_BREAKDOWN
+
+    def snapshot(self) -> dict:
+        return {
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "tokens_used": self.tokens_used,
+            "llm_calls": self.llm_calls,
+            "pressure": round(self.pressure(), 3),
+            "level": self.level().name,
+        }
+
+
+_active_budget: ContextVar[Optional[BudgetTracker]] = ContextVar(
+    "agent_core_active_budget", default=None
+)
+
+
+def get_active_budget() -> Optional[BudgetTracker]:
+    """The budget tracker of the run executing in the current context, if any."""
+    return _active_budget.get()
+
+
+@contextmanager
+def activate_budget(budget: Optional[RunBudget]):
+    """
+    Track the given budget for everything executed inside the block.
+    Yields the BudgetTracker, or None when no budget is given.
+    """
+    if budget is None:
+        yield None
+        return
+    tracker = BudgetTracker(budget)
+    token = _active_budget.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _active_budget.reset(token)
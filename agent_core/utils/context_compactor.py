@@ -0,0 +1,122 @@
+# utils/context_compactor.py
+
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Optional
+
+from agent_core.agent_basic import AgentBasic
+from agent_core.utils.context_manager import ContextEntry, ContextManager, EntryKind
+from agent_core.utils.events import activate_stream
+
+
+class ContextCompactor(AgentBasic):
+    """
+    Summarizes aged or oversized node results of a ContextManager in the background.
+
+    After each new node result, entries at least 'max_age_steps' results old or over
+    'max_tokens' are queued to a single worker thread, which summarizes them with the
+    (preferably cheap) model and swaps the summary in; node execution never waits for it.
+    The originals are kept in the ContextManager (see ContextManager.original).
+    """
+
+    DEFAULT_SUMMARY_PROMPT = """
+Summarize the following result of a previous task step for use as context in later steps.
+Keep every fact, number, name, identifier, decision and error that later steps may need; drop repetition and formatting.
+Respond with the summary only.
+
+<{key}>
+{value}
+</{key}>
+"""
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        max_age_steps: int = 3,
+        max_tokens: int = 1000,
+        log_level: Optional[str] = None,
+    ):
+        super().__init__(self.__class__.__name__, model_name, log_level)
+        self.max_age_steps = max_age_steps
+        self.max_tokens = max_tokens
+        self._summary_prompt = self.DEFAULT_SUMMARY_PROMPT
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="context-compactor")
+        self._pending: Dict[tuple, Future] = {}
+        # Entry values whose summary failed or was not shorter, by job; not retried while unchanged
+        self._skipped: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def summary_prompt(self) -> str:
+        return self._summary_prompt
+
+    @summary_prompt.setter
+    def summary_prompt(self, value: str):
+        self._summary_prompt = value
+
+    def attach(self, context_manager: ContextManager) -> ContextManager:
+        context_manager.compactor = self
+        return context_manager
+
+    def _is_due(self, context_manager: ContextManager, entry: ContextEntry) -> bool:
+        if entry.kind != EntryKind.RESULT or entry.summarized:
+            return False
+        if self._skipped.get((id(context_manager), entry.key)) == hash(str(entry.value)):
+            return False
+        age = context_manager.step - entry.step
+        return age >= self.max_age_steps or context_manager.entry_tokens(entry.key) > self.max_tokens
+
+    def notify(self, context_manager: ContextManager):
+        """Queue the entries due for compaction. Called by the ContextManager on new results."""
+        for entry in context_manager.entries(kind=EntryKind.RESULT):
+            if not self._is_due(context_manager, entry):
+                continue
+            job = (id(context_manager), entry.key)
+            with self._lock:
+                if job in self._pending:
+                    continue
+                # Summary calls count against the run's budget and appear in its trace (the
+                # event stream is detached in _compact)
+                future = self._executor.submit(
+                    contextvars.copy_context().run,
+                    self._compact, context_manager, entry.key, entry.value,
+                )
+                self._pending[job] = future
+            future.add_done_callback(lambda _, job=job: self._done(job))
+
+    def _done(self, job):
+        with self._lock:
+            self._pending.pop(job, None)
+
+    def _compact(self, context_manager: ContextManager, key: str, value):
+        # Background work: its model calls must not emit into the run's event stream, which may
+        # already be finished or cancelled
+        with activate_stream(None):
+            try:
+                prompt = self._summary_prompt.format(key=key, value=value)
+                summary = str(self._model.process(prompt)).strip()
+            except Exception as e:
+                self.logger.warning(f"Failed to summarize context entry '{key}': {e}")
+                self._skip(context_manager, key, value)
+                return
+            if not summary or len(summary) >= len(str(value)):
+                self._skip(context_manager, key, value)
+                return
+            if context_manager.swap_summary(key, value, summary):
+                self.logger.info(
+                    f"Compacted context entry '{key}' from {len(str(value))} to {len(summary)} characters."
+                )
+
+    def _skip(self, context_manager: ContextManager, key: str, value):
+        with self._lock:
+            self._skipped[(id(context_manager), key)] = hash(str(value))
+
+    def flush(self, timeout: Optional[float] = None):
+        """Wait for the queued compactions (e.g. before inspecting the context)."""
+        with self._lock:
+            pending = list(self._pending.values())
+        wait(pending, timeout=timeout)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,15 +1,150 @@
 # utils/context_manager.py
 
+import bisect
 import re
+import threading
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from agent_core.utils.logger import get_logger
+from agent_core.utils.tokens import estimate_tokens
+
+CONTEXT_HEADER = "<Context>\n"
+CONTEXT_FOOTER = "</Context>\n"
+
+_LEGACY_KEY = re.compile(r"^Previous Step (\S+?)(?: Failed Attempt (\d+))?$")
+
+
+class EntryKind:
+    RESULT = "result"
+    FAILED_ATTEMPT = "failed_attempt"
+    HISTORY = "history"
+    OTHER = "other"
+
+
+@dataclass(slots=True)
+class ContextEntry:
+    key: str
+    value: object
+    node_id: Optional[str] = None
+    attempt: Optional[int] = None
+    kind: str = EntryKind.OTHER
+    # Node results added to the manager before this entry, and whether a summary replaced the value
+    step: int = 0
+    summarized: bool = False
+
+    @classmethod
+    def from_key(cls, key, value) -> "ContextEntry":
+        """Type an entry from its key, e.g. 'Previous Step B.2 Failed Attempt 1'."""
+        match = _LEGACY_KEY.match(str(key))
+        if match:
+            node_id, attempt = match.groups()
+            if attempt is None:
+                return cls(key, value, node_id, None, EntryKind.RESULT)
+            return cls(key, value, node_id, int(attempt), EntryKind.FAILED_ATTEMPT)
+        if key == "Execution History":
+            return cls(key, value, kind=EntryKind.HISTORY)
+        return cls(key, value)
+
+
+def node_sort_key(node_id: str) -> Tuple:
+    """
+    Plan order of node ids: 'B' < 'B.1' < 'B.2' < 'B.10' < 'C'.
+    Numeric parts compare as numbers, other parts as text.
+    """
+    return tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in str(node_id).split(".")
+    )
+
+
+# Sorts after every child of a node id, bounding "the node and its descendants"
+_AFTER_DESCENDANTS = ((2, 0, ""),)
+
+
+def _render_fragment(key, value) -> str:
+    return f"<{key}>\n{value}\n</{key}>\n"
+
+
+class _ContextDict(dict):
+    """
+    The context dictionary. Direct mutations keep the owner's rendered fragments in sync.
+    """
+
+    def __init__(self, owner: "ContextManager", *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._owner = owner
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._owner._on_set(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._owner._on_delete(key)
+
+    def _reset(self, method, *args, **kwargs):
+        result = getattr(super(), method)(*args, **kwargs)
+        self._owner._rebuild()
+        return result
+
+    def pop(self, *args):
+        return self._reset("pop", *args)
+
+    def popitem(self):
+        return self._reset("popitem")
+
+    def clear(self):
+        return self._reset("clear")
+
+    def update(self, *args, **kwargs):
+        return self._reset("update", *args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        return self._reset("setdefault", key, default)
+
+    def __ior__(self, other):
+        self._reset("update", other)
+        return self
+
+    def copy(self) -> dict:
+        """A plain dict snapshot; changing it does not change the context."""
+        return dict(self)
 
 
 class ContextManager:
 
     def __init__(self):
-        self.context = {}
+        self._lock = threading.RLock()
+        # Rendered fragment of each entry, in context order, joined lazily into the cached rendering
+        self._fragments: Dict[str, str] = {}
+        self._rendered: Optional[str] = None
+        self._context = _ContextDict(self)
+        # Typed entries with secondary indexes by node id (kept in plan order) and by kind
+        self._entries: Dict[str, ContextEntry] = {}
+        self._by_node: Dict[str, Set[str]] = {}
+        self._by_kind: Dict[str, Set[str]] = {}
+        self._node_order: List[Tuple] = []
+        self._order_ids: Dict[Tuple, str] = {}
+        # Optional ContextWindow bounding the context rendered into prompts, per role
+        self.window = None
+        # Node being executed, used by windows ranking entries by node distance
+        self.current_node_id: Optional[str] = None
+        # Optional ContextCompactor summarizing aged results in the background
+        self.compactor = None
+        self.step = 0
+        self._originals = {}
         self.logger = get_logger(self.__class__.__name__)
 
+    @property
+    def context(self):
+        return self._context
+
+    @context.setter
+    def context(self, value):
+        with self._lock:
+            self._context = _ContextDict(self, value)
+            self._rebuild()
+
     def get_context(self):
         """Return the underlying dictionary (if needed)."""
         return self.context
@@ -25,113 +160,286 @@ class ContextManager:
         """Reset the context to an empty dict."""
         self.context = {}
 
-    def add_context(self, key, value):
-        self.context[key] = value
-        self.logger.info(f"Add '{key}' into the context.")
+    def add_context(self, key, value, node_id=None, attempt=None, kind=None):
+        """
+        Add an entry. Without node_id/kind the entry is typed from its key, so
+        'Previous Step B' is the result of node B and 'Previous Step B Failed Attempt 2'
+        a failed attempt of B.
+        """
+        with self._lock:
+            self.context[key] = value
+            if node_id is not None or kind is not None:
+                self._index(
+                    ContextEntry(key, value, node_id, attempt, kind or EntryKind.OTHER)
+                )
+            entry = self._entries[key]
+            if entry.kind == EntryKind.RESULT:
+                self.step += 1
+                entry.step = self.step
+        self.logger.debug("Add '%s' into the context.", key)
+        if self.compactor is not None and entry.kind == EntryKind.RESULT:
+            self.compactor.notify(self)
+
+    def swap_summary(self, key, original, summary) -> bool:
+        """
+        Replace the entry's value with its summary, unless the value changed in the meantime.
+        The original stays available through original(key).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.value != original:
+                return False
+            self.context[key] = summary
+            entry.summarized = True
+            self._originals[key] = original
+            return True
+
+    def original(self, key):
+        """The value of the entry before it was summarized (its current value otherwise)."""
+        with self._lock:
+            if key in self._originals:
+                return self._originals[key]
+            return self._context.get(key)
+
+    def spawn(self, keys: Optional[Iterable[str]] = None) -> "ContextManager":
+        """
+        A new manager with a copy of the entries (only those in 'keys' if given), sharing the
+        window settings and compactor.
+        """
+        with self._lock:
+            manager = ContextManager()
+            if keys is None:
+                manager._context = _ContextDict(manager, self._context)
+            else:
+                keys = set(keys)
+                manager._context = _ContextDict(
+                    manager, {key: value for key, value in self._context.items() if key in keys}
+                )
+            manager._rebuild(self._entries)
+            manager.step = self.step
+            manager._originals = dict(self._originals)
+            manager.window = self.window.spawn() if self.window is not None else None
+            manager.compactor = self.compactor
+            return manager
+
+    @staticmethod
+    def result_key(node_id: str) -> str:
+        return f"Previous Step {node_id}"
+
+    @staticmethod
+    def failed_attempt_key(node_id: str, attempt: int) -> str:
+        return f"Previous Step {node_id} Failed Attempt {attempt}"
+
+    def add_node_result(self, node_id: str, value):
+        self.add_context(self.result_key(node_id), value, node_id, None, EntryKind.RESULT)
+
+    def add_failed_attempt(self, node_id: str, attempt: int, value):
+        self.add_context(
+            self.failed_attempt_key(node_id, attempt),
+            value,
+            node_id,
+            attempt,
+            EntryKind.FAILED_ATTEMPT,
+        )
+
+    def get_entry(self, key) -> Optional[ContextEntry]:
+        return self._entries.get(key)
+
+    def entries(self, kind: Optional[str] = None, node_id: Optional[str] = None) -> List[ContextEntry]:
+        """Entries in context order, optionally filtered by kind and/or node id."""
+        with self._lock:
+            keys = None
+            if kind is not None:
+                keys = self._by_kind.get(kind, set())
+            if node_id is not None:
+                node_keys = self._by_node.get(node_id, set())
+                keys = node_keys if keys is None else keys & node_keys
+            return [
+                self._entries[key]
+                for key in self._context
+                if keys is None or key in keys
+            ]
+
+    def _node_ids_between(self, first: str, last: str) -> List[str]:
+        """
+        Ids of the nodes in the context from 'first' to 'last' in plan order, including the
+        descendants of the later one (e.g. B.2 -> B.2.1).
+        """
+        low, high = sorted((node_sort_key(first), node_sort_key(last)))
+        start = bisect.bisect_left(self._node_order, low)
+        end = bisect.bisect_left(self._node_order, high + _AFTER_DESCENDANTS, lo=start)
+        return [self._order_ids[sort_key] for sort_key in self._node_order[start:end]]
+
+    def _remove_keys(self, keys: Iterable[str]) -> List[str]:
+        removed = []
+        for key in list(keys):
+            if key in self.context:
+                del self.context[key]
+                removed.append(key)
+        if removed:
+            self.logger.debug("Remove %s from the context.", removed)
+        return removed
+
+    def remove_failed_attempts(self, node_id: str, include_descendants: bool = True) -> List[str]:
+        """Drop the failed attempts of a node (and of its descendants). Returns the removed keys."""
+        with self._lock:
+            node_ids = (
+                self._node_ids_between(node_id, node_id) if include_descendants else [node_id]
+            )
+            failed = self._by_kind.get(EntryKind.FAILED_ATTEMPT, set())
+            keys = [
+                key
+                for nid in node_ids
+                for key in self._by_node.get(nid, ())
+                if key in failed
+            ]
+            return self._remove_keys(keys)
+
+    def remove_node_range(self, restart_node_id: Optional[str], current_node_id: str) -> List[str]:
+        """
+        Drop every node entry from the restart node up to the current node (inclusive, with the
+        descendants of the later one), in plan order. Without a restart node only the current
+        node is dropped. Returns the removed keys.
+        """
+        restart_node_id = restart_node_id or current_node_id
+        with self._lock:
+            keys = [
+                key
+                for node_id in self._node_ids_between(restart_node_id, current_node_id)
+                for key in self._by_node.get(node_id, ())
+            ]
+            return self._remove_keys(keys)
+
+    def _index(self, entry: ContextEntry):
+        self._unindex(entry.key)
+        self._entries[entry.key] = entry
+        self._by_kind.setdefault(entry.kind, set()).add(entry.key)
+        if entry.node_id is not None:
+            keys = self._by_node.setdefault(entry.node_id, set())
+            if not keys:
+                sort_key = node_sort_key(entry.node_id)
+                if sort_key not in self._order_ids:
+                    bisect.insort(self._node_order, sort_key)
+                self._order_ids[sort_key] = entry.node_id
+            keys.add(entry.key)
+
+    def _unindex(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._by_kind.get(entry.kind, set()).discard(key)
+        if entry.node_id is not None:
+            keys = self._by_node.get(entry.node_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_node[entry.node_id]
+                    sort_key = node_sort_key(entry.node_id)
+                    index = bisect.bisect_left(self._node_order, sort_key)
+                    if index < len(self._node_order) and self._node_order[index] == sort_key:
+                        del self._node_order[index]
+                    self._order_ids.pop(sort_key, None)
 
     def remove_context(self, key):
-        if key in self.context:
+        with self._lock:
+            if key not in self.context:
+                return
             del self.context[key]
-            self.logger.info(f"Remove '{key}' from the context.")
+        self.logger.debug("Remove '%s' from the context.", key)
+
+    def _on_set(self, key, value):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.value = value
+                entry.summarized = False
+                self._originals.pop(key, None)
+            else:
+                self._index(ContextEntry.from_key(key, value))
+            # Fragments keep the context order; the rendering is joined again on the next render
+            self._fragments[key] = _render_fragment(key, value)
+            self._rendered = None
+
+    def _on_delete(self, key):
+        with self._lock:
+            self._unindex(key)
+            if self._fragments.pop(key, None) is not None:
+                self._rendered = None
+
+    def _rebuild(self, previous=None):
+        with self._lock:
+            # Entries still present keep their explicit types
+            previous = self._entries if previous is None else previous
+            self._entries, self._by_node, self._by_kind = {}, {}, {}
+            self._node_order, self._order_ids = [], {}
+            for key, value in self._context.items():
+                entry = previous.get(key)
+                self._index(
+                    replace(entry, value=value, summarized=entry.summarized and entry.value == value)
+                    if entry is not None
+                    else ContextEntry.from_key(key, value)
+                )
+            self._fragments = {
+                key: _render_fragment(key, value) for key, value in self._context.items()
+            }
+            self._rendered = None
 
     def context_to_str(self):
         """
         If the context is empty, return an empty string.
         Otherwise, wrap each key/value pair in <key></key> inside <context></context>.
         """
-        if not self.context:
+        with self._lock:
+            if not self._fragments:
+                return ""
+            if self._rendered is None:
+                self._rendered = (
+                    CONTEXT_HEADER + "".join(self._fragments.values()) + CONTEXT_FOOTER
+                )
+            return self._rendered
+
+    def render_for(self, role: str, current_node_id: Optional[str] = None) -> str:
+        """The context for a prompt of the given role, bounded by the window if one is set."""
+        if self.window is None:
+            return self.context_to_str()
+        with self._lock:
+            return self.window.render(self, role, current_node_id or self.current_node_id)
+
+    def entry_tokens(self, key) -> int:
+        """Estimated tokens of the rendered entry."""
+        return estimate_tokens(self._fragments.get(key, ""))
+
+    def node_distance(self, node_id: str, other_node_id: str) -> int:
+        """Number of nodes in the context between the two nodes in plan order."""
+        first = bisect.bisect_left(self._node_order, node_sort_key(node_id))
+        second = bisect.bisect_left(self._node_order, node_sort_key(other_node_id))
+        return abs(first - second)
+
+    def render(self, keys: Iterable[str]) -> str:
+        """
+        Render only the given keys (in the given order) from their cached fragments.
+        Unknown keys are ignored; an empty selection renders as an empty string.
+        """
+        with self._lock:
+            fragments = [self._fragments[key] for key in keys if key in self._fragments]
+        if not fragments:
             return ""
-        context_str = "<Context>\n"
-        for key, value in self.context.items():
-            context_str += f"<{key}>\n{value}\n</{key}>\n"
-        context_str += "</Context>\n"
-        return context_str
+        return CONTEXT_HEADER + "".join(fragments) + CONTEXT_FOOTER
 
     def __repr__(self):
         """So print(context) shows the stored keys and values nicely."""
         return f"ContextManager({self.context})"
 
-    # TODO: need test
     def cleanup_context(self, current_node_id, restart_node_id):
-        input_text = self.context_to_str
-
-        # Extract the content inside <Context>
-        context_match = re.search(r"<Context>(.*?)</Context>", input_text, re.DOTALL)
-        if not context_match:
-            return input_text
-        context_content = context_match.group(1)
-
-        # Extract all nodes within the context
-        nodes = re.findall(
-            r"(<Previous Step [^>]+>.*?</Previous Step [^>]+>)",
-            context_content,
-            re.DOTALL,
-        )
-
-        # Determine the range of node IDs to remove
-        restart_char = restart_node_id.upper()
-        current_char = current_node_id.upper()
-        start_range = min(restart_char, current_char)
-        end_range = max(restart_char, current_char)
-
-        kept_nodes = []
-        for node in nodes:
-            # Extract the opening tag line
-            opening_tag_line = node.split("\n")[0].strip()
-            # Extract the name part after 'Previous Step '
-            start = opening_tag_line.find("Previous Step ") + len("Previous Step ")
-            end = opening_tag_line.find(">", start)
-            name_part = opening_tag_line[start:end].strip()
-            if not name_part:
-                continue
-            base_id = name_part[0].upper()
-
-            # Check if base_id is outside the removal range
-            if not (start_range <= base_id <= end_range):
-                kept_nodes.append(node.strip())
-
-        # Rebuild the context content with kept nodes
-        new_context_content = "\n".join(kept_nodes)
-        # Ensure proper formatting with newlines
-        cleaned_text = f"<Context>\n{new_context_content}\n</Context>"
-        print(cleaned_text)
-        return cleaned_text
+        """Drop node entries between the restart node and the current node; see remove_node_range."""
+        return self.remove_node_range(restart_node_id, current_node_id)
 
     def identify_context_key(self, context_str, current_node_id, restart_node_id):
-
-        context_match = re.search(r"<Context>(.*?)</Context>", context_str, re.DOTALL)
-        if not context_match:
-            return []
-        context_content = context_match.group(1)
-
-        nodes = re.findall(
-            r"(<Previous Step [^>]+>.*?</Previous Step [^>]+>)",
-            context_content,
-            re.DOTALL,
-        )
-
-        if restart_node_id:
-            restart_char = restart_node_id.upper()
-        else:
-            restart_char = current_node_id.upper()
-        current_char = current_node_id.upper()
-        start_range = min(restart_char, current_char)
-        end_range = max(restart_char, current_char)
-
-        nodes_to_remove = []
-
-        for node in nodes:
-            opening_tag_line = node.split("\n")[0].strip()
-            node_name = opening_tag_line[
-                1:-1
-            ].strip()  # Extract node name from the opening tag
-            parts = node_name.split()
-            if len(parts) < 3:
-                continue
-            base_id_part = parts[2]
-            if not base_id_part:
-                continue
-            base_id = base_id_part[0].upper()
-            if start_range <= base_id <= end_range:
-                nodes_to_remove.append(node_name)
-        return nodes_to_remove
+        """
+        Keys of the node entries between the restart node and the current node.
+        'context_str' is unused and kept for compatibility; entries are looked up in the indexes.
+        """
+        restart_node_id = restart_node_id or current_node_id
+        with self._lock:
+            node_ids = set(self._node_ids_between(restart_node_id, current_node_id))
+            return [key for key, entry in self._entries.items() if entry.node_id in node_ids]
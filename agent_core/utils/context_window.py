@@ -0,0 +1,192 @@
+# utils/context_window.py
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from agent_core.utils.context_manager import ContextEntry, ContextManager
+from agent_core.utils.logger import get_logger
+from agent_core.utils.tokens import estimate_tokens
+
+
+class ContextRole:
+    EXECUTE = "execute"
+    EVALUATE = "evaluate"
+    REPLAN = "replan"
+
+
+@dataclass(slots=True)
+class Candidate:
+    """An entry competing for the window, with its position in the context (0 is the oldest)."""
+
+    entry: ContextEntry
+    position: int
+    count: int
+    tokens: int
+    budget: int
+
+
+class EvictionPolicy:
+    """
+    Scores entries for a context window; the lowest scores are evicted first.
+    A score of math.inf keeps the entry regardless of the budget.
+    """
+
+    weight: float = 1.0
+
+    def score(
+        self, candidate: Candidate, manager: ContextManager, current_node_id: Optional[str]
+    ) -> float:
+        raise NotImplementedError
+
+
+class RecencyPolicy(EvictionPolicy):
+    """Prefer recently added entries."""
+
+    def __init__(self, weight: float = 1.0):
+        self.weight = weight
+
+    def score(self, candidate, manager, current_node_id):
+        return (candidate.position + 1) / candidate.count
+
+
+class NodeDistancePolicy(EvictionPolicy):
+    """
+    Prefer entries of nodes close to the current node in plan order (e.g. B.2 is close to B.3,
+    far from A). Entries which do not belong to a node score as distance 'neutral_distance'.
+    """
+
+    def __init__(self, weight: float = 1.0, neutral_distance: int = 1):
+        self.weight = weight
+        self.neutral_distance = neutral_distance
+
+    def score(self, candidate, manager, current_node_id):
+        node_id = candidate.entry.node_id
+        if node_id is None or current_node_id is None:
+            distance = self.neutral_distance
+        else:
+            distance = manager.node_distance(node_id, current_node_id)
+        return 1 / (1 + distance)
+
+
+class PinnedPolicy(EvictionPolicy):
+    """Never evict the given keys, entry kinds or nodes."""
+
+    def __init__(
+        self,
+        keys: Iterable[str] = (),
+        kinds: Iterable[str] = (),
+        node_ids: Iterable[str] = (),
+    ):
+        self.keys = set(keys)
+        self.kinds = set(kinds)
+        self.node_ids = set(node_ids)
+
+    def score(self, candidate, manager, current_node_id):
+        entry = candidate.entry
+        if entry.key in self.keys or entry.kind in self.kinds or entry.node_id in self.node_ids:
+            return math.inf
+        return 0.0
+
+
+class SizeWeightedPolicy(EvictionPolicy):
+    """Prefer small entries; an entry the size of the whole budget scores -1."""
+
+    def __init__(self, weight: float = 1.0):
+        self.weight = weight
+
+    def score(self, candidate, manager, current_node_id):
+        return -candidate.tokens / max(candidate.budget, 1)
+
+
+class ContextWindow:
+    """
+    A token-budgeted view of a ContextManager.
+
+    'budgets' maps a role (see ContextRole) to the maximum estimated tokens of context
+    injected into prompts of that role; roles without a budget get the full context.
+    When the context is over budget, entries with the lowest combined policy score are evicted.
+    Evicted entries are tracked per role, so they can be summarized or restored.
+    """
+
+    def __init__(
+        self,
+        budgets: Dict[str, int],
+        policies: Optional[Sequence[EvictionPolicy]] = None,
+    ):
+        self.budgets = dict(budgets)
+        self.policies = list(policies) if policies is not None else [RecencyPolicy()]
+        self._evicted: Dict[str, Dict[str, ContextEntry]] = {}
+        self._restored = set()
+        self.logger = get_logger(self.__class__.__name__)
+
+    def spawn(self) -> "ContextWindow":
+        """A window with the same budgets, policies and restored keys, without eviction state."""
+        window = ContextWindow(self.budgets, self.policies)
+        window._restored = set(self._restored)
+        return window
+
+    def evicted(self, role: Optional[str] = None) -> List[ContextEntry]:
+        """Entries left out of the last rendering of the role (of any role when None)."""
+        if role is not None:
+            return list(self._evicted.get(role, {}).values())
+        merged = {}
+        for entries in self._evicted.values():
+            merged.update(entries)
+        return list(merged.values())
+
+    def restore(self, key: str):
+        """Keep an evicted entry in every following rendering."""
+        self._restored.add(key)
+
+    def release(self, key: str):
+        self._restored.discard(key)
+
+    def _score(self, candidate, manager, current_node_id) -> float:
+        if candidate.entry.key in self._restored:
+            return math.inf
+        total = 0.0
+        for policy in self.policies:
+            score = policy.score(candidate, manager, current_node_id)
+            if score == math.inf:
+                return math.inf
+            total += policy.weight * score
+        return total
+
+    def render(
+        self, manager: ContextManager, role: str, current_node_id: Optional[str] = None
+    ) -> str:
+        budget = self.budgets.get(role)
+        full = manager.context_to_str()
+        if budget is None or estimate_tokens(full) <= budget:
+            self._evicted[role] = {}
+            return full
+
+        entries = manager.entries()
+        candidates = [
+            Candidate(entry, position, len(entries), manager.entry_tokens(entry.key), budget)
+            for position, entry in enumerate(entries)
+        ]
+        used = sum(candidate.tokens for candidate in candidates)
+        evicted = {}
+        scored = sorted(
+            ((self._score(c, manager, current_node_id), c) for c in candidates),
+            key=lambda item: item[0],
+        )
+        for score, candidate in scored:
+            if used <= budget:
+                break
+            if score == math.inf:
+                self.logger.warning(
+                    f"Pinned context entries exceed the '{role}' budget of {budget} tokens."
+                )
+                break
+            evicted[candidate.entry.key] = candidate.entry
+            used -= candidate.tokens
+
+        self._evicted[role] = evicted
+        self.logger.info(
+            f"Context window '{role}': evicted {len(evicted)} of {len(entries)} entries "
+            f"to fit {budget} tokens."
+        )
+        return manager.render(entry.key for entry in entries if entry.key not in evicted)
@@ -0,0 +1,83 @@
+# utils/events.py
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+
+class EventType:
+    PLAN_CREATED = "plan_created"
+    NODE_STARTED = "node_started"
+    TOOL_CALLED = "tool_called"
+    TOOL_RESULT = "tool_result"
+    EVALUATION_SCORED = "evaluation_scored"
+    REPLAN_APPLIED = "replan_applied"
+    TOKEN_DELTA = "token_delta"
+    RUN_FINISHED = "run_finished"
+
+
+@dataclass(slots=True)
+class ExecutionEvent:
+    type: str
+    data: Dict = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+
+class RunCancelled(BaseException):
+    """
+    Raised inside a run when its event stream was cancelled by the consumer.
+    Like asyncio.CancelledError it is not an Exception, so broad error handling does not swallow it.
+    """
+
+
+class EventStream:
+    """
+    Delivers the events of one run to a sink (e.g. a queue read by the consumer).
+    Once cancelled, the next event emitted by the run raises RunCancelled, so the run stops
+    at the following step, node, tool or model boundary.
+    """
+
+    def __init__(self, sink: Callable[[ExecutionEvent], None]):
+        self._sink = sink
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def emit(self, event_type: str, **data):
+        if self.cancelled:
+            raise RunCancelled("Run cancelled by the event stream consumer.")
+        self._sink(ExecutionEvent(event_type, data))
+
+    def finish(self, **data):
+        """Emit RUN_FINISHED, even after cancellation."""
+        self._sink(ExecutionEvent(EventType.RUN_FINISHED, data))
+
+
+_current_stream: ContextVar[Optional[EventStream]] = ContextVar(
+    "agent_core_event_stream", default=None
+)
+
+
+def emit_event(event_type: str, **data):
+    """Emit an event to the stream of the run executing in the current context, if any."""
+    stream = _current_stream.get()
+    if stream is not None:
+        stream.emit(event_type, **data)
+
+
+@contextmanager
+def activate_stream(stream: Optional[EventStream]):
+    """Route the events of the current context to the stream; None detaches it from any stream."""
+    token = _current_stream.set(stream)
+    try:
+        yield stream
+    finally:
+        _current_stream.reset(token)
@@ -2,6 +2,7 @@ import re
 import json
 from typing import Optional
 from agent_core.agent_basic import AgentBasic
+from agent_core.utils.logger import capped
 
 
 def _parse_section(response_text: str, label: str) -> str:
@@ -64,7 +65,7 @@ Now, produce your evaluation:
 
     def process(self, request: str) -> str:
         response = self._model.process(request)
-        self.logger.debug(f"Response: {response}")
+        self.logger.debug("Response: %s", capped(response))
         return response.strip()
 
     def evaluate_text(
@@ -88,7 +89,7 @@ Now, produce your evaluation:
             criteria=criteria,
         )
         response = self._model.process(prompt)
-        self.logger.debug(f"Evaluate raw response: {response}")
+        self.logger.debug("Evaluate raw response: %s", capped(response))
         # Parse rating from 1..10
         rating_val = _parse_rating(response)
         decision = "Pass" if rating_val >= rating_threshold else "Fail"
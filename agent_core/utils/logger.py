@@ -1,7 +1,123 @@
 # utils/logger.py
 
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+from typing import Dict, Optional
+
+from agent_core.config import load_dotenv_once
+
+# AGENT_CORE_LOG_FORMAT=json switches to one JSON object per record
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# Large payloads (prompts, responses, plans) are cut to this many characters in log records
+DEFAULT_PAYLOAD_CHARS = 2000
+
+# Attributes every LogRecord has; anything else was passed through 'extra'
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_loggers: Dict[str, logging.Logger] = {}
+_lock = threading.Lock()
+_queue_handler: Optional["_DeferredQueueHandler"] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as a JSON object, including the fields passed through 'extra'."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, default=str)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueues records unformatted. The stdlib QueueHandler.prepare() formats the message (and
+    traceback) in the logging thread so records can be pickled; the queue here is in-process,
+    so formatting is left to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # A copy, as other handlers of the logger may still use the record
+        return copy.copy(record)
+
+
+class _Capped:
+    """A log argument rendered (and truncated) only when the record is emitted."""
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value, limit: int):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self):
+        text = str(self.value)
+        if len(text) <= self.limit:
+            return text
+        return f"{text[:self.limit]}... [{len(text) - self.limit} more characters]"
+
+    __repr__ = __str__
+
+
+def capped(value, limit: Optional[int] = None) -> _Capped:
+    """
+    Wrap a potentially large log argument, e.g. logger.debug("Response: %s", capped(response)).
+    The limit defaults to AGENT_CORE_LOG_PAYLOAD_CHARS (2000). The value is rendered on the
+    listener thread, after the call returns, so it should not be mutated afterwards.
+    """
+    if limit is None:
+        limit = int(os.getenv("AGENT_CORE_LOG_PAYLOAD_CHARS", DEFAULT_PAYLOAD_CHARS))
+    return _Capped(value, limit)
+
+
+def _formatter() -> logging.Formatter:
+    if os.getenv("AGENT_CORE_LOG_FORMAT", "text").lower() == "json":
+        return JsonFormatter()
+    return logging.Formatter(TEXT_FORMAT)
+
+
+def _get_queue_handler() -> logging.handlers.QueueHandler:
+    """
+    The handler shared by all framework loggers. It only enqueues records; a listener thread
+    formats them and writes them to stderr, so neither formatting nor slow I/O blocks the caller.
+    """
+    global _queue_handler, _listener
+    if _queue_handler is None:
+        records = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(_formatter())
+        _listener = logging.handlers.QueueListener(records, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        _queue_handler = _DeferredQueueHandler(records)
+    return _queue_handler
+
+
+def shutdown_logging():
+    """Write out the queued records and stop the listener thread (registered to run at exit)."""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
 
 
 def get_logger(name="agent-core", log_level: str = None) -> logging.Logger:
@@ -9,20 +125,23 @@ def get_logger(name="agent-core", log_level: str = None) -> logging.Logger:
     Retrieve a logger with the specified name.
     If log_level is provided, override the default or global environment setting.
     Otherwise, use Config.DEFAULT_LOG_LEVEL.
+    Loggers are configured once; later calls only change the level when log_level is given.
     """
-    logger = logging.getLogger(name)
-
-    # If the logger has no handlers, add one (to avoid duplicated logs in multi-import environments).
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-    # If a log_level is specified, use it; otherwise use the framework default
-    effective_level = log_level.upper() if log_level else os.getenv("AGENT_CORE_LOG_LEVEL")
-    logger.setLevel(effective_level)
+    logger = _loggers.get(name)
+    if logger is not None and not log_level:
+        return logger
 
+    with _lock:
+        logger = logging.getLogger(name)
+        if name not in _loggers:
+            # AGENT_CORE_LOG_LEVEL may come from the .env file
+            load_dotenv_once()
+            # One shared queue handler (avoids duplicated logs in multi-import environments)
+            if not logger.handlers:
+                logger.addHandler(_get_queue_handler())
+            if not log_level and os.getenv("AGENT_CORE_LOG_LEVEL"):
+                logger.setLevel(os.getenv("AGENT_CORE_LOG_LEVEL").upper())
+            _loggers[name] = logger
+        if log_level and logger.level != logging.getLevelName(log_level.upper()):
+            logger.setLevel(log_level.upper())
     return logger
@@ -0,0 +1,79 @@
+# utils/output_store.py
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+
+@dataclass(slots=True, frozen=True)
+class OutputRef:
+    """
+    Reference to an output spilled to disk. str() reads it back.
+    """
+
+    digest: str
+    path: str
+    size: int
+
+    def resolve(self) -> str:
+        with open(self.path, encoding="utf-8") as f:
+            return f.read()
+
+    def __str__(self):
+        return self.resolve()
+
+
+def _remove_spill_dir(path: str):
+    shutil.rmtree(path, ignore_errors=True)
+
+
+class OutputStore:
+    """
+    Per-run store of node outputs.
+    intern() returns one shared instance per distinct text, so node results, execution records and
+    Steps hold references to the same string instead of copies.
+    spill() moves large cold outputs (e.g. failed attempts) to disk; the spill directory is removed
+    together with the store.
+    """
+
+    def __init__(self, spill_dir: Optional[str] = None, spill_threshold: int = 2048):
+        self.spill_threshold = spill_threshold
+        self._spill_dir = spill_dir
+        self._texts: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def intern(self, text):
+        if not isinstance(text, str):
+            return text
+        key = self.digest(text)
+        with self._lock:
+            return self._texts.setdefault(key, text)
+
+    def _ensure_spill_dir(self) -> str:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="agent_core_outputs_")
+            weakref.finalize(self, _remove_spill_dir, self._spill_dir)
+        os.makedirs(self._spill_dir, exist_ok=True)
+        return self._spill_dir
+
+    def spill(self, output: Union[str, OutputRef]) -> Union[str, OutputRef]:
+        """Write a large output to disk and return its OutputRef; small outputs are kept in memory."""
+        if not isinstance(output, str) or len(output) < self.spill_threshold:
+            return output
+        key = self.digest(output)
+        with self._lock:
+            path = os.path.join(self._ensure_spill_dir(), key)
+            if not os.path.exists(path):
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(output)
+            self._texts.pop(key, None)
+        return OutputRef(key, path, len(output))
@@ -0,0 +1,13 @@
+# utils/tokens.py
+
+# A rough local estimate (about four characters per token for English text and JSON).
+# Used for accounting and budgeting when the model does not report usage.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text) -> int:
+    if not text:
+        return 0
+    if not isinstance(text, str):
+        text = str(text)
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
@@ -0,0 +1,117 @@
+# utils/tool_catalog.py
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
+    from pydantic import ValidationError
+
+
+def _render_schema(tool: "BaseTool") -> str:
+    args_schema = getattr(tool, "args_schema", None)
+    if args_schema is None:
+        return f"[Tool: {tool.name}]"
+    if isinstance(args_schema, dict):
+        return str(args_schema)
+    return str(args_schema.model_json_schema())
+
+
+def _format_validation_error(error: "ValidationError") -> str:
+    lines = []
+    for err in error.errors():
+        location = ".".join(str(part) for part in err.get("loc", ())) or "(root)"
+        lines.append(f"- {location}: {err.get('msg')} (got {err.get('input')!r})")
+    return "\n".join(lines)
+
+
+class ToolCatalog:
+    """
+    A precompiled view over a set of tools.
+    Schemas are rendered once when the catalog is built, so planning and node
+    execution can reuse them instead of calling model_json_schema() every time.
+    The catalog also validates LLM generated tool arguments before invocation.
+    """
+
+    _cache: "OrderedDict[Tuple[int, ...], ToolCatalog]" = OrderedDict()
+    _cache_size = 32
+    _cache_lock = threading.Lock()
+
+    def __init__(self, tools: Optional[Iterable["BaseTool"]] = None):
+        self._tools: List["BaseTool"] = list(tools) if tools else []
+        self._by_name: Dict[str, "BaseTool"] = {tool.name: tool for tool in self._tools}
+        self._schemas: Dict[str, str] = {
+            tool.name: _render_schema(tool) for tool in self._tools
+        }
+        self.tools_knowledge = "\n".join(
+            self._schemas[tool.name] for tool in self._tools
+        )
+
+    @classmethod
+    def of(cls, tools) -> "ToolCatalog":
+        """
+        Return a catalog for the given tools, reusing the one already built for
+        the same tool set. Passing a ToolCatalog returns it unchanged.
+        """
+        if isinstance(tools, ToolCatalog):
+            return tools
+        tools = list(tools) if tools else []
+        key = tuple(id(tool) for tool in tools)
+        with cls._cache_lock:
+            catalog = cls._cache.get(key)
+            if catalog is not None:
+                cls._cache.move_to_end(key)
+                return catalog
+        catalog = cls(tools)
+        with cls._cache_lock:
+            cls._cache[key] = catalog
+            while len(cls._cache) > cls._cache_size:
+                cls._cache.popitem(last=False)
+        return catalog
+
+    def __iter__(self):
+        return iter(self._tools)
+
+    def __len__(self):
+        return len(self._tools)
+
+    def __contains__(self, name: str):
+        return name in self._by_name
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._by_name)
+
+    def get(self, name: Optional[str]) -> Optional["BaseTool"]:
+        if not name:
+            return None
+        return self._by_name.get(name)
+
+    def schema(self, tool: "BaseTool") -> str:
+        """
+        Cached schema description of the tool; tools outside the catalog are rendered on demand.
+        """
+        cached = self._schemas.get(tool.name)
+        if cached is not None and self._by_name.get(tool.name) is tool:
+            return cached
+        return _render_schema(tool)
+
+    def validate_arguments(self, tool: "BaseTool", arguments) -> Tuple[bool, str]:
+        """
+        Validate the arguments against the tool's Pydantic args_schema.
+        Return (True, "") when valid, otherwise (False, <readable list of errors>).
+        Tools without a Pydantic schema are not validated locally.
+        """
+        if not isinstance(arguments, dict):
+            return False, f"- (root): tool_arguments must be a JSON object (got {arguments!r})"
+        args_schema = getattr(tool, "args_schema", None)
+        if args_schema is None or not hasattr(args_schema, "model_validate"):
+            return True, ""
+        from pydantic import ValidationError
+
+        try:
+            args_schema.model_validate(arguments)
+        except ValidationError as e:
+            return False, _format_validation_error(e)
+        return True, ""
@@ -0,0 +1,219 @@
+# utils/tracer.py
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(slots=True)
+class Span:
+    """
+    A timed unit of work in a run, e.g. planning, a node attempt, a tool call or a model call.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: Optional[int] = None
+    thread_id: int = 0
+    status: str = "ok"
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    _start_perf_ns: int = 0
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes):
+        self.attributes.update(attributes)
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.end_ns or self.start_ns) - self.start_ns
+
+
+class _NoopSpan:
+    """Returned when tracing is disabled, so call sites never need to check."""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, **attributes):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+_current_span: ContextVar[Optional[Span]] = ContextVar("agent_core_current_span", default=None)
+
+
+def _otlp_value(value) -> Dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Tracer:
+    """
+    Collects spans in memory and exports them as Chrome trace JSON (chrome://tracing, Perfetto)
+    or as OTLP-shaped JSON, without any live collector.
+    Disabled tracers cost a single attribute check per span.
+    """
+
+    def __init__(self, enabled: bool = False, service_name: str = "agent_core"):
+        self.enabled = enabled
+        self.service_name = service_name
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        with self._lock:
+            self._spans = []
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        if not self.enabled:
+            yield _NOOP_SPAN
+            return
+
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_id=parent.span_id if parent else None,
+            start_ns=time.time_ns(),
+            thread_id=threading.get_native_id(),
+            attributes=dict(attributes),
+            _start_perf_ns=time.perf_counter_ns(),
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.attributes["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = span.start_ns + (time.perf_counter_ns() - span._start_perf_ns)
+            with self._lock:
+                self._spans.append(span)
+
+    def to_chrome_trace(self) -> Dict:
+        pid = os.getpid()
+        events = []
+        for span in self.spans:
+            args = dict(span.attributes)
+            args["span_id"] = span.span_id
+            if span.parent_id:
+                args["parent_id"] = span.parent_id
+            if span.status != "ok":
+                args["status"] = span.status
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": span.duration_ns / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": args,
+                }
+            )
+        events.sort(key=lambda event: event["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_otlp(self) -> Dict:
+        spans = []
+        for span in self.spans:
+            otlp_span = {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns or span.start_ns),
+                "attributes": [
+                    {"key": key, "value": _otlp_value(value)}
+                    for key, value in span.attributes.items()
+                ],
+                "status": {"code": 2 if span.status == "error" else 1},
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            spans.append(otlp_span)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": _otlp_value(self.service_name)}
+                        ]
+                    },
+                    "scopeSpans": [{"scope": {"name": "agent_core"}, "spans": spans}],
+                }
+            ]
+        }
+
+    def export_chrome_trace(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, default=str)
+
+    def export_otlp_json(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_otlp(), f, default=str)
+
+
+_tracer = Tracer(enabled=os.getenv("AGENT_CORE_TRACE", "").lower() in ("1", "true", "yes"))
+
+
+def get_tracer() -> Tracer:
+    """
+    Return the framework-wide tracer.
+    Tracing is off unless AGENT_CORE_TRACE is set, or get_tracer().enable() is called.
+    """
+    return _tracer
+
+
+def current_span():
+    """The innermost active span, or a no-op span when tracing is disabled."""
+    if not _tracer.enabled:
+        return _NOOP_SPAN
+    return _current_span.get() or _NOOP_SPAN
+
+
+def traced(name: str, **attributes):
+    """Decorator that runs the function inside a span of the framework tracer."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _tracer.span(name, **attributes):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
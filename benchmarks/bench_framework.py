@@ -0,0 +1,284 @@
+# benchmarks/bench_framework.py
+"""
+Framework overhead on synthetic plans of 10 to 10,000 nodes, with an in-process fake model so
+LLM latency is excluded: context rendering and pruning, plan adjustment and summary, score
+parsing, execution history rendering, prompt formatting and execute_plan end to end.
+
+    python benchmarks/bench_framework.py [--sizes 10 100 1000 10000] [--only context] [--json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent_core.entities.steps import Step, Steps  # noqa: E402
+from agent_core.evaluators import GenericEvaluator  # noqa: E402
+from agent_core.models.base_model import BaseModel  # noqa: E402
+from agent_core.models.model_registry import ModelRegistry  # noqa: E402
+from agent_core.planners import GraphPlanner  # noqa: E402
+from agent_core.planners.graph_planner import Node, PlanGraph, apply_adjustments_to_plan  # noqa: E402
+from agent_core.utils.context_manager import ContextManager  # noqa: E402
+from agent_core.utils.context_window import ContextRole  # noqa: E402
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "evaluator_outputs.jsonl")
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+RESULT = "Fetched 20 rows; the average order value is 42.17 and 3 orders are flagged for review."
+
+
+class FakeModel(BaseModel):
+    """Answers every node instantly with a fixed, valid execution response."""
+
+    def process(self, command: str) -> str:
+        return json.dumps({"use_tool": False, "response": RESULT})
+
+    def name(self) -> str:
+        return "benchmark-fake-model"
+
+
+def build_plan_graph(size: int) -> PlanGraph:
+    plan_graph = PlanGraph()
+    for i in range(1, size + 1):
+        plan_graph.add_node(Node(
+            id=f"step_{i}",
+            task_description=f"Run query {i} against the orders table and summarize the result.",
+            next_nodes=[f"step_{i + 1}"] if i < size else [],
+        ))
+    return plan_graph
+
+
+def build_context(size: int, failed_attempts: int = 0) -> ContextManager:
+    context_manager = ContextManager()
+    for i in range(1, size + 1):
+        for attempt in range(1, failed_attempts + 1):
+            context_manager.add_failed_attempt(f"step_{i}", attempt, f"Task response: attempt {attempt}")
+        context_manager.add_node_result(f"step_{i}", f"Task description: query {i}\nTask response: {RESULT}")
+    return context_manager
+
+
+def build_history(size: int) -> Steps:
+    steps = Steps()
+    for i in range(1, size + 1):
+        steps.add_step(Step(name=f"step_{i}", description=f"Run query {i}", result=RESULT))
+    return steps
+
+
+def timed(run, repeat: int, setup=None) -> dict:
+    """Time 'repeat' calls of run(state), excluding setup() which builds a fresh state per call."""
+    elapsed = 0.0
+    for _ in range(repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        run(state)
+        elapsed += time.perf_counter() - start
+    return {"repeat": repeat, "seconds": elapsed, "per_call_us": elapsed / repeat * 1e6}
+
+
+def _repeat(size: int, base: int = 20000) -> int:
+    """Fewer repetitions for larger inputs, so each benchmark takes a similar time."""
+    return max(3, base // size)
+
+
+def bench_context_to_str(size):
+    context_manager = build_context(size)
+    keys = iter(range(10 ** 9))
+    return {
+        "cached": timed(lambda _: context_manager.context_to_str(), _repeat(size, 200000)),
+        "add_and_render": timed(
+            lambda _: (context_manager.add_context(f"Extra {next(keys)}", RESULT),
+                       context_manager.context_to_str()),
+            _repeat(size),
+        ),
+        "render_for_execute": timed(
+            lambda _: context_manager.render_for(ContextRole.EXECUTE, f"step_{size}"), _repeat(size)
+        ),
+    }
+
+
+def bench_context_pruning(size):
+    """The context updates execute_plan makes: dropping failed attempts and replanned ranges."""
+    return {
+        "remove_failed_attempts": timed(
+            lambda cm: [cm.remove_failed_attempts(f"step_{i}", include_descendants=False)
+                        for i in range(1, size + 1)],
+            _repeat(size, 2000),
+            setup=lambda: build_context(size, failed_attempts=2),
+        ),
+        "remove_node_range": timed(
+            lambda cm: cm.cleanup_context(f"step_{size}", f"step_{max(1, size // 2)}"),
+            _repeat(size, 2000),
+            setup=lambda: build_context(size, failed_attempts=1),
+        ),
+    }
+
+
+def bench_apply_adjustments(size):
+    middle = f"step_{max(1, size // 2)}"
+    replan = {
+        "action": "replan",
+        "restart_node_id": middle,
+        "modifications": [
+            {"node_id": f"step_{i}", "task_description": f"Revised query {i}"}
+            for i in range(max(1, size // 2), min(size, size // 2 + 10) + 1)
+        ],
+    }
+    breakdown = {
+        "action": "breakdown",
+        "new_subtasks": [
+            {"id": f"{middle}_{j}", "task_description": f"Part {j}", "next_nodes": []}
+            for j in range(1, 4)
+        ],
+    }
+    return {
+        "replan": timed(
+            lambda pg: apply_adjustments_to_plan(pg, middle, replan),
+            _repeat(size, 2000), setup=lambda: build_plan_graph(size),
+        ),
+        "breakdown": timed(
+            lambda pg: apply_adjustments_to_plan(pg, middle, breakdown),
+            _repeat(size, 2000), setup=lambda: build_plan_graph(size),
+        ),
+    }
+
+
+def bench_summarize_plan(size):
+    plan_graph = build_plan_graph(size)
+    return {"summarize_plan": timed(lambda _: plan_graph.summarize_plan(), _repeat(size))}
+
+
+def bench_execution_history(size):
+    steps = build_history(size)
+    return {
+        "cached": timed(lambda _: steps.execution_history_to_str(), _repeat(size, 200000)),
+        "add_and_render": timed(
+            lambda _: (steps.add_step(Step(name="extra", description="Extra", result=RESULT)),
+                       steps.execution_history_to_str()),
+            _repeat(size),
+        ),
+        "cold": timed(
+            lambda s: s.execution_history_to_str(), _repeat(size, 2000), setup=lambda: build_history(size)
+        ),
+    }
+
+
+def bench_prompt_formatting(size, planner, evaluator):
+    context_manager = build_context(size)
+    node = Node(id=f"step_{size}", task_description="Summarize the flagged orders.")
+    planner.context_manager = context_manager
+
+    def execute_prompt(_):
+        return planner.execute_prompt.format(
+            context=context_manager.render_for(ContextRole.EXECUTE, node.id),
+            task="Audit the orders", background="", task_use_tool=False, tool_description="",
+            task_description=f"<Step {node.id}>\nTask Desc: {node.task_description}\n</Step {node.id}>",
+        )
+
+    def evaluation_prompt(_):
+        return evaluator.prompt.format(
+            root_task="Audit the orders", request=node.task_description, response=RESULT,
+            background="", context=context_manager.render_for(ContextRole.EVALUATE),
+        )
+
+    return {
+        "execute_prompt": timed(execute_prompt, _repeat(size)),
+        "evaluation_prompt": timed(evaluation_prompt, _repeat(size)),
+    }
+
+
+def bench_execute_plan(size, planner):
+    """execute_plan end to end on a linear plan, the fake model answering instantly."""
+
+    def setup():
+        planner.plan_graph = build_plan_graph(size)
+        return ContextManager()
+
+    def run(context_manager):
+        planner.execute_plan(None, "Audit the orders", Steps(), False, {}, context_manager)
+
+    result = timed(run, max(1, _repeat(size, 1000) // 3), setup=setup)
+    result["per_node_us"] = result["per_call_us"] / size
+    return {"execute_plan": result}
+
+
+def bench_score_parser(evaluator):
+    with open(CORPUS, encoding="utf-8") as f:
+        texts = [json.loads(line)["evaluation"] for line in f if line.strip()]
+    return {
+        "parse_scored_evaluation_response": timed(
+            lambda _: [evaluator.parse_scored_evaluation_response(text) for text in texts], 2000
+        ),
+        "evaluations_per_call": len(texts),
+    }
+
+
+# Benchmarks taking a size and the largest size each one runs at
+SIZED = {
+    "context_to_str": (bench_context_to_str, 10000),
+    "context_pruning": (bench_context_pruning, 10000),
+    "apply_adjustments_to_plan": (bench_apply_adjustments, 10000),
+    "summarize_plan": (bench_summarize_plan, 10000),
+    "execution_history_to_str": (bench_execution_history, 10000),
+    "prompt_formatting": (bench_prompt_formatting, 10000),
+    # Each node renders the whole context, so a plan costs O(n^2) characters
+    "execute_plan": (bench_execute_plan, 1000),
+}
+
+
+def run(sizes, only=None) -> dict:
+    model = FakeModel()
+    ModelRegistry.register_model(model)
+    planner = GraphPlanner(model.name)
+    evaluator = GenericEvaluator(model.name)
+
+    results = []
+    for name, (bench, max_size) in SIZED.items():
+        if only and not any(part in name for part in only):
+            continue
+        for size in sizes:
+            if size > max_size:
+                continue
+            if bench is bench_prompt_formatting:
+                measured = bench(size, planner, evaluator)
+            elif bench is bench_execute_plan:
+                measured = bench(size, planner)
+            else:
+                measured = bench(size)
+            results.append({"benchmark": name, "size": size, "results": measured})
+    if not only or any(part in "score_parser" for part in only):
+        results.append({"benchmark": "score_parser", "size": None, "results": bench_score_parser(evaluator)})
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": sizes,
+        "benchmarks": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--only", nargs="+", help="run the benchmarks whose name contains one of these")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.only)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for entry in report["benchmarks"]:
+        size = "" if entry["size"] is None else f"n={entry['size']}"
+        for case, measured in entry["results"].items():
+            if isinstance(measured, dict):
+                print(f"{entry['benchmark']:>26} {size:>8} {case:>34}: {measured['per_call_us']:>12.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
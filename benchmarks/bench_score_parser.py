@@ -0,0 +1,94 @@
+# benchmarks/bench_score_parser.py
+"""
+Throughput of the evaluation score parser over the corpus of evaluator outputs in
+benchmarks/data/evaluator_outputs.jsonl, compared with the previous line-by-line parser.
+
+    python benchmarks/bench_score_parser.py [--repeat 2000] [--json]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent_core.evaluators.score_parser import parse_scores  # noqa: E402
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "evaluator_outputs.jsonl")
+
+_LEGACY_PATTERNS = [
+    r"\d+\.\s\*\*([A-Za-z\s]+)\*\*\s\(Score\s1-5\):\s*Score:\s*(\d)",
+    r"\d+\.\s\*\*([A-Za-z\s]+) \(Score (\d+)\)",
+    r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\(Score:? (\d+)\)\*\*",
+    r"\d+\.\s+\*\*([A-Za-z\s]+)\*\* \(Score (\d+)\):",
+    r"\*\*([A-Za-z\s]+)\s*\(Score\s1-5\):\s*(\d+)\*\*",
+    r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\(Score\s1-5\):\*\*\s*(\d+)",
+    r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\(Score\s1-5\):\s*(\d+)\*\*",
+    r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\(Score\s1-5\)\*\*:\s*(\d+)",
+    r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\((\d+)/5\):\*\*",
+    r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\((\d+)\):\*\*",
+    r"\d+\.\s+\*\*([A-Za-z\s]+)\s*\(Score:\s*(\d+)\):\*\*",
+]
+
+
+def legacy_parse(evaluation):
+    """The parser GenericEvaluator used before score_parser: every pattern on every line."""
+    scores = []
+    for line in evaluation.strip().split("\n"):
+        matches = [re.match(pattern, line) for pattern in _LEGACY_PATTERNS]
+        match = next((m for m in matches if m), None)
+        if match:
+            scores.append((match.group(1).strip(), int(match.group(2))))
+    return scores
+
+
+def load_corpus(path=CORPUS):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def check(corpus):
+    for record in corpus:
+        parsed = parse_scores(record["evaluation"])
+        if parsed.total != record["total_score"] or len(parsed.scores) != record["criteria"]:
+            raise AssertionError(f"{record['source']}: parsed {parsed.scores}")
+
+
+def timed(parse, texts, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            parse(text)
+    elapsed = time.perf_counter() - start
+    return {"seconds": elapsed, "per_second": len(texts) * repeat / elapsed}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus()
+    check(corpus)
+    texts = [record["evaluation"] for record in corpus]
+    results = {
+        "evaluations": len(texts) * args.repeat,
+        "score_parser": timed(parse_scores, texts, args.repeat),
+        "legacy": timed(legacy_parse, texts, args.repeat),
+    }
+    results["speedup"] = results["legacy"]["seconds"] / results["score_parser"]["seconds"]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name in ("score_parser", "legacy"):
+            print(f"{name:>12}: {results[name]['per_second']:>10.0f} evaluations/s")
+        print(f"{'speedup':>12}: {results['speedup']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
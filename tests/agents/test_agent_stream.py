@@ -0,0 +1,90 @@
+# tests/agents/test_agent_stream.py
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from agent_core.agents import Agent
+from agent_core.planners import GenericPlanner
+from agent_core.utils.events import EventType
+
+PLAN = json.dumps({"steps": [
+    {"step_name": f"s{i}", "step_description": f"do step {i}", "use_tool": False}
+    for i in range(1, 4)
+]})
+
+
+def _join_runs():
+    for thread in threading.enumerate():
+        if thread.name == "agent-run":
+            thread.join(5)
+
+
+def test_stream_and_astream_end_with_run_finished(scripted_model):
+    model = scripted_model(lambda prompt: "the answer")
+    agent = Agent(model.name)
+
+    events = list(agent.stream("question"))
+    assert events[0].type == EventType.TOKEN_DELTA
+    assert events[-1].type == EventType.RUN_FINISHED
+    assert events[-1].data == {"status": "completed", "result": "the answer"}
+
+    async def consume():
+        return [event async for event in agent.astream("question")]
+
+    async_events = asyncio.run(consume())
+    assert [e.type for e in async_events] == [e.type for e in events]
+
+
+def test_execute_runs_on_the_callers_thread(scripted_model):
+    threads = []
+
+    def responder(prompt):
+        threads.append(threading.current_thread())
+        return "the answer"
+
+    agent = Agent(scripted_model(responder).name)
+    assert agent.execute("question") == "the answer"
+    assert threads == [threading.current_thread()]
+
+
+def test_closing_the_stream_early_cancels_the_run(scripted_model):
+    release = threading.Event()
+
+    def responder(prompt):
+        if "Steps:" in prompt:
+            return PLAN
+        release.wait(5)
+        return "step result"
+
+    model = scripted_model(responder)
+    agent = Agent(model.name)
+    agent.planner = GenericPlanner(model.name)
+
+    stream = agent.stream("task")
+    for event in stream:
+        if event.type == EventType.PLAN_CREATED:
+            break
+    stream.close()
+    release.set()
+    _join_runs()
+
+    # The run stopped at its next event instead of executing the remaining steps
+    assert len([p for p in model.prompts if "do step" in p and "Steps:" not in p]) <= 1
+    assert not any("Execution History" in p for p in model.prompts)
+
+
+def test_base_exceptions_still_finish_the_run(scripted_model):
+    def responder(prompt):
+        raise SystemExit("tool exited")
+
+    agent = Agent(scripted_model(responder).name)
+    events = list(agent.stream("task"))
+    assert events[-1].type == EventType.RUN_FINISHED
+    assert events[-1].data["status"] == "error"
+    assert isinstance(events[-1].data["error"], SystemExit)
+
+    with pytest.raises(SystemExit):
+        agent.execute("task")
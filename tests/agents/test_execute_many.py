@@ -0,0 +1,62 @@
+# tests/agents/test_execute_many.py
+
+import json
+import re
+import threading
+
+import pytest
+
+from agent_core.agents import Agent
+from agent_core.planners import GenericPlanner, GraphPlanner
+
+TASKS = [f"task-{i}" for i in range(6)]
+
+
+def _responder(threads):
+    def respond(prompt):
+        threads.add(threading.current_thread().name)
+        task = re.search(r"task-\d+", prompt).group(0)
+        if "Steps:" in prompt:
+            return json.dumps({"steps": [
+                {"step_name": f"{task}-{i}", "step_description": f"work on {task} part {i}", "use_tool": False}
+                for i in (1, 2)
+            ]})
+        if "Execution History:" in prompt:
+            return f"final answer for {task}"
+        if task == "task-3":
+            raise ValueError("task-3 cannot be done")
+        if "Task Use Tool:" in prompt:
+            return json.dumps({"use_tool": False, "response": f"result of {task}"})
+        return f"result of {task}"
+
+    return respond
+
+
+@pytest.mark.parametrize("planner_class", [GenericPlanner, GraphPlanner])
+def test_execute_many_isolates_tasks_and_captures_errors(scripted_model, planner_class):
+    threads = set()
+    model = scripted_model(_responder(threads))
+    agent = Agent(model.name)
+    agent.planner = planner_class(model.name)
+    planner_state = dict(vars(agent.planner))
+    context_before = agent.context.context_to_str()
+
+    outcomes = sorted(agent.execute_many(TASKS, concurrency=3), key=lambda outcome: outcome.index)
+
+    assert [(o.index, o.task) for o in outcomes] == list(enumerate(TASKS))
+    failed = outcomes.pop(3)
+    assert not failed.succeeded and isinstance(failed.error, ValueError)
+    assert failed.result is None
+    for outcome in outcomes:
+        assert outcome.succeeded
+        assert outcome.result == f"final answer for {outcome.task}"
+        # Each task only sees its own steps
+        steps = outcome.execution_history.steps
+        assert len(steps) == 2 and all(outcome.task in step.description for step in steps)
+
+    # The agent's own state is untouched
+    assert agent.execution_history.steps == []
+    assert agent.context.context_to_str() == context_before
+    assert vars(agent.planner) == planner_state
+    # Tasks run on the pool threads, without a streaming thread per task
+    assert threads and all(name.startswith("agent-worker") for name in threads)
@@ -0,0 +1,66 @@
+# tests/conftest.py
+
+import itertools
+import threading
+
+import pytest
+
+from agent_core.evaluators import BaseEvaluator
+from agent_core.evaluators.entities.evaluator_result import EvaluatorResult
+from agent_core.models.base_model import BaseModel
+from agent_core.models.model_registry import ModelRegistry
+
+
+class CountingEvaluator(BaseEvaluator):
+    """An evaluator accepting every response with a fixed result and counting its calls."""
+
+    def __init__(self, model_name: str):
+        super().__init__(model_name)
+        self.calls = 0
+
+    def default_prompt(self):
+        return "Evaluate {response}"
+
+    def evaluate(self, root_task, request, response, background, context_manager):
+        self.calls += 1
+        return EvaluatorResult("Accept Output", 40, {"score_breakdown": [("Accuracy", 5)]})
+
+
+class ScriptedModel(BaseModel):
+    """An in-process model answering each prompt with responder(prompt) and recording the prompts."""
+
+    _ids = itertools.count()
+
+    def __init__(self, responder):
+        self._name = f"scripted-model-{next(self._ids)}"
+        self.responder = responder
+        self.prompts = []
+        self._lock = threading.Lock()
+        super().__init__()
+
+    def process(self, command: str) -> str:
+        with self._lock:
+            self.prompts.append(command)
+        return self.responder(command)
+
+    def name(self) -> str:
+        return self._name
+
+
+@pytest.fixture
+def scripted_model():
+    """Factory registering a ScriptedModel for a responder; use its .name as model_name."""
+
+    def make(responder) -> ScriptedModel:
+        model = ScriptedModel(responder)
+        ModelRegistry.register_model(model)
+        return model
+
+    return make
+
+
+@pytest.fixture
+def counting_evaluator(scripted_model):
+    """Factory of CountingEvaluators on a scripted model, e.g. evaluator = counting_evaluator()."""
+    model = scripted_model(lambda prompt: "")
+    return lambda: CountingEvaluator(model.name)
@@ -0,0 +1,32 @@
+# tests/planners/test_generic_planner_context.py
+
+from agent_core.entities.steps import Step, Steps
+from agent_core.planners.generic_planner import EARLIER_STEPS_KEY, GenericPlanner
+from agent_core.utils.context_manager import ContextManager
+
+
+def test_steps_are_kept_in_a_rolling_window(scripted_model):
+    planner = GenericPlanner(scripted_model(lambda prompt: "").name)
+    planner.history_window = 2
+    planner.history_digest_chars = 5
+    context_manager = ContextManager()
+    for idx in range(1, 5):
+        step = Step(name=f"s{idx}", description=f"do {idx}", result=f"result {idx}")
+        planner._add_step_context(context_manager, idx, step)
+    assert set(context_manager.context) == {
+        EARLIER_STEPS_KEY,
+        "Previous Step 3",
+        "Previous Step 4",
+    }
+    assert context_manager.context[EARLIER_STEPS_KEY] == "Step 1: resul...\nStep 2: resul..."
+
+
+def test_execution_history_rendering_follows_changes():
+    steps = Steps()
+    steps.add_step(Step(name="a", description="first", result="1"))
+    steps.add_step(Step(name="b", description="second", result="2"))
+    assert steps.execution_history_to_str().count("Step ") == 2
+    steps.steps[0].result = "changed"
+    steps.steps.pop()
+    rendered = steps.execution_history_to_str()
+    assert rendered == "Step 1: a\nDescription: first\nResult: changed\n"
@@ -0,0 +1,127 @@
+# tests/planners/test_generic_planner_dependencies.py
+
+import re
+import threading
+
+from agent_core.entities.steps import Step, Steps
+from agent_core.evaluators import GenericEvaluator
+from agent_core.planners.generic_planner import EARLIER_STEPS_KEY, GenericPlanner, resolve_dependencies
+from agent_core.utils.context_manager import ContextManager
+
+EVALUATION = "\n".join(f"{i}. **Criterion (Score 1-5):** 5" for i in range(1, 9))
+
+
+def _step_data(name, depends_on=None):
+    data = {"step_name": name, "step_description": f"do {name}", "use_tool": False}
+    if depends_on is not None:
+        data["depends_on"] = depends_on
+    return data
+
+
+def test_analyse_result_keeps_only_earlier_dependencies(scripted_model):
+    plan = GenericPlanner(scripted_model(lambda prompt: "").name).analyse_result(
+        [
+            _step_data("a", []),
+            _step_data("b", ["a", "c"]),
+            _step_data("c", "b"),
+            _step_data("d"),
+            _step_data("e", {"bad": 1}),
+        ],
+        ["default"],
+    )
+    assert [step.depends_on for step in plan.steps] == [[], ["a"], ["b"], None, None]
+
+
+def test_resolve_dependencies():
+    steps = [
+        Step("a", "do a", depends_on=[]),
+        Step("b", "do b", depends_on=[]),
+        Step("c", "do c", depends_on=["a", "b"]),
+        Step("d", "do d"),
+        Step("a", "do a again", depends_on=[]),
+        Step("e", "do e", depends_on=["a"]),
+    ]
+    assert resolve_dependencies(steps) == {
+        1: [], 2: [], 3: [1, 2], 4: [3], 5: [], 6: [5],
+    }
+
+
+def _run(scripted_model, steps_data, respond=None, evaluators_enabled=False, history_window=3):
+    """Execute the plan; returns (planner, model, context manager, execution history, log)."""
+    log = []
+    lock = threading.Lock()
+
+    def responder(prompt):
+        if "expert evaluator" in prompt:
+            return EVALUATION
+        name = re.search(r"^do (\w+)$", prompt, re.MULTILINE).group(1)
+        with lock:
+            log.append(("start", name))
+        result = respond(name, prompt) if respond else None
+        with lock:
+            log.append(("end", name))
+        return result or f"result of {name}"
+
+    model = scripted_model(responder)
+    planner = GenericPlanner(model.name)
+    planner.history_window = history_window
+    plan = planner.analyse_result(steps_data, ["default"])
+    context_manager, history = ContextManager(), Steps()
+    planner.execute_plan(
+        plan, "task", history, evaluators_enabled,
+        {"default": GenericEvaluator(model.name)}, context_manager,
+    )
+    return planner, model, context_manager, history, log
+
+
+def _step_prompt(model, name):
+    return next(p for p in model.prompts if f"\ndo {name}\n" in p and "expert evaluator" not in p)
+
+
+def test_independent_steps_overlap_and_dependents_wait(scripted_model):
+    both_running = threading.Barrier(2, timeout=5)
+
+    def respond(name, prompt):
+        if name in ("a", "b"):
+            # Only returns when the other independent step runs at the same time
+            both_running.wait()
+
+    _, model, _, history, log = _run(
+        scripted_model,
+        [_step_data("a", []), _step_data("b", []), _step_data("c", ["a", "b"])],
+        respond,
+    )
+    assert log.index(("start", "c")) > max(log.index(("end", "a")), log.index(("end", "b")))
+    assert "result of a" in _step_prompt(model, "c") and "result of b" in _step_prompt(model, "c")
+    assert [step.name for step in history.steps] == ["a", "b", "c"]
+
+
+def test_invalid_or_cyclic_dependencies_run_sequentially(scripted_model):
+    # 'a' depends on a later step and 'c' on itself: both are dropped, leaving a -> b -> c
+    _, model, _, history, log = _run(
+        scripted_model,
+        [_step_data("a", ["b"]), _step_data("b", ["a"]), _step_data("c", ["c", "b"]), _step_data("d", 3)],
+    )
+    assert log == [(event, name) for name in "abcd" for event in ("start", "end")]
+    assert "result of c" in _step_prompt(model, "d")
+    assert [step.name for step in history.steps] == ["a", "b", "c", "d"]
+
+
+def test_parallel_steps_are_evaluated_on_their_own_context_and_folded(scripted_model):
+    steps_data = [
+        _step_data("a", []), _step_data("b", ["a"]), _step_data("c", ["b"]),
+        _step_data("d", ["c"]), _step_data("e", ["a"]),
+    ]
+    _, model, context_manager, _, _ = _run(
+        scripted_model, steps_data, evaluators_enabled=True, history_window=1
+    )
+    evaluation = next(p for p in model.prompts if "expert evaluator" in p and "do d" in p)
+    assert "result of c" in evaluation
+    assert "result of a" not in evaluation and "result of b" not in evaluation
+    # 'a' stays in the context until 'e', which depends on it, has run
+    assert "result of a" in _step_prompt(model, "e")
+    # The same rolling window as sequential plans
+    assert set(context_manager.context) == {EARLIER_STEPS_KEY, "Previous Step 5"}
+    assert context_manager.context[EARLIER_STEPS_KEY].splitlines() == [
+        f"Step {idx}: result of {name}" for idx, name in enumerate("abcd", 1)
+    ]
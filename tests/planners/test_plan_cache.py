@@ -0,0 +1,41 @@
+# tests/planners/test_plan_cache.py
+
+from agent_core.entities.steps import Step, Steps
+from agent_core.planners.plan_cache import PlanCache, TaskNormalizer
+
+
+def test_normalize_extracts_entities():
+    normalizer = TaskNormalizer(component_names=["IE"])
+    template, params = normalizer.normalize(
+        "why did event id 10000 in IE fail at 2024-05-01T10:00:00Z"
+    )
+    assert template == "why did event id <<id_0>> in <<component_0>> fail at <<timestamp_0>>"
+    assert params == [("id_0", "10000"), ("component_0", "IE"), ("timestamp_0", "2024-05-01T10:00:00Z")]
+
+
+def test_cache_hit_substitutes_parameters():
+    cache = PlanCache(component_names=["IE", "OMS"])
+    scope = cache.scope_key("model", "prompt", "tools")
+    plan = Steps()
+    plan.add_step(Step(name="Get event 10000", description="Query event 10000 of IE", use_tool=True,
+                       tool_name="event", category="action"))
+    plan.add_step(Step(name="Summarize", description="Explain why IE failed", category="summarization"))
+    cache.put("why did event id 10000 in IE fail", scope, plan)
+
+    cached = cache.get("why did event id 10001 in OMS fail", scope)
+    assert cached is not None
+    assert cached.steps[0].name == "Get event 10001"
+    assert cached.steps[0].description == "Query event 10001 of OMS"
+    assert cached.steps[0].tool_name == "event"
+    assert cached.steps[1].description == "Explain why OMS failed"
+    assert cache.hits == 1
+
+
+def test_scope_change_misses():
+    cache = PlanCache()
+    plan = Steps()
+    plan.add_step(Step(name="a", description="b"))
+    cache.put("event 10000", cache.scope_key("tools v1"), plan)
+    assert cache.get("event 10000", cache.scope_key("tools v2")) is None
+    assert cache.get("draw a flower", cache.scope_key("tools v1")) is None
+    assert cache.misses == 2
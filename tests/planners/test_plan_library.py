@@ -0,0 +1,68 @@
+# tests/planners/test_plan_library.py
+
+from agent_core.entities.steps import Step, Steps
+from agent_core.evaluators import GenericEvaluator
+from agent_core.planners import GenericPlanner
+from agent_core.planners.plan_library import PlanLibrary
+from agent_core.utils.context_manager import ContextManager
+
+
+def _plan(*names):
+    plan = Steps()
+    for name in names:
+        plan.add_step(Step(name=name, description=f"{name} description", category="action"))
+    return plan
+
+
+def test_similar_tasks_are_retrieved(tmp_path):
+    path = tmp_path / "plans.jsonl"
+    library = PlanLibrary(path=str(path))
+    library.add("why did the payment service fail to process event id 10000", _plan("Get event", "Explain"))
+    library.add("draw a dragon with emoji characters", _plan("Pick emoji", "Draw"))
+
+    similar = library.similar("why did the payment service fail to process event id 10001")
+    assert similar
+    assert similar[0][1]["task"].startswith("why did the payment service")
+    assert all("dragon" not in record["task"] for _, record in similar)
+
+    examples = library.format_examples("why did the payment service fail to process event id 10001")
+    assert '"step_name": "Get event"' in examples
+
+    reloaded = PlanLibrary(path=str(path))
+    assert len(reloaded) == 2
+
+
+def test_no_examples_for_unrelated_task():
+    library = PlanLibrary()
+    library.add("draw a dragon with emoji characters", _plan("Draw"))
+    assert library.format_examples("summarize quarterly revenue report") == ""
+
+
+def test_readding_a_task_does_not_duplicate_lines(tmp_path):
+    path = tmp_path / "plans.jsonl"
+    library = PlanLibrary(path=str(path))
+    library.add("draw a dragon with emoji characters", _plan("Draw"))
+    library.add("draw a cat with emoji characters", _plan("Draw"))
+    library.add("draw a dragon with emoji characters", _plan("Draw"))
+    assert len(path.read_text().splitlines()) == 2
+
+    library.add("draw a dragon with emoji characters", _plan("Pick emoji", "Draw"))
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2 and '"Pick emoji"' in lines[-1]
+    reloaded = PlanLibrary(path=str(path))
+    assert len(reloaded) == 2
+    assert "Pick emoji" in reloaded.format_examples("draw a dragon with emoji characters")
+
+
+def test_only_evaluated_plans_are_stored(scripted_model):
+    evaluation = "\n".join(f"{i}. **Criterion (Score 1-5):** 5" for i in range(1, 9))
+    model = scripted_model(lambda prompt: evaluation if "expert evaluator" in prompt else "done")
+    planner = GenericPlanner(model.name)
+    planner.plan_library = PlanLibrary()
+    evaluators = {"default": GenericEvaluator(model.name)}
+
+    task = "draw a dragon with emoji characters"
+    planner.execute_plan(_plan("Draw"), task, Steps(), False, evaluators, ContextManager())
+    assert len(planner.plan_library) == 0
+    planner.execute_plan(_plan("Draw"), task, Steps(), True, evaluators, ContextManager())
+    assert len(planner.plan_library) == 1
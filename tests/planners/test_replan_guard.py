@@ -0,0 +1,38 @@
+# tests/planners/test_replan_guard.py
+
+from agent_core.planners.graph_planner import Node, PlanGraph
+from agent_core.planners.replan_guard import Escalation, ReplanGuard, find_cycle
+
+
+def _chain(*ids):
+    pg = PlanGraph()
+    for idx, node_id in enumerate(ids):
+        next_nodes = [ids[idx + 1]] if idx + 1 < len(ids) else []
+        pg.add_node(Node(id=node_id, task_description=f"task {node_id}", next_nodes=next_nodes))
+    return pg
+
+
+def test_find_cycle():
+    pg = _chain("A", "B", "C")
+    assert find_cycle(pg) is None
+    pg.nodes["C"].next_nodes = ["B"]
+    assert find_cycle(pg) == ["B", "C", "B"]
+
+
+def test_repeated_state_escalates_until_abort():
+    pg = _chain("A", "B", "C")
+    guard = ReplanGuard()
+    replan = {"action": "replan", "restart_node_id": "A"}
+
+    assert guard.record_adjustment(pg, "B", replan) == Escalation.NONE
+    assert guard.record_adjustment(pg, "B", replan) == Escalation.FORCE_BREAKDOWN
+    assert "breakdown" in "\n".join(guard.replan_constraints())
+    assert guard.record_adjustment(pg, "B", replan) == Escalation.PENALIZE_REPLAN
+    assert guard.record_adjustment(pg, "B", replan) == Escalation.ABORT
+
+
+def test_node_visits_limit():
+    guard = ReplanGuard(max_node_visits=2)
+    assert not guard.record_visit("A")
+    assert not guard.record_visit("A")
+    assert guard.record_visit("A")
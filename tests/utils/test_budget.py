@@ -0,0 +1,49 @@
+# tests/utils/test_budget.py
+
+from agent_core.utils.budget import (
+    DegradationLevel,
+    RunBudget,
+    activate_budget,
+    get_active_budget,
+)
+
+
+def test_no_budget_means_no_tracker():
+    with activate_budget(None) as tracker:
+        assert tracker is None
+        assert get_active_budget() is None
+
+
+def test_degradation_order():
+    with activate_budget(RunBudget(max_llm_calls=10)) as tracker:
+        assert get_active_budget() is tracker
+        assert tracker.level() == DegradationLevel.NORMAL
+        assert tracker.max_attempts(3) == 3
+
+        for _ in range(5):
+            tracker.record_llm_call(10, 10)
+        assert tracker.level() == DegradationLevel.CUT_ATTEMPTS
+        assert tracker.max_attempts(3) == 1
+        assert not tracker.should_skip_evaluation("summarization")
+
+        for _ in range(2):
+            tracker.record_llm_call(10, 10)
+        assert tracker.should_skip_evaluation("summarization")
+        assert not tracker.should_skip_evaluation("coding")
+        assert not tracker.prefer_breakdown
+
+        tracker.record_llm_call(10, 10)
+        tracker.record_llm_call(10, 10)
+        assert tracker.prefer_breakdown
+        assert not tracker.exhausted
+
+        tracker.record_llm_call(10, 10)
+        assert tracker.exhausted
+        assert tracker.tokens_used == 200
+    assert get_active_budget() is None
+
+
+def test_tightest_limit_wins():
+    with activate_budget(RunBudget(max_tokens=100, max_llm_calls=100)) as tracker:
+        tracker.record_llm_call(60, 40)
+        assert tracker.exhausted
@@ -0,0 +1,101 @@
+# tests/utils/test_context_compactor.py
+
+import threading
+
+from agent_core.models.base_model import BaseModel
+from agent_core.models.model_registry import ModelRegistry
+from agent_core.utils.budget import RunBudget, activate_budget
+from agent_core.utils.context_compactor import ContextCompactor
+from agent_core.utils.context_manager import ContextManager
+from agent_core.utils.events import EventStream, activate_stream
+
+
+class SummaryModel(BaseModel):
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.release.set()
+        self.calls = 0
+        self.summary = "summary"
+
+    def process(self, command: str) -> str:
+        self.release.wait(5)
+        self.calls += 1
+        return self.summary
+
+    def name(self) -> str:
+        return "compactor-test-model"
+
+
+def _compactor(**kwargs):
+    model = SummaryModel()
+    ModelRegistry.register_model(model)
+    return model, ContextCompactor(model.name, **kwargs)
+
+
+def test_aged_results_are_summarized_and_originals_kept():
+    _, compactor = _compactor(max_age_steps=2, max_tokens=10_000)
+    c = compactor.attach(ContextManager())
+    for node_id in ["A", "B", "C"]:
+        c.add_node_result(node_id, f"long result of {node_id} " * 10)
+    compactor.flush(5)
+    assert c.context["Previous Step A"] == "summary"
+    assert c.get_entry("Previous Step A").summarized
+    assert c.original("Previous Step A").startswith("long result of A")
+    assert c.context["Previous Step C"].startswith("long result of C")
+    assert c.context_to_str().count("summary") == 1
+    compactor.close()
+
+
+def test_summary_is_discarded_when_entry_changed():
+    model, compactor = _compactor(max_age_steps=10, max_tokens=5)
+    model.release.clear()
+    c = compactor.attach(ContextManager())
+    c.add_node_result("A", "first result " * 10)
+    c.add_node_result("A", "second result " * 10)
+    model.release.set()
+    compactor.flush(5)
+    assert c.context["Previous Step A"] == "second result " * 10
+    assert not c.get_entry("Previous Step A").summarized
+    compactor.close()
+
+
+def test_useless_summaries_are_not_retried():
+    model, compactor = _compactor(max_age_steps=1, max_tokens=10_000)
+    model.summary = "a summary longer than the original result"
+    c = compactor.attach(ContextManager())
+    c.add_node_result("A", "short A")
+    for node_id in ["B", "C", "D"]:
+        c.add_node_result(node_id, f"short {node_id}")
+        compactor.flush(5)
+    # A, B and C were each tried once; the unchanged values are not queued again
+    assert model.calls == 3
+    assert c.context["Previous Step A"] == "short A"
+    compactor.close()
+
+
+def test_summaries_count_against_the_run_budget():
+    _, compactor = _compactor(max_age_steps=1, max_tokens=10_000)
+    c = compactor.attach(ContextManager())
+    with activate_budget(RunBudget()) as tracker:
+        c.add_node_result("A", "long result of A " * 10)
+        c.add_node_result("B", "long result of B " * 10)
+        compactor.flush(5)
+    assert tracker.llm_calls == 1
+    compactor.close()
+
+
+def test_summaries_do_not_emit_into_the_run_stream():
+    _, compactor = _compactor(max_age_steps=1, max_tokens=10_000)
+    c = compactor.attach(ContextManager())
+    events = []
+    stream = EventStream(events.append)
+    with activate_stream(stream):
+        # The consumer is gone: an emit would raise RunCancelled in the summary job
+        stream.cancel()
+        c.add_node_result("A", "long result of A " * 10)
+        c.add_node_result("B", "long result of B " * 10)
+        compactor.flush(5)
+    assert c.context["Previous Step A"] == "summary"
+    assert events == []
+    compactor.close()
@@ -1,6 +1,6 @@
 # tests/utils/test_context_manager.py
 
-from agent_core.utils.context_manager import ContextManager
+from agent_core.utils.context_manager import ContextManager, EntryKind
 
 
 def test_add_remove_context():
@@ -23,3 +23,91 @@ def test_context_to_str_non_empty():
     output = c.context_to_str()
     assert "<context>" in output and "</context>" in output
     assert "<foo>" in output and "</foo>" in output
+
+
+def _full_render(c):
+    return "<Context>\n" + "".join(
+        f"<{key}>\n{value}\n</{key}>\n" for key, value in c.context.items()
+    ) + "</Context>\n"
+
+
+def test_context_to_str_follows_changes():
+    c = ContextManager()
+    c.add_context("a", "1")
+    c.add_context("b", "2")
+    c.context_to_str()
+    c.add_context("c", "3")
+    c.add_context("a", "updated")
+    c.remove_context("b")
+    assert c.context_to_str() == _full_render(c)
+    c.remove_context("a")
+    c.remove_context("c")
+    assert c.context_to_str() == ""
+
+
+def test_direct_mutation_and_assignment_keep_rendering_in_sync():
+    c = ContextManager()
+    c.add_context("a", "1")
+    c.context_to_str()
+    c.context["b"] = "2"
+    c.context.pop("a")
+    assert c.context_to_str() == _full_render(c)
+    c.context |= {"c": "3"}
+    assert c.get_entry("c") is not None
+    assert c.context_to_str() == _full_render(c)
+    snapshot = c.context.copy()
+    snapshot["d"] = "4"
+    assert "d" not in c.context_to_str()
+    c.context = {"x": "y"}
+    assert c.context_to_str() == "<Context>\n<x>\ny\n</x>\n</Context>\n"
+
+
+def test_render_subset():
+    c = ContextManager()
+    c.add_context("a", "1")
+    c.add_context("b", "2")
+    assert c.render(["b", "missing"]) == "<Context>\n<b>\n2\n</b>\n</Context>\n"
+    assert c.render([]) == ""
+
+
+def test_entries_typed_from_legacy_keys():
+    c = ContextManager()
+    c.add_context("Previous Step B.2 Failed Attempt 1", "x")
+    c.add_context("Previous Step A", "y")
+    c.add_context("role", "user")
+    failed = c.get_entry("Previous Step B.2 Failed Attempt 1")
+    assert (failed.node_id, failed.attempt, failed.kind) == ("B.2", 1, EntryKind.FAILED_ATTEMPT)
+    assert c.get_entry("Previous Step A").kind == EntryKind.RESULT
+    assert c.get_entry("role").kind == EntryKind.OTHER
+    assert [e.key for e in c.entries(node_id="A")] == ["Previous Step A"]
+
+
+def test_remove_failed_attempts_of_node_and_descendants():
+    c = ContextManager()
+    c.add_failed_attempt("B", 1, "x")
+    c.add_failed_attempt("B.2", 1, "x")
+    c.add_failed_attempt("B.2.1", 2, "x")
+    c.add_failed_attempt("B.10", 1, "x")
+    c.add_node_result("B.2", "ok")
+    removed = c.remove_failed_attempts("B.2")
+    assert sorted(removed) == [
+        "Previous Step B.2 Failed Attempt 1",
+        "Previous Step B.2.1 Failed Attempt 2",
+    ]
+    assert set(c.context) == {
+        "Previous Step B Failed Attempt 1",
+        "Previous Step B.10 Failed Attempt 1",
+        "Previous Step B.2",
+    }
+    assert c.context_to_str() == _full_render(c)
+
+
+def test_remove_node_range():
+    c = ContextManager()
+    for node_id in ["A", "B", "B.1", "C", "D", "D.1", "E"]:
+        c.add_node_result(node_id, node_id)
+    c.add_context("role", "user")
+    c.remove_node_range("B", "D")
+    assert set(c.context) == {"Previous Step A", "Previous Step E", "role"}
+    c.cleanup_context("A", None)
+    assert set(c.context) == {"Previous Step E", "role"}
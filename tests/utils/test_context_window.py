@@ -0,0 +1,63 @@
+# tests/utils/test_context_window.py
+
+from agent_core.utils.context_manager import ContextManager, EntryKind
+from agent_core.utils.context_window import (
+    ContextRole,
+    ContextWindow,
+    NodeDistancePolicy,
+    PinnedPolicy,
+    RecencyPolicy,
+    SizeWeightedPolicy,
+)
+
+
+def _manager():
+    c = ContextManager()
+    c.add_context("Execution History", "h" * 40)
+    for node_id in ["A", "B", "C", "D"]:
+        c.add_node_result(node_id, node_id * 40)
+    return c
+
+
+def test_no_window_renders_full_context():
+    c = _manager()
+    assert c.render_for(ContextRole.EXECUTE) == c.context_to_str()
+
+
+def test_recency_evicts_oldest_entries_and_tracks_them():
+    c = _manager()
+    window = ContextWindow({ContextRole.EXECUTE: 30}, [RecencyPolicy()])
+    c.window = window
+    rendered = c.render_for(ContextRole.EXECUTE)
+    assert "<Previous Step D>" in rendered
+    assert "<Execution History>" not in rendered
+    evicted = [entry.key for entry in window.evicted(ContextRole.EXECUTE)]
+    assert "Execution History" in evicted
+    # Roles without a budget are not bounded
+    assert c.render_for(ContextRole.REPLAN) == c.context_to_str()
+
+
+def test_pinned_and_restored_entries_are_kept():
+    c = _manager()
+    window = ContextWindow(
+        {ContextRole.EVALUATE: 30},
+        [PinnedPolicy(kinds=[EntryKind.HISTORY]), RecencyPolicy()],
+    )
+    c.window = window
+    assert "<Execution History>" in c.render_for(ContextRole.EVALUATE)
+    window.restore("Previous Step A")
+    rendered = c.render_for(ContextRole.EVALUATE)
+    assert "<Previous Step A>" in rendered
+    assert "<Previous Step D>" not in rendered
+
+
+def test_node_distance_and_size_weighted():
+    c = _manager()
+    c.add_context("big", "x" * 400)
+    c.window = ContextWindow(
+        {ContextRole.EXECUTE: 40}, [NodeDistancePolicy(), SizeWeightedPolicy()]
+    )
+    rendered = c.render_for(ContextRole.EXECUTE, current_node_id="B")
+    assert "<big>" not in rendered
+    assert "<Previous Step B>" in rendered
+    assert "<Previous Step D>" not in rendered
@@ -0,0 +1,46 @@
+# tests/utils/test_import_time.py
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+# Total import time allowed for the public entry points (microseconds)
+IMPORT_BUDGET_US = 1_500_000
+HEAVY_MODULES = ("langchain_openai", "openai", "pydantic_settings", "agent_core.models.gpt_4o_mini")
+
+
+def _import_times(statement: str):
+    """(cumulative import time per module, total time of the top-level imports) from python -X importtime."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT), os.environ.get("PYTHONPATH", "")]))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, env=env, cwd=ROOT, check=True,
+    )
+    times, total = {}, 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+        # Nested imports are indented below their importer
+        if not module[1:].startswith(" "):
+            total += int(cumulative)
+    return times, total
+
+
+def test_packages_import_without_the_model_stack():
+    times, _ = _import_times("import agent_core, agent_core.agents, agent_core.planners, agent_core.evaluators")
+    assert [module for module in HEAVY_MODULES if module in times] == []
+    assert "agent_core.agents.agent" not in times
+
+
+def test_public_classes_import_within_budget():
+    times, total = _import_times(
+        "from agent_core.agents import Agent\n"
+        "from agent_core.planners import GenericPlanner, GraphPlanner\n"
+        "from agent_core.evaluators import GenericEvaluator"
+    )
+    assert [module for module in HEAVY_MODULES if module in times] == []
+    assert total < IMPORT_BUDGET_US
@@ -0,0 +1,68 @@
+# tests/utils/test_logger.py
+
+import json
+import logging
+import logging.handlers
+import threading
+
+from agent_core.utils.logger import JsonFormatter, capped, get_logger
+
+
+def test_loggers_are_cached_and_share_a_queue_handler():
+    first = get_logger("test-logger-a", "DEBUG")
+    assert get_logger("test-logger-a") is first
+    # Without an explicit level the configured one is kept
+    assert first.level == logging.DEBUG
+    get_logger("test-logger-a", "error")
+    assert first.level == logging.ERROR
+
+    second = get_logger("test-logger-b")
+    assert len(first.handlers) == 1
+    assert isinstance(first.handlers[0], logging.handlers.QueueHandler)
+    assert first.handlers == second.handlers
+
+
+def test_capped_payloads_are_rendered_lazily():
+    class Payload:
+        renders = 0
+
+        def __str__(self):
+            Payload.renders += 1
+            return "x" * 5000
+
+    logger = get_logger("test-logger-lazy", "WARNING")
+    logger.debug("Prompt: %s", capped(Payload()))
+    assert Payload.renders == 0
+
+    text = str(capped(Payload(), 100))
+    assert text.startswith("x" * 100) and text.endswith("[4900 more characters]")
+    assert str(capped("short", 100)) == "short"
+
+
+def test_json_formatter_includes_extra_fields():
+    record = logging.makeLogRecord(
+        {"name": "agent", "levelno": logging.INFO, "levelname": "INFO",
+         "msg": "Node %s done", "args": ("n1",), "node_id": "n1"}
+    )
+    data = json.loads(JsonFormatter().format(record))
+    assert data["message"] == "Node n1 done"
+    assert data["level"] == "INFO" and data["logger"] == "agent"
+    assert data["node_id"] == "n1"
+
+
+def test_records_are_formatted_on_the_listener_thread():
+    rendered = threading.Event()
+    threads = []
+
+    class Payload:
+        def __str__(self):
+            threads.append(threading.current_thread())
+            rendered.set()
+            return "payload"
+
+    logger = get_logger("test-logger-listener", "INFO")
+    # pytest's capture handler on the root logger would format the record in this thread
+    logger.propagate = False
+    logger.info("Response: %s", capped(Payload()))
+    assert rendered.wait(5)
+    assert threads[0] is not threading.current_thread()
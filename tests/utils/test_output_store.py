@@ -0,0 +1,27 @@
+# tests/utils/test_output_store.py
+
+import os
+
+from agent_core.utils.output_store import OutputRef, OutputStore
+
+
+def test_intern_returns_shared_instance():
+    store = OutputStore()
+    first = "".join(["tool ", "response"])
+    second = "".join(["tool ", "resp", "onse"])
+    assert first is not second
+    assert store.intern(first) is store.intern(second)
+    assert store.intern(None) is None
+
+
+def test_spill_large_output(tmp_path):
+    store = OutputStore(spill_dir=str(tmp_path), spill_threshold=10)
+    assert store.spill("short") == "short"
+
+    output = "x" * 100
+    ref = store.spill(output)
+    assert isinstance(ref, OutputRef)
+    assert ref.size == 100
+    assert os.path.exists(ref.path)
+    assert str(ref) == output
+    assert store.spill(ref) is ref
@@ -0,0 +1,43 @@
+# tests/utils/test_tool_catalog.py
+
+from typing import Annotated
+
+from langchain_core.tools import tool
+
+from agent_core.utils.tool_catalog import ToolCatalog
+
+
+@tool("event")
+def get_event(
+    event_id: Annotated[str, "event id"],
+    limit: Annotated[int, "max number of records"],
+) -> str:
+    """Get event detail by event id"""
+    return f"event {event_id}"
+
+
+def test_catalog_is_built_once_per_tool_set():
+    catalog = ToolCatalog.of([get_event])
+    assert ToolCatalog.of([get_event]) is catalog
+    assert ToolCatalog.of(catalog) is catalog
+    assert catalog.get("event") is get_event
+    assert "event_id" in catalog.tools_knowledge
+
+
+def test_empty_catalog():
+    catalog = ToolCatalog.of(None)
+    assert catalog.tools_knowledge == ""
+    assert catalog.get("event") is None
+
+
+def test_validate_arguments():
+    catalog = ToolCatalog.of([get_event])
+    valid, errors = catalog.validate_arguments(get_event, {"event_id": "1000", "limit": 5})
+    assert valid and errors == ""
+
+    valid, errors = catalog.validate_arguments(get_event, {"event_id": "1000", "limit": "many"})
+    assert not valid
+    assert "limit" in errors
+
+    valid, errors = catalog.validate_arguments(get_event, ["1000"])
+    assert not valid
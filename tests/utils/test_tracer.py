@@ -0,0 +1,44 @@
+# tests/utils/test_tracer.py
+
+import json
+
+import pytest
+
+from agent_core.utils.tracer import Tracer
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+    with tracer.span("graph.node", node_id="A") as span:
+        span.set_attribute("score", 1.0)
+    assert tracer.spans == []
+
+
+def test_nested_spans_and_exports(tmp_path):
+    tracer = Tracer(enabled=True)
+    with tracer.span("agent.execute"):
+        with tracer.span("graph.node", node_id="A", attempt=1) as span:
+            span.set_attribute("score", 0.95)
+        with pytest.raises(ValueError):
+            with tracer.span("tool.invoke", tool="event"):
+                raise ValueError("bad arguments")
+
+    spans = {span.name: span for span in tracer.spans}
+    root = spans["agent.execute"]
+    assert root.parent_id is None
+    assert spans["graph.node"].parent_id == root.span_id
+    assert spans["graph.node"].trace_id == root.trace_id
+    assert spans["tool.invoke"].status == "error"
+
+    chrome_path = tmp_path / "trace.json"
+    tracer.export_chrome_trace(str(chrome_path))
+    events = json.loads(chrome_path.read_text())["traceEvents"]
+    assert {event["name"] for event in events} == set(spans)
+    assert all(event["ph"] == "X" for event in events)
+
+    otlp_path = tmp_path / "otlp.json"
+    tracer.export_otlp_json(str(otlp_path))
+    otlp_spans = json.loads(otlp_path.read_text())["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    node = next(s for s in otlp_spans if s["name"] == "graph.node")
+    assert node["parentSpanId"] == root.span_id
+    assert {"key": "node_id", "value": {"stringValue": "A"}} in node["attributes"]
@@ -0,0 +1,47 @@
+# tests/validators/test_batch_evaluation.py
+
+from agent_core.evaluators import GenericEvaluator
+from agent_core.models.base_model import BaseModel
+from agent_core.models.model_registry import ModelRegistry
+
+
+def _criteria(score):
+    return "\n".join(f"{i}. **Criterion (Score 1-5):** {score}" for i in range(1, 9))
+
+
+class JudgeModel(BaseModel):
+    def __init__(self):
+        super().__init__()
+        self.prompts = []
+
+    def process(self, command: str) -> str:
+        self.prompts.append(command)
+        if "Evaluation of each item" in command:
+            # Item 3 is unparseable and has to be evaluated alone
+            return (
+                f"### Item 1\n{_criteria(5)}\n**Total Score:** 40\n"
+                f"### Item 2\n{_criteria(2)}\n"
+                "### Item 3\nLooks fine.\n"
+            )
+        return _criteria(4)
+
+    def name(self) -> str:
+        return "batch-judge-model"
+
+
+def test_batch_results_map_back_to_items_with_single_fallback():
+    model = JudgeModel()
+    ModelRegistry.register_model(model)
+    evaluator = GenericEvaluator(model.name)
+    results = evaluator.evaluate_batch(
+        "task",
+        [("step 1", "answer 1"), ("step 2", "answer 2"), ("step 3", "answer 3"), ("step 4", "")],
+        "",
+        None,
+    )
+    assert [r.score for r in results] == [40, 16, 32, 0]
+    assert [r.decision for r in results[:2]] == ["Accept Output", "Rerun Subtask"]
+    assert results[0].details["batch_size"] == 3
+    assert results[3].details["pre_evaluation"] == "empty_output"
+    # One batch call plus one single-item fallback
+    assert len(model.prompts) == 2
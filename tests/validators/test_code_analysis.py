@@ -0,0 +1,94 @@
+# tests/validators/test_code_analysis.py
+
+import json
+
+from agent_core.evaluators import CodingEvaluator
+from agent_core.evaluators.code_analysis import analyse_code, extract_code_blocks
+from agent_core.models.base_model import BaseModel
+from agent_core.models.model_registry import ModelRegistry
+
+
+class ReviewerModel(BaseModel):
+    def __init__(self):
+        super().__init__()
+        self.prompts = []
+
+    def process(self, command: str) -> str:
+        self.prompts.append(command)
+        scores = [{"criterion": f"Criterion {i}", "score": 4, "justification": ""} for i in range(8)]
+        return json.dumps({"decision": "Accept Code", "scores": scores})
+
+    def name(self) -> str:
+        return "code-reviewer-model"
+
+
+BROKEN = "Here is the fix:\n```python\ndef add(a, b)\n    return a + b\n```\n"
+LINTED = """\
+```python
+import os
+import sys
+
+def load(path, cache={}):
+    try:
+        return open(path).read()
+    except:
+        return sys.stdin.read()
+```
+"""
+
+
+def test_extracts_fenced_and_bare_code():
+    blocks = extract_code_blocks("text\n```py\nx = 1\n```\nmore\n```bash\nls -l\n```")
+    assert [(b.language, b.code) for b in blocks] == [("py", "x = 1\n"), ("bash", "ls -l\n")]
+    assert extract_code_blocks("import math\nprint(math.pi)")[0].language == "python"
+    assert extract_code_blocks("Just an explanation.") == []
+
+
+def test_syntax_lint_and_complexity_findings():
+    broken = analyse_code(BROKEN)
+    assert broken.has_errors and broken.errors[0].line == 1
+    assert "SyntaxError" in broken.errors[0].message
+    # Valid fragments are not errors; context errors found by compile() are only warnings
+    for fragment in ("    def area(self):\n        return self.w * self.h\n", "await fetch()\n", "return 1\n"):
+        analysis = analyse_code(f"```python\n{fragment}```")
+        assert not analysis.has_errors, fragment
+    assert analyse_code("```python\nreturn 1\n```").findings[0].kind == "compile"
+    # Unlabelled blocks which are not Python are not errors
+    assert not analyse_code("```\n$ ls -l | grep x\n```").has_errors
+
+    messages = " ".join(f.message for f in analyse_code(LINTED).findings)
+    assert "'os' is imported but unused" in messages
+    assert "Bare 'except:'" in messages and "Mutable default" in messages
+    assert "sys" not in messages
+
+    branches = "\n".join(f"    if x == {i}:\n        return {i}" for i in range(12))
+    complex_code = f"```python\ndef pick(x):\n{branches}\n```"
+    assert analyse_code(complex_code, max_complexity=10).findings[0].kind == "complexity"
+
+
+def test_sandboxed_analysis_matches_in_process():
+    assert analyse_code(LINTED, sandbox=True).to_dict() == analyse_code(LINTED).to_dict()
+    assert analyse_code(BROKEN, sandbox=True).has_errors
+
+
+def test_coding_evaluator_rejects_broken_code_without_the_model():
+    model = ReviewerModel()
+    ModelRegistry.register_model(model)
+    evaluator = CodingEvaluator(model.name)
+
+    rejected = evaluator.evaluate("task", "write add()", BROKEN, "", None)
+    assert rejected.decision == "Reject Code" and rejected.score == 0
+    assert rejected.details["pre_evaluation"] == "static_analysis"
+    assert "line 1" in rejected.details["improvement_suggestions"]
+    assert model.prompts == []
+
+    reviewed = evaluator.evaluate("task", "write load()", LINTED, "", None)
+    assert reviewed.decision == "Accept Code"
+    assert "'os' is imported but unused" in model.prompts[0]
+    assert reviewed.details["static_analysis"]["blocks"] == 1
+    assert "do not re-check its syntax" in model.prompts[0]
+
+    evaluator.static_analysis = False
+    evaluator.evaluate("task", "write load()", LINTED, "", None)
+    assert "Not run." in model.prompts[1]
+    assert "do not re-check its syntax" not in model.prompts[1]
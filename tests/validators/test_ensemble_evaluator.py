@@ -0,0 +1,87 @@
+# tests/validators/test_ensemble_evaluator.py
+
+import threading
+
+import pytest
+
+from agent_core.evaluators import BaseEvaluator, EnsembleEvaluator
+from agent_core.evaluators.entities.evaluator_result import EvaluatorResult
+
+
+class FixedJudge(BaseEvaluator):
+    def __init__(self, model_name, score, release=None):
+        super().__init__(model_name, evaluation_threshold=0.9)
+        self.score = score
+        self.release = release
+        self.calls = 0
+
+    def default_prompt(self):
+        return ""
+
+    def evaluate(self, root_task, request, response, background, context_manager):
+        self.calls += 1
+        if self.release is not None:
+            self.release.wait(5)
+        return EvaluatorResult("", self.score, {})
+
+
+@pytest.fixture
+def judge(scripted_model):
+    """Factory of FixedJudges on a scripted model, e.g. judge(40)."""
+    model = scripted_model(lambda prompt: "")
+    return lambda score, release=None: FixedJudge(model.name, score, release)
+
+
+def _evaluate(ensemble):
+    return ensemble.evaluate("task", "step", "answer", "", None)
+
+
+def test_mean_and_variance_are_reported(judge):
+    ensemble = EnsembleEvaluator([judge(40), judge(36), judge(40)])
+    result = _evaluate(ensemble)
+    assert result.details["completed"] == 3
+    assert result.details["mean"] == pytest.approx(116 / 120)
+    assert result.details["variance"] > 0
+    assert result.score == pytest.approx(116 / 3)
+    assert result.decision == EnsembleEvaluator.ACCEPT
+    ensemble.close()
+
+
+def test_clear_rejection_stops_without_waiting_for_other_judges(judge):
+    release = threading.Event()
+    slow = [judge(40, release), judge(40, release)]
+    ensemble = EnsembleEvaluator([judge(0)] + slow)
+    result = _evaluate(ensemble)
+    release.set()
+    assert result.decision == EnsembleEvaluator.RERUN
+    assert result.details["completed"] == 1
+    # Only the quorum (2 of 3) was started; the third judge was never called
+    assert result.details["ran"] == 2 and result.details["skipped"] == 1
+    assert slow[1].calls == 0
+    assert result.details["stop_reason"].startswith("rejected")
+    ensemble.close()
+
+
+def test_quorum_agreement_stops_early(judge):
+    release = threading.Event()
+    judges = [judge(40), judge(40), judge(40)] + [
+        judge(0, release) for _ in range(2)
+    ]
+    ensemble = EnsembleEvaluator(judges, quorum=3)
+    result = _evaluate(ensemble)
+    release.set()
+    assert result.details["stop_reason"] == "quorum above threshold"
+    assert result.decision == EnsembleEvaluator.ACCEPT
+    assert result.details["ran"] == 3 and result.details["skipped"] == 2
+    assert [judge.calls for judge in judges] == [1, 1, 1, 0, 0]
+    ensemble.close()
+
+
+def test_remaining_judges_are_called_while_the_quorum_disagrees(judge):
+    judges = [judge(40), judge(30), judge(40), judge(40)]
+    ensemble = EnsembleEvaluator(judges, quorum=2)
+    result = _evaluate(ensemble)
+    assert [judge.calls for judge in judges] == [1, 1, 1, 1]
+    assert result.details["ran"] == 4 and result.details["skipped"] == 0
+    assert result.details["completed"] == 4
+    ensemble.close()
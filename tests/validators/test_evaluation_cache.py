@@ -0,0 +1,40 @@
+# tests/validators/test_evaluation_cache.py
+
+from agent_core.evaluators import EvaluationCache
+from agent_core.utils.context_manager import ContextManager
+
+
+def test_identical_evaluations_are_cached(counting_evaluator):
+    evaluator = counting_evaluator()
+    evaluator.cache = EvaluationCache(max_size=2)
+    context = ContextManager()
+    first = evaluator.evaluate("task", "step", "answer", "", context)
+    second = evaluator.evaluate("task", "step", "answer", "", context)
+    assert evaluator.calls == 1
+    assert (second.decision, second.score, second.details) == (
+        first.decision, first.score, first.details,
+    )
+    # A different response or context is evaluated again
+    evaluator.evaluate("task", "step", "other answer", "", context)
+    context.add_context("role", "user")
+    evaluator.evaluate("task", "step", "answer", "", context)
+    assert evaluator.calls == 3
+
+
+def test_lru_eviction_and_persistent_tier(tmp_path, counting_evaluator):
+    path = str(tmp_path / "evaluations.db")
+    evaluator = counting_evaluator()
+    evaluator.cache = EvaluationCache(max_size=1, path=path)
+    context = ContextManager()
+    evaluator.evaluate("task", "step", "a", "", context)
+    evaluator.evaluate("task", "step", "b", "", context)
+    # Evicted from memory, answered by the database
+    evaluator.evaluate("task", "step", "a", "", context)
+    assert evaluator.calls == 2
+    evaluator.cache.close()
+
+    restarted = counting_evaluator()
+    restarted.cache = EvaluationCache(path=path)
+    result = restarted.evaluate("task", "step", "b", "", context)
+    assert restarted.calls == 0
+    assert result.details == {"score_breakdown": [["Accuracy", 5]]}
@@ -0,0 +1,37 @@
+# tests/validators/test_evaluation_policy.py
+
+from agent_core.evaluators.evaluation_policy import EvaluationPolicy
+
+
+def test_novel_and_unreliable_categories_are_always_evaluated():
+    policy = EvaluationPolicy(min_samples=5, seed=0)
+    assert policy.should_evaluate("action", "event")
+    for _ in range(50):
+        policy.record("action", "event", passed=False)
+    assert all(policy.should_evaluate("action", "event") for _ in range(20))
+
+
+def test_reliable_category_is_sampled():
+    policy = EvaluationPolicy(min_samples=5, sample_rate=0.1, seed=0)
+    for _ in range(500):
+        policy.record("action", "event", passed=True)
+    decisions = [policy.should_evaluate("action", "event") for _ in range(200)]
+    assert 0 < sum(decisions) < 60
+    # A tool never seen in this category is still evaluated
+    assert policy.should_evaluate("action", "metric")
+    assert policy.metrics()["skipped"] > 0
+
+
+def test_pins_and_persistence(tmp_path):
+    path = str(tmp_path / "policy.json")
+    policy = EvaluationPolicy(path=path)
+    policy.pin("coding", EvaluationPolicy.NEVER)
+    policy.record("action", None, passed=True)
+    policy.save()
+    assert not policy.should_evaluate("coding")
+
+    reloaded = EvaluationPolicy(path=path)
+    assert not reloaded.should_evaluate("coding")
+    assert reloaded.pass_rate("action") == 1.0
+    reloaded.unpin("coding")
+    assert reloaded.should_evaluate("coding")
@@ -0,0 +1,83 @@
+# tests/validators/test_pre_evaluators.py
+
+from agent_core.entities.steps import Step
+from agent_core.evaluators.evaluation_policy import EvaluationPolicy
+from agent_core.evaluators.pre_evaluators import (
+    TOOL_ARGUMENTS_ERROR,
+    TOOL_RESPONSE_MARKER,
+    JsonCheck,
+    LengthCheck,
+    PreEvaluatorChain,
+)
+from agent_core.planners import GenericPlanner, GraphPlanner
+from agent_core.planners.graph_planner import Node
+
+
+def test_sentinels_and_empty_tool_output_skip_the_llm_evaluator(counting_evaluator):
+    evaluator = counting_evaluator()
+    sentinel = evaluator.evaluate(
+        "task", "step", f"{TOOL_ARGUMENTS_ERROR}\nValidation errors:\nlimit: bad", "", None
+    )
+    assert sentinel.score == 0
+    assert sentinel.details["pre_evaluation"] == "error_sentinel"
+    assert "limit: bad" in sentinel.details["reason"]
+
+    empty = evaluator.evaluate(
+        "task", "step", f"task tool description: x\n{TOOL_RESPONSE_MARKER} []", "", None
+    )
+    assert empty.details["pre_evaluation"] == "empty_output"
+    assert evaluator.calls == 0
+
+    assert evaluator.evaluate("task", "step", "  ", "", None).details["pre_evaluation"] == "empty_output"
+    assert evaluator.calls == 0
+
+    evaluator.evaluate("task", "step", "a real answer", "", None)
+    # Without a tool, an empty value can be the correct answer
+    evaluator.evaluate("task", "list the failed events", "[]", "", None)
+    evaluator.evaluate("task", "which event failed?", "None", "", None)
+    assert evaluator.calls == 3
+
+
+def test_optional_schema_and_length_checks():
+    chain = PreEvaluatorChain([JsonCheck(required_keys=["status"]), LengthCheck(max_chars=30)])
+    assert chain.run("step", "not json").details["pre_evaluation"] == "schema"
+    assert "status" in chain.run("step", '{"other": 1}').details["reason"]
+    too_long = '{"status": "ok", "notes": "' + "x" * 40 + '"}'
+    assert chain.run("step", too_long).details["pre_evaluation"] == "length"
+    assert chain.run("step", '{"status": "ok"}') is None
+
+
+def test_pre_evaluators_can_be_disabled(counting_evaluator):
+    evaluator = counting_evaluator()
+    evaluator.pre_evaluators = None
+    evaluator.evaluate("task", "step", "", "", None)
+    assert evaluator.calls == 1
+
+
+def test_pre_evaluators_run_when_the_llm_evaluation_is_skipped(scripted_model, counting_evaluator):
+    evaluator = counting_evaluator()
+    policy = EvaluationPolicy()
+    policy.pin("default", EvaluationPolicy.NEVER)
+    model = scripted_model(lambda prompt: TOOL_ARGUMENTS_ERROR)
+
+    planner = GenericPlanner(model.name)
+    step = Step(name="fetch", description="fetch the event", category="default")
+    _, passed = planner._execute_step(
+        1, step, "task", "", "", True, {"default": evaluator}, None, policy
+    )
+    assert not passed
+
+    node = Node(id="A", task_description="fetch the event", task_category="default")
+    graph_planner = GraphPlanner(model.name)
+    execution_result, details = graph_planner._evaluate_node(
+        node, "task", TOOL_ARGUMENTS_ERROR, True, {"default": evaluator}, "", None, policy
+    )
+    assert execution_result.evaluation_score == 0
+    assert details["pre_evaluation"] == "error_sentinel"
+
+    # Passing outputs are still accepted without the LLM evaluator
+    execution_result, _ = graph_planner._evaluate_node(
+        node, "task", "event 10000 failed", True, {"default": evaluator}, "", None, policy
+    )
+    assert execution_result.evaluation_score == 1.0
+    assert evaluator.calls == 0
@@ -0,0 +1,41 @@
+# tests/validators/test_score_parser.py
+
+import json
+import os
+
+from agent_core.evaluators.score_parser import parse_scores
+
+CORPUS = os.path.join(
+    os.path.dirname(__file__), "..", "..", "benchmarks", "data", "evaluator_outputs.jsonl"
+)
+
+
+def test_corpus_scores():
+    with open(CORPUS, encoding="utf-8") as f:
+        corpus = [json.loads(line) for line in f if line.strip()]
+    for record in corpus:
+        parsed = parse_scores(record["evaluation"])
+        assert parsed.source == "text"
+        assert parsed.total == record["total_score"], record["source"]
+        assert len(parsed.scores) == record["criteria"], record["source"]
+
+
+def test_json_fast_path():
+    parsed = parse_scores('{"scores": {"Accuracy": 4, "Completeness": "5"}}')
+    assert parsed.source == "json"
+    assert parsed.scores == [("Accuracy", 4), ("Completeness", 5)]
+
+    fenced = '```json\n{"scores": [{"criterion": "Accuracy", "score": 3}]}\n```'
+    assert parse_scores(fenced).scores == [("Accuracy", 3)]
+
+
+def test_no_scores_found():
+    parsed = parse_scores("The output looks fine to me.\nTotal: great")
+    assert not parsed.found
+    assert parsed.source == "none"
+    assert parsed.total == 0
+
+
+def test_criterion_names_do_not_span_lines():
+    parsed = parse_scores("1. **Accuracy\nCompleteness (Score 1-5):** 4")
+    assert not parsed.found